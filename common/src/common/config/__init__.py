@@ -11,6 +11,7 @@ from common.config.network import NetworkSettings, CORSSettings
 from common.config.admin import AdminSettings
 from common.config.auth import RemoteAuthSettings, LocalAuthSettings
 from common.config.file import FileSettings
+from common.config.http import HTTPClientSettings
 
 SettingsT = TypeVar("SettingsT", bound=BaseSettings)
 
@@ -32,5 +33,6 @@ __all__ = [
     "RemoteAuthSettings",
     "LocalAuthSettings",
     "FileSettings",
+    "HTTPClientSettings",
     "CORSSettings",
 ]
@@ -0,0 +1,13 @@
+from pydantic_settings import BaseSettings
+from pydantic import Field
+
+
+class HTTPClientSettings(BaseSettings):
+    http_pool_limit: int = Field(validation_alias="HTTP_POOL_LIMIT", default=100)
+    http_pool_limit_per_host: int = Field(
+        validation_alias="HTTP_POOL_LIMIT_PER_HOST", default=20
+    )
+    http_keepalive_timeout: float = Field(
+        validation_alias="HTTP_KEEPALIVE_TIMEOUT", default=30
+    )
+    http_dns_cache_ttl: int = Field(validation_alias="HTTP_DNS_CACHE_TTL", default=300)
@@ -0,0 +1,15 @@
+from dependency_injector import containers, providers
+
+from common.containers.base import BaseContainer
+from common.http.session import init_client_session
+
+
+@containers.copy(BaseContainer)
+class HTTPClientContainer(BaseContainer):
+    client_session = providers.Resource(
+        init_client_session,
+        limit=BaseContainer.config.http_pool_limit,
+        limit_per_host=BaseContainer.config.http_pool_limit_per_host,
+        keepalive_timeout=BaseContainer.config.http_keepalive_timeout,
+        dns_cache_ttl=BaseContainer.config.http_dns_cache_ttl,
+    )
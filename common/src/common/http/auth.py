@@ -1,3 +1,4 @@
+import asyncio
 import aiohttp
 
 from common.contracts.clients import BaseClient
@@ -11,6 +12,7 @@ class AuthHTTPClient(BaseClient):
     def __init__(
         self,
         auth_service: AuthService,
+        session: aiohttp.ClientSession,
         *,
         auth_url: str,
         client_id: str,
@@ -25,31 +27,35 @@ class AuthHTTPClient(BaseClient):
         self._client_secret = client_secret
         self._auth_service = auth_service
         self._with_ssl = with_ssl
+        self._session = session
+        self._lock = asyncio.Lock()
 
     async def get_authorization_header(self) -> str:
         if self._payload is None or expired(self._payload):
-            await self._update_token()
+            # Concurrent requests wait for one token refresh.
+            async with self._lock:
+                if self._payload is None or expired(self._payload):
+                    await self._update_token()
 
         return f"{self._token_type} {self._token}"
 
     @retry()
     async def _update_token(self):
-        async with aiohttp.ClientSession() as session:
-            mp = aiohttp.FormData()
-            mp.add_field("username", self._client_id)
-            mp.add_field("password", self._client_secret)
+        mp = aiohttp.FormData()
+        mp.add_field("username", self._client_id)
+        mp.add_field("password", self._client_secret)
 
-            async with session.post(
-                f"{self._auth_url}/api/auth/token/",
-                data=mp,
-                ssl=self._with_ssl,
-            ) as resp:
-                if resp.status != 200:
-                    raise ValueError("Token requested with error.")
-                body: dict = await resp.json()
-                self._token = body.get("access_token")
-                self._token_type: str = body.get("token_type")
-                self._token_type = self._token_type.capitalize()
-                self._payload = await self._auth_service.introspect(self._token)
-                if self._payload is None:
-                    raise ValueError("Token created with error.")
+        async with self._session.post(
+            f"{self._auth_url}/api/auth/token/",
+            data=mp,
+            ssl=self._with_ssl,
+        ) as resp:
+            if resp.status != 200:
+                raise ValueError("Token requested with error.")
+            body: dict = await resp.json()
+            self._token = body.get("access_token")
+            self._token_type: str = body.get("token_type")
+            self._token_type = self._token_type.capitalize()
+            self._payload = await self._auth_service.introspect(self._token)
+            if self._payload is None:
+                raise ValueError("Token created with error.")
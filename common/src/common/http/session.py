@@ -0,0 +1,32 @@
+from typing import AsyncIterator
+import aiohttp
+
+
+async def init_client_session(
+    *,
+    limit: int = 100,
+    limit_per_host: int = 20,
+    keepalive_timeout: float = 30,
+    dns_cache_ttl: int = 300,
+) -> AsyncIterator[aiohttp.ClientSession]:
+    """Creates client session which keeps connections alive between requests.
+
+    Used as `providers.Resource`, session is closed on resources shutdown.
+    Args:
+        limit: max count of simultaneous connections.
+        limit_per_host: max count of simultaneous connections to one host.
+        keepalive_timeout: seconds while idle connection is kept.
+        dns_cache_ttl: seconds while resolved host address is cached.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        keepalive_timeout=keepalive_timeout,
+        use_dns_cache=True,
+        ttl_dns_cache=dns_cache_ttl,
+    )
+    session = aiohttp.ClientSession(connector=connector)
+    try:
+        yield session
+    finally:
+        await session.close()
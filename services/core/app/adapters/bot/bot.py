@@ -9,15 +9,31 @@ from fastapi import Header
 from app.infra.config import settings
 from app.infra.logging import logger
 
+from app.adapters.bot.middlewares import reply_keyboard_tracker
+from app.adapters.bot.storage import create_storage
+from app.adapters.bot.update_queue import UpdateQueue
+
 
 @lru_cache
 def get_dispatcher() -> Dispatcher:
-    return Dispatcher()
+    return Dispatcher(storage=create_storage())
 
 
 @lru_cache
 def get_bot() -> Bot:
-    return Bot(token=settings.bot_token, parse_mode=ParseMode.HTML)
+    bot = Bot(token=settings.bot_token, parse_mode=ParseMode.HTML)
+    bot.session.middleware(reply_keyboard_tracker)
+    return bot
+
+
+@lru_cache
+def get_update_queue() -> UpdateQueue:
+    return UpdateQueue(
+        dispatcher=get_dispatcher(),
+        bot=get_bot(),
+        workers=settings.bot_update_workers,
+        maxsize=settings.bot_update_queue_size,
+    )
 
 
 async def _bot_webhook(
@@ -29,9 +45,12 @@ async def _bot_webhook(
         logger.error("Wrong secret token !")
         return {"status": "error", "message": "Wrong secret token !"}
     try:
-        answer = await get_dispatcher().feed_update(
-            bot=get_bot(), update=Update(**update)
-        )
+        update = Update(**update)
+        # Update is answered immediately and processed by update queue.
+        if settings.bot_update_queue:
+            await get_update_queue().put(update)
+            return
+        answer = await get_dispatcher().feed_update(bot=get_bot(), update=update)
         return answer
     except Exception as e:
         logger.error(f"Bot hook error: {e}")
@@ -4,18 +4,29 @@ from aiogram import Dispatcher
 from aiogram.loggers import dispatcher, event, middlewares, scene, webhook
 from aiogram.types import BotCommand
 from datetime import datetime
+import asyncio
 
 from app.infra.config import settings
 from app.infra.logging import logger
 
-from app.adapters.bot.bot import get_bot, get_dispatcher, _bot_webhook, _check_webhook
+from app.adapters.bot.bot import (
+    get_bot,
+    get_dispatcher,
+    get_update_queue,
+    _bot_webhook,
+    _check_webhook,
+)
 
+from app.adapters.bot.notifier import get_notifier
+from app.adapters.bot.middlewares import SessionScopeMiddleware, WorkerMiddleware
 from app.adapters.bot.router import router
 from app.adapters.bot.tasks import (
     TaskScheduler,
     notify_with_unclosed_shift,
     notify_and_dropped_departments_teller_cash,
     update_repairman_worktimes,
+    remove_expired_fsm_states,
+    move_worktime_photos,
 )
 
 
@@ -64,13 +75,22 @@ async def lifespan(_: FastAPI) -> AsyncGenerator:
         name="update_repairman_worktimes",
     )
     await tasks.run_tasks()
+    # Run apart from scheduled tasks, repeat daily since startup.
+    worktime_photos_task = asyncio.create_task(move_worktime_photos())
+    fsm_states_task = asyncio.create_task(remove_expired_fsm_states())
 
     yield
     await get_bot().delete_webhook(drop_pending_updates=True)
+    await get_update_queue().stop()
     await tasks.stop_tasks()
+    worktime_photos_task.cancel()
+    fsm_states_task.cancel()
+    await get_notifier().stop()
     yield
 
 
 def _configure_dispatcher(dp: Dispatcher):
     """Configures telegram dispatcher"""
+    dp.update.outer_middleware(SessionScopeMiddleware())
+    dp.update.outer_middleware(WorkerMiddleware())
     dp.include_router(router)
@@ -1,5 +1,5 @@
 from aiogram import F, Router
-from aiogram.types import CallbackQuery, BufferedInputFile, InputMediaDocument, Message
+from aiogram.types import CallbackQuery, Message
 from aiogram.utils.markdown import hbold
 from aiogram.fsm.context import FSMContext
 import asyncio
@@ -24,9 +24,9 @@ from app.adapters.bot import text
 from app.infra.database.models import Bid
 from app.schemas import ApprovalStatus, BidSchema
 from app.services import (
-    get_pending_bids_by_column,
-    get_pending_bids_for_teller_cash,
-    get_pending_bids_for_cc_fac,
+    get_pending_bids_by_column_async,
+    get_pending_bids_for_teller_cash_async,
+    get_pending_bids_for_cc_fac_async,
     get_history_bids_by_column,
     get_history_bids_for_teller_cash,
     get_history_bids_for_cc_fac,
@@ -44,8 +44,10 @@ from app.adapters.bot.handlers.bids.schemas import (
     ActionType,
 )
 from app.adapters.bot.states import BidCoordination, Base
+from app.adapters.bot.storage import register_fsm_callable
 from app.adapters.bot.handlers.bids.utils import get_full_bid_info, get_bid_list_info
 from app.adapters.bot.handlers.utils import (
+    answer_documents,
     try_delete_message,
     try_edit_message,
     try_edit_or_answer,
@@ -125,6 +127,10 @@ class CoordinationFactory:
             )
         router.callback_query.register(self.search_bid, F.data == f"{name}_search")
 
+        # Stored in FSM data to return from forms.
+        for func in (self.get_menu, self.get_pendings, self.get_bid, self.search_bid):
+            register_fsm_callable(f"bid_coordination_{name}_{func.__name__}", func)
+
     async def get_menu(self, message: CallbackQuery | Message, state: FSMContext):
         if isinstance(message, CallbackQuery):
             message = message.message
@@ -147,13 +153,12 @@ class CoordinationFactory:
     async def decline_bid(
         self, callback: CallbackQuery, callback_data: BidActionData, state: FSMContext
     ):
-        bid = get_bid_by_id(callback_data.bid_id)
         await try_edit_message(callback.message, hbold("Введите причину отказа:"))
         await state.set_state(BidCoordination.comment)
         await state.update_data(
             generator=self.get_pendings,
             callback=callback,
-            bid=bid,
+            bid_id=callback_data.bid_id,
             column_name=self.state_column.name,
         )
 
@@ -200,8 +205,9 @@ class CoordinationFactory:
         bid = get_bid_by_id(callback_data.bid_id)
         await state.update_data(
             generator=self.get_pendings,
+            get_bid=self.get_bid,
             callback=callback,
-            bid=bid,
+            bid_id=bid.id,
             column_name=self.state_column.name,
         )
         await state.set_state(BidCoordination.department)
@@ -227,11 +233,10 @@ class CoordinationFactory:
         callback_data: BidCallbackData,
         state: FSMContext,
     ):
-        bid = get_bid_by_id(callback_data.bid_id)
         await state.update_data(
             generator=self.get_pendings,
             callback=callback,
-            bid=bid,
+            bid_id=callback_data.bid_id,
             column_name=self.state_column.name,
         )
         await try_delete_message(callback.message)
@@ -247,19 +252,9 @@ class CoordinationFactory:
         self, callback: CallbackQuery, callback_data: BidCallbackData, state: FSMContext
     ):
         bid = get_bid_by_id(callback_data.id)
-        media: list[InputMediaDocument] = []
-
-        for document in bid.documents:
-            media.append(
-                InputMediaDocument(
-                    media=BufferedInputFile(
-                        file=document.document.file.read(),
-                        filename=document.document.filename,
-                    ),
-                )
-            )
+        documents = [document.document for document in bid.documents]
         await try_delete_message(callback.message)
-        msgs = await callback.message.answer_media_group(media=media)
+        msgs = await answer_documents(callback.message, documents)
         await state.update_data(msgs_for_delete=msgs)
         await msgs[0].reply(
             text=hbold("Выберите действие:"),
@@ -342,17 +337,17 @@ class CoordinationFactory:
             reply_markup=create_inline_keyboard(*buttons),
         )
 
-    def get_specified_bids_keyboard(
+    async def get_specified_bids_keyboard(
         self, type: str, tg_id: int
     ) -> InlineKeyboardMarkup:
         bids = []
         if type == "pending":
             if self.state_column == Bid.teller_cash_state:
-                bids = get_pending_bids_for_teller_cash(tg_id)
+                bids = await get_pending_bids_for_teller_cash_async(tg_id)
             elif self.state_column == Bid.fac_state:
-                bids = get_pending_bids_for_cc_fac(tg_id)
+                bids = await get_pending_bids_for_cc_fac_async(tg_id)
             else:
-                bids = get_pending_bids_by_column(self.state_column)
+                bids = await get_pending_bids_by_column_async(self.state_column)
         else:
             if self.state_column == Bid.teller_cash_state:
                 bids = get_history_bids_for_teller_cash(tg_id, 10)
@@ -379,13 +374,17 @@ class CoordinationFactory:
         )
 
     async def get_pendings(self, callback: CallbackQuery):
-        keyboard = self.get_specified_bids_keyboard("pending", callback.message.chat.id)
+        keyboard = await self.get_specified_bids_keyboard(
+            "pending", callback.message.chat.id
+        )
         await try_delete_message(callback.message)
 
         await callback.message.answer("Ожидающие согласования:", reply_markup=keyboard)
 
     async def get_history(self, callback: CallbackQuery):
-        keyboard = self.get_specified_bids_keyboard("history", callback.message.chat.id)
+        keyboard = await self.get_specified_bids_keyboard(
+            "history", callback.message.chat.id
+        )
         await try_delete_message(callback.message)
 
         await callback.message.answer("История согласования:", reply_markup=keyboard)
@@ -398,7 +397,7 @@ class CoordinationFactory:
             get_bid=self.get_bid,
             get_menu=self.get_menu,
             search_bid=self.search_bid,
-            state_column=self.state_column,
+            column_name=self.state_column.name,
             message=message,
         )
 
@@ -420,14 +419,14 @@ async def set_comment_after_decline(message: Message, state: FSMContext):
         raise KeyError("Pending generator not exist")
     if "callback" not in data:
         raise KeyError("Callback not exist")
-    if "bid" not in data:
-        raise KeyError("Bid not exist")
+    if "bid_id" not in data:
+        raise KeyError("Bid id not exist")
     if "column_name" not in data:
         raise KeyError("Column name not exist")
 
     generator: Callable = data["generator"]
     callback: CallbackQuery = data["callback"]
-    bid: BidSchema = data["bid"]
+    bid: BidSchema = get_bid_by_id(data["bid_id"])
     column_name = data["column_name"]
     bid.denying_reason = message.text
     worker = utils.get_worker_my_message(callback)
@@ -475,33 +474,29 @@ async def set_department(message: Message, state: FSMContext):
         raise KeyError("Pending generator not exist")
     if "callback" not in data:
         raise KeyError("Callback not exist")
-    if "bid" not in data:
-        raise KeyError("Bid not exist")
+    if "bid_id" not in data:
+        raise KeyError("Bid id not exist")
     if "column_name" not in data:
         raise KeyError("Column name not exist")
 
     generator: Callable = data["generator"]
     callback: CallbackQuery = data["callback"]
-    bid: BidSchema = data["bid"]
+    bid: BidSchema = get_bid_by_id(data["bid_id"])
     column_name = data["column_name"]
 
     await state.set_state(Base.none)
     if message.text == text.back:
         await try_delete_message(message)
-        await CoordinationFactory(
-            router=router,
-            coordinator_menu_button=accountant_cash_menu_button,
-            state_column=Bid.accountant_cash_state,
-            name="accountant_cash",
-        ).get_bid(
-            callback=callback,
-            callback_data=BidCallbackData(
+        get_bid: Callable = data["get_bid"]
+        await get_bid(
+            callback,
+            BidCallbackData(
                 id=bid.id,
                 mode=BidViewMode.full_with_approve,
                 type=BidViewType.coordination,
                 endpoint_name="accountant_cash",
             ),
-            state=state,
+            state,
         )
     elif message.text in get_departments_names():
         update_bid(bid, paying_department_name=message.text)
@@ -527,7 +522,7 @@ async def set_department(message: Message, state: FSMContext):
         await state.update_data(
             generator=generator,
             callback=callback,
-            bid=bid,
+            bid_id=bid.id,
             column_name=column_name,
         )
         await state.set_state(BidCoordination.department)
@@ -557,8 +552,8 @@ async def set_paying_comment(message: Message, state: FSMContext):
         raise KeyError("Pending generator not exist")
     if "callback" not in data:
         raise KeyError("Callback not exist")
-    if "bid" not in data:
-        raise KeyError("Bid not exist")
+    if "bid_id" not in data:
+        raise KeyError("Bid id not exist")
     if "column_name" not in data:
         raise KeyError("Column name not exist")
 
@@ -566,7 +561,7 @@ async def set_paying_comment(message: Message, state: FSMContext):
 
     generator: Callable = data["generator"]
     callback: CallbackQuery = data["callback"]
-    bid: BidSchema = data["bid"]
+    bid: BidSchema = get_bid_by_id(data["bid_id"])
     column_name = data["column_name"]
 
     if message.text == text.back:
@@ -600,7 +595,7 @@ async def set_bid(message: Message, state: FSMContext):
     else:
         try:
             msg_text = int(message.text)
-            state_column = data["state_column"].name
+            state_column = data["column_name"]
             bid_with_access = find_bid_for_worker(msg_text, message.chat.id)
             if bid_with_access is None:
                 msg = await message.answer(text=hbold("Заявка не найдена!"))
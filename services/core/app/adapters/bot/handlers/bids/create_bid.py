@@ -2,15 +2,12 @@ from aiogram import F, Router
 from aiogram.types import (
     CallbackQuery,
     Message,
-    BufferedInputFile,
     ReplyKeyboardRemove,
-    InputMediaDocument,
 )
 from aiogram.fsm.context import FSMContext
 from aiogram.utils.markdown import hbold
 import asyncio
 
-from fastapi import UploadFile
 
 # bot imports
 from app.adapters.bot.kb import (
@@ -42,10 +39,11 @@ from app.adapters.bot.handlers.bids.utils import (
     get_bid_list_info,
 )
 from app.adapters.bot.handlers.utils import (
+    answer_documents,
     try_delete_message,
     try_edit_or_answer,
     try_edit_message,
-    download_file,
+    download_files,
     handle_documents_form,
     handle_documents,
 )
@@ -56,7 +54,7 @@ from app.services import (
     create_bid,
     get_bids_by_worker_telegram_id,
     get_bid_by_id,
-    get_pending_bids_by_worker_telegram_id,
+    get_pending_bids_by_worker_telegram_id_async,
     get_chapters,
     get_expenditures_names_by_chapter,
     find_bid_for_worker,
@@ -106,10 +104,7 @@ async def send_bid(callback: CallbackQuery, state: FSMContext):
     need_edm = data.get("need_edm")
     activity_type = data.get("activity_type")
 
-    document_files: list[UploadFile] = []
-
-    for doc in documents:
-        document_files.append(await download_file(doc))
+    document_files = await download_files(documents)
 
     fac_state = ApprovalStatus.pending_approval
     cc_state = ApprovalStatus.pending
@@ -383,20 +378,10 @@ async def get_documents(
     callback: CallbackQuery, callback_data: BidCallbackData, state: FSMContext
 ):
     bid = get_bid_by_id(callback_data.id)
-    media: list[InputMediaDocument] = []
-
-    for document in bid.documents:
-        media.append(
-            InputMediaDocument(
-                media=BufferedInputFile(
-                    file=document.document.file.read(),
-                    filename=document.document.filename,
-                ),
-            )
-        )
+    documents = [document.document for document in bid.documents]
 
     await try_delete_message(callback.message)
-    msgs = await callback.message.answer_media_group(media=media)
+    msgs = await answer_documents(callback.message, documents)
     await state.update_data(msgs_for_delete=msgs)
     await msgs[0].reply(
         text=hbold("Выберите действие:"),
@@ -495,7 +480,7 @@ async def get_bid_state(callback: CallbackQuery, callback_data: BidCallbackData)
 
 @router.callback_query(F.data == "get_create_pending_bid")
 async def get_bids_pending(callback: CallbackQuery):
-    bids = get_pending_bids_by_worker_telegram_id(callback.message.chat.id)
+    bids = await get_pending_bids_by_worker_telegram_id_async(callback.message.chat.id)
     bids = sorted(bids, key=lambda bid: bid.create_date)[:10]
     keyboard = create_inline_keyboard(
         *(
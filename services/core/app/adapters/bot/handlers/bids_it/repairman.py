@@ -4,15 +4,12 @@ from aiogram.types import (
     CallbackQuery,
     Message,
     InlineKeyboardButton,
-    BufferedInputFile,
-    InputMediaDocument,
     ReplyKeyboardRemove,
     InlineKeyboardMarkup,
 )
 from aiogram.fsm.context import FSMContext
 from aiogram.utils.markdown import hbold
 
-from fastapi import UploadFile
 
 from app.adapters.bot.text import (
     format_err,
@@ -34,10 +31,11 @@ from app.adapters.bot.handlers.bids_it.kb import (
 from app.adapters.bot.states import RepairmanBidForm, Base
 
 from app.adapters.bot.handlers.utils import (
+    answer_documents,
     try_edit_or_answer,
     try_delete_message,
     try_edit_message,
-    download_file,
+    download_files,
     handle_documents_form,
     handle_documents,
     notify_worker_by_telegram_id,
@@ -48,8 +46,8 @@ from app.adapters.bot.handlers.bids_it.utils import (
     create_buttons_for_repairman,
     get_bid_it_list_info,
     get_bid_it_info,
-    filter_media_by_reopen,
-    filter_media_by_done,
+    filter_documents_by_reopen,
+    filter_documents_by_done,
 )
 from app.adapters.bot.handlers.bids_it.schemas import (
     BidITViewMode,
@@ -287,10 +285,7 @@ async def send_bid_it_rm(
         photos = data.get("photo_rework")
     bid_id = data.get("bid_id")
 
-    document_files: list[UploadFile] = []
-
-    for doc in photos:
-        document_files.append(await download_file(doc))
+    document_files = await download_files(photos)
 
     update_bid_it_rm(
         bid_id=bid_id,
@@ -454,19 +449,9 @@ async def get_documents_problem_rm(
     callback: CallbackQuery, callback_data: BidITCallbackData, state: FSMContext
 ):
     bid = get_bid_it_by_id(callback_data.id)
-    media: list[InputMediaDocument] = []
-
-    for document in bid.problem_photos:
-        media.append(
-            InputMediaDocument(
-                media=BufferedInputFile(
-                    file=document.document.file.read(),
-                    filename=document.document.filename,
-                ),
-            )
-        )
+    documents = [document.document for document in bid.problem_photos]
     await try_delete_message(callback.message)
-    msgs = await callback.message.answer_media_group(media=media)
+    msgs = await answer_documents(callback.message, documents)
     await state.update_data(msgs_for_delete=msgs)
     await msgs[0].reply(
         text=hbold("Выберите действие:"),
@@ -490,22 +475,12 @@ async def get_documents_done_rm(
     callback: CallbackQuery, callback_data: BidITCallbackData, state: FSMContext
 ):
     bid = get_bid_it_by_id(callback_data.id)
-    media: list[InputMediaDocument] = []
-
-    for document in bid.work_photos:
-        media.append(
-            InputMediaDocument(
-                media=BufferedInputFile(
-                    file=document.document.file.read(),
-                    filename=document.document.filename,
-                ),
-            )
-        )
+    documents = [document.document for document in bid.work_photos]
 
-    filter_media_by_done(media)
+    filter_documents_by_done(documents)
 
     await try_delete_message(callback.message)
-    msgs = await callback.message.answer_media_group(media=media)
+    msgs = await answer_documents(callback.message, documents)
     await state.update_data(msgs_for_delete=msgs)
     await msgs[0].reply(
         text=hbold("Выберите действие:"),
@@ -529,22 +504,12 @@ async def get_documents_done_reopen_rm(
     callback: CallbackQuery, callback_data: BidITCallbackData, state: FSMContext
 ):
     bid = get_bid_it_by_id(callback_data.id)
-    media: list[InputMediaDocument] = []
-
-    for document in bid.work_photos:
-        media.append(
-            InputMediaDocument(
-                media=BufferedInputFile(
-                    file=document.document.file.read(),
-                    filename=document.document.filename,
-                ),
-            )
-        )
+    documents = [document.document for document in bid.work_photos]
 
-    filter_media_by_reopen(media)
+    filter_documents_by_reopen(documents)
 
     await try_delete_message(callback.message)
-    msgs = await callback.message.answer_media_group(media=media)
+    msgs = await answer_documents(callback.message, documents)
     await state.update_data(msgs_for_delete=msgs)
     await msgs[0].reply(
         text=hbold("Выберите действие:"),
@@ -5,8 +5,6 @@ from aiogram.types import (
     CallbackQuery,
     Message,
     InlineKeyboardButton,
-    InputMediaDocument,
-    BufferedInputFile,
     ReplyKeyboardRemove,
     InlineKeyboardMarkup,
 )
@@ -35,6 +33,7 @@ from app.adapters.bot.handlers.bids_it.kb import (
 from app.adapters.bot.states import TMForm, Base
 
 from app.adapters.bot.handlers.utils import (
+    answer_documents,
     notify_worker_by_telegram_id,
     try_edit_or_answer,
     try_delete_message,
@@ -44,7 +43,7 @@ from app.adapters.bot.handlers.bids_it.utils import (
     get_bid_it_list_info,
     get_bid_it_info,
     clear_state_with_success_it_tm,
-    filter_media_by_reopen,
+    filter_documents_by_reopen,
     create_buttons_for_territorial_manager,
 )
 from app.adapters.bot.handlers.bids_it.schemas import (
@@ -373,20 +372,10 @@ async def get_documents_problem_tm(
     callback: CallbackQuery, callback_data: BidITCallbackData, state: FSMContext
 ):
     bid = get_bid_it_by_id(callback_data.id)
-    media: list[InputMediaDocument] = []
-
-    for document in bid.problem_photos:
-        media.append(
-            InputMediaDocument(
-                media=BufferedInputFile(
-                    file=document.document.file.read(),
-                    filename=document.document.filename,
-                ),
-            )
-        )
+    documents = [document.document for document in bid.problem_photos]
 
     await try_delete_message(callback.message)
-    msgs = await callback.message.answer_media_group(media=media)
+    msgs = await answer_documents(callback.message, documents)
     await state.update_data(msgs_for_delete=msgs)
     await msgs[0].reply(
         text=hbold("Выберите действие:"),
@@ -410,21 +399,11 @@ async def get_documents_done_tm(
     callback: CallbackQuery, callback_data: BidITCallbackData, state: FSMContext
 ):
     bid = get_bid_it_by_id(callback_data.id)
-    media: list[InputMediaDocument] = []
-
-    for document in bid.work_photos:
-        media.append(
-            InputMediaDocument(
-                media=BufferedInputFile(
-                    file=document.document.file.read(),
-                    filename=document.document.filename,
-                ),
-            )
-        )
-    filter_media_by_reopen(media)
+    documents = [document.document for document in bid.work_photos]
+    filter_documents_by_reopen(documents)
 
     await try_delete_message(callback.message)
-    msgs = await callback.message.answer_media_group(media=media)
+    msgs = await answer_documents(callback.message, documents)
     await state.update_data(msgs_for_delete=msgs)
     await msgs[0].reply(
         text=hbold("Выберите действие:"),
@@ -448,22 +427,12 @@ async def get_documents_done_reopen_tm(
     callback: CallbackQuery, callback_data: BidITCallbackData, state: FSMContext
 ):
     bid = get_bid_it_by_id(callback_data.id)
-    media: list[InputMediaDocument] = []
-
-    for document in bid.work_photos:
-        media.append(
-            InputMediaDocument(
-                media=BufferedInputFile(
-                    file=document.document.file.read(),
-                    filename=document.document.filename,
-                ),
-            )
-        )
+    documents = [document.document for document in bid.work_photos]
 
-    filter_media_by_reopen(media)
+    filter_documents_by_reopen(documents)
 
     await try_delete_message(callback.message)
-    msgs = await callback.message.answer_media_group(media=media)
+    msgs = await answer_documents(callback.message, documents)
     await state.update_data(msgs_for_delete=msgs)
     await msgs[0].reply(
         text=hbold("Выберите действие:"),
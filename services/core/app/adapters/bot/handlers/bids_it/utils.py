@@ -3,10 +3,10 @@ import asyncio
 from aiogram.types import (
     ReplyKeyboardRemove,
     Message,
-    InputMediaDocument,
     InlineKeyboardButton,
 )
 from aiogram.fsm.context import FSMContext
+from fastapi import UploadFile
 from aiogram.utils.markdown import hbold
 from app.adapters.bot.handlers.bids_it.schemas import (
     BidITCallbackData,
@@ -206,20 +206,20 @@ async def clear_state_with_success_rm_rework(
         )
 
 
-def filter_media_by_reopen(media: list[InputMediaDocument]) -> None:
-    rm = [doc for doc in media if doc.media.filename.find("reopen") == -1]
-    if len(rm) == len(media):
+def filter_documents_by_reopen(documents: list[UploadFile]) -> None:
+    rm = [doc for doc in documents if doc.filename.find("reopen") == -1]
+    if len(rm) == len(documents):
         return
     for doc in rm:
-        media.remove(doc)
+        documents.remove(doc)
 
 
-def filter_media_by_done(media: list[InputMediaDocument]) -> None:
-    rm = [doc for doc in media if doc.media.filename.find("reopen") != -1]
-    if len(rm) == len(media):
+def filter_documents_by_done(documents: list[UploadFile]) -> None:
+    rm = [doc for doc in documents if doc.filename.find("reopen") != -1]
+    if len(rm) == len(documents):
         return
     for doc in rm:
-        media.remove(doc)
+        documents.remove(doc)
 
 
 def create_buttons_for_repairman(
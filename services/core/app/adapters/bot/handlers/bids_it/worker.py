@@ -1,12 +1,9 @@
-from fastapi import UploadFile
 from aiogram import F, Router
 from aiogram.types import (
     CallbackQuery,
     Message,
     ReplyKeyboardRemove,
     InlineKeyboardButton,
-    BufferedInputFile,
-    InputMediaDocument,
     InlineKeyboardMarkup,
 )
 from aiogram.fsm.context import FSMContext
@@ -36,17 +33,18 @@ from app.adapters.bot.text import (
 from app.adapters.bot.states import BidITCreating, Base
 
 from app.adapters.bot.handlers.bids_it.utils import (
-    filter_media_by_done,
-    filter_media_by_reopen,
+    filter_documents_by_done,
+    filter_documents_by_reopen,
     get_id_by_problem_type,
     get_bid_it_list_info,
     get_bid_it_info,
     create_buttons_for_worker,
 )
 from app.adapters.bot.handlers.utils import (
+    answer_documents,
     try_edit_message,
     try_delete_message,
-    download_file,
+    download_files,
     handle_documents,
     handle_documents_form,
     notify_worker_by_telegram_id,
@@ -117,10 +115,7 @@ async def send_bid_it(callback: CallbackQuery, state: FSMContext):
     comment = data.get("comment")
     telegram_id = data.get("telegram_id")
 
-    document_files: list[UploadFile] = []
-
-    for doc in photos:
-        document_files.append(await download_file(doc))
+    document_files = await download_files(photos)
 
     problem_id = get_id_by_problem_type(problem, get_problems_it_schema())
 
@@ -314,19 +309,9 @@ async def get_documents_problem(
     callback: CallbackQuery, callback_data: BidITCallbackData, state: FSMContext
 ):
     bid = get_bid_it_by_id(callback_data.id)
-    media: list[InputMediaDocument] = []
-
-    for document in bid.problem_photos:
-        media.append(
-            InputMediaDocument(
-                media=BufferedInputFile(
-                    file=document.document.file.read(),
-                    filename=document.document.filename,
-                ),
-            )
-        )
+    documents = [document.document for document in bid.problem_photos]
     await try_delete_message(callback.message)
-    msgs = await callback.message.answer_media_group(media=media)
+    msgs = await answer_documents(callback.message, documents)
     await state.update_data(msgs_for_delete=msgs)
     await msgs[0].reply(
         text=hbold("Выберите действие:"),
@@ -350,22 +335,12 @@ async def get_documents_done(
     callback: CallbackQuery, callback_data: BidITCallbackData, state: FSMContext
 ):
     bid = get_bid_it_by_id(callback_data.id)
-    media: list[InputMediaDocument] = []
-
-    for document in bid.work_photos:
-        media.append(
-            InputMediaDocument(
-                media=BufferedInputFile(
-                    file=document.document.file.read(),
-                    filename=document.document.filename,
-                ),
-            )
-        )
+    documents = [document.document for document in bid.work_photos]
 
-    filter_media_by_done(media)
+    filter_documents_by_done(documents)
 
     await try_delete_message(callback.message)
-    msgs = await callback.message.answer_media_group(media=media)
+    msgs = await answer_documents(callback.message, documents)
     await state.update_data(msgs_for_delete=msgs)
     await msgs[0].reply(
         text=hbold("Выберите действие:"),
@@ -389,22 +364,12 @@ async def get_documents_done_reopen(
     callback: CallbackQuery, callback_data: BidITCallbackData, state: FSMContext
 ):
     bid = get_bid_it_by_id(callback_data.id)
-    media: list[InputMediaDocument] = []
-
-    for document in bid.work_photos:
-        media.append(
-            InputMediaDocument(
-                media=BufferedInputFile(
-                    file=document.document.file.read(),
-                    filename=document.document.filename,
-                ),
-            )
-        )
+    documents = [document.document for document in bid.work_photos]
 
-    filter_media_by_reopen(media)
+    filter_documents_by_reopen(documents)
 
     await try_delete_message(callback.message)
-    msgs = await callback.message.answer_media_group(media=media)
+    msgs = await answer_documents(callback.message, documents)
     await state.update_data(msgs_for_delete=msgs)
     await msgs[0].reply(
         text=hbold("Выберите действие:"),
@@ -12,6 +12,7 @@ from aiogram.fsm.context import FSMContext
 from aiogram.utils.markdown import hbold
 
 from app.adapters.bot import text, kb
+from app.adapters.bot.storage import register_fsm_callable
 from app.adapters.bot.states import (
     Base,
     AppraiserRequestForm,
@@ -86,6 +87,12 @@ class CoordinationFactory:
             ),
         )
 
+        # Stored in FSM data as menu generators.
+        for generator in (self.show_department_menu, self.show_rate_form):
+            register_fsm_callable(
+                f"appraiser_{self.problem_type.name}_{generator.__name__}", generator
+            )
+
         router.callback_query.register(
             self.show_department_menu,
             F.data == self.department_menu_button.callback_data,
@@ -9,10 +9,10 @@ from aiogram.types import (
 from aiogram.fsm.context import FSMContext
 from aiogram.utils.markdown import hbold
 
-from fastapi import UploadFile
 
 from app.adapters.bot import text, kb
 from app.adapters.bot.kb import main_menu_button
+from app.adapters.bot.storage import register_fsm_callable
 from app.adapters.bot.states import (
     Base,
     ExecutorDepartmentRequestForm,
@@ -26,7 +26,7 @@ from app.adapters.bot.handlers.department_request import kb as department_kb
 from app.adapters.bot.handlers.utils import (
     try_edit_or_answer,
     try_delete_message,
-    download_file,
+    download_files,
     handle_documents_form,
     handle_documents,
 )
@@ -92,6 +92,16 @@ class CoordinationFactory:
             ),
         )
 
+        # Stored in FSM data as menu generators.
+        for generator in (
+            self.show_department_menu,
+            self.show_waiting_work,
+            self.show_repair_rework_form,
+        ):
+            register_fsm_callable(
+                f"executor_{self.name}_{generator.__name__}", generator
+            )
+
         router.callback_query.register(
             self.show_department_menu, F.data == executor_menu_button.callback_data
         )
@@ -521,9 +531,7 @@ class CoordinationFactory:
 
         data = await state.get_data()
         photo = data["photo"]
-        photo_files: list[UploadFile] = []
-        for doc in photo:
-            photo_files.append(await download_file(doc))
+        photo_files = await download_files(photo)
 
         match self.type:
             case RequestType.TR:
@@ -6,7 +6,6 @@ from aiogram.types import (
 )
 from aiogram.fsm.context import FSMContext
 from aiogram.utils.markdown import hbold
-from fastapi import UploadFile
 
 from app.adapters.bot import text, kb
 from app.adapters.bot.states import Base, ChiefTechnicianTechnicalRequestForm
@@ -17,7 +16,7 @@ from app.adapters.bot.handlers.department_request.schemas import (
 )
 from app.adapters.bot.handlers.department_request import kb as tech_kb
 from app.adapters.bot.handlers.utils import (
-    download_file,
+    download_files,
     handle_documents,
     handle_documents_form,
     try_delete_message,
@@ -351,9 +350,7 @@ async def save_repair(
     data = await state.get_data()
 
     photo = data["photo"]
-    photo_files: list[UploadFile] = []
-    for doc in photo:
-        photo_files.append(await download_file(doc))
+    photo_files = await download_files(photo)
 
     if not (
         await update_technical_request_from_repairman(
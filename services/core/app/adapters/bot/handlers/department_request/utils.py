@@ -2,11 +2,9 @@ from typing import Optional
 
 from aiogram.types import (
     CallbackQuery,
-    InputMediaDocument,
     InlineKeyboardMarkup,
     InlineKeyboardButton,
     Message,
-    BufferedInputFile,
 )
 from aiogram.fsm.context import FSMContext
 from aiogram.utils.markdown import hbold
@@ -20,6 +18,7 @@ from app.adapters.bot.kb import (
     main_menu_button,
 )
 from app.adapters.bot.handlers.utils import (
+    answer_documents,
     try_delete_message,
     try_edit_or_answer,
 )
@@ -450,29 +449,14 @@ async def send_many_docs(
 ) -> list[Message]:
     await try_delete_message(callback.message)
 
-    msgs: list[Message] = []
-    photos = [
-        photo
-        for photo in getattr(request, doc_type)
-        if ("_reopen_" in photo.document.filename) == reopen
-    ]
-    docs_len = len(photos)
-
-    for iteration in range(docs_len // 10 + (1 if docs_len % 10 != 0 else 0)):
-        media: list[InputMediaDocument] = []
-        for photo in photos[iteration * 10 : (iteration + 1) * 10]:
-            media.append(
-                InputMediaDocument(
-                    media=BufferedInputFile(
-                        file=await photo.document.read(),
-                        filename=photo.document.filename,
-                    )
-                )
-            )
-
-        msgs += await callback.message.answer_media_group(
-            media=media,
-        )
+    msgs = await answer_documents(
+        callback.message,
+        [
+            photo.document
+            for photo in getattr(request, doc_type)
+            if ("_reopen_" in photo.document.filename) == reopen
+        ],
+    )
     await state.update_data(msgs=msgs)
 
     await msgs[0].reply(
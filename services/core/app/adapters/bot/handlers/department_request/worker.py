@@ -9,7 +9,6 @@ from aiogram.types import (
 from aiogram.fsm.context import FSMContext
 from aiogram.utils.markdown import hbold
 
-from fastapi import UploadFile
 
 from app.adapters.bot import text, kb
 from app.adapters.bot.states import (
@@ -19,7 +18,7 @@ from app.adapters.bot.states import (
 from app.adapters.bot.handlers.utils import (
     try_edit_or_answer,
     try_delete_message,
-    download_file,
+    download_files,
     handle_documents_form,
     handle_documents,
     create_reply_keyboard,
@@ -433,9 +432,7 @@ async def save_worker_request(callback: CallbackQuery, state: FSMContext):
         logger.error("Problem group in department request is None")
     else:
         photo = data["photo"]
-        photo_files: list[UploadFile] = []
-        for doc in photo:
-            photo_files.append(await download_file(doc))
+        photo_files = await download_files(photo)
         message = callback.message
 
     if problem_group == "TR":
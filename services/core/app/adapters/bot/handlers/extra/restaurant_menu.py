@@ -1,4 +1,5 @@
 import pathlib
+import shutil
 from fastapi import UploadFile
 from aiogram import Router, F
 from aiogram.types import (
@@ -45,10 +46,8 @@ async def set_documents(message: Message, state: FSMContext):
         document: UploadFile = await download_file(documents[0])
 
         path = pathlib.Path(settings.storage_path) / "menu.pdf"
-        data = await document.read()
-
-        with open(path, "wb") as f:
-            f.write(data)
+        with document.file, open(path, "wb") as f:
+            shutil.copyfileobj(document.file, f)
 
         await state.clear()
         await send_menu_by_scopes(message)
@@ -14,6 +14,7 @@ from app.infra.config import settings
 
 from app.services import (
     get_worker_by_telegram_id,
+    get_worker_by_telegram_id_async,
     get_departments_names,
     set_department_for_worker,
     get_last_completed_worktimes_by_tg_id,
@@ -52,7 +53,9 @@ router = Router(name="personal_cabinet")
 async def get_personal_data(message: CallbackQuery | Message):
     message = message.message if isinstance(message, CallbackQuery) else message
 
-    worker: Optional[WorkerSchema] = get_worker_by_telegram_id(message.chat.id)
+    worker: Optional[WorkerSchema] = await get_worker_by_telegram_id_async(
+        message.chat.id
+    )
 
     buttons: list[list[InlineKeyboardButton]] = [
         [get_per_cab_logins_button],
@@ -68,7 +71,7 @@ async def get_personal_data(message: CallbackQuery | Message):
 
     buttons.append([main_menu_button])
 
-    text = utils.menu_text(worker)
+    text = await utils.menu_text(worker)
 
     await try_edit_or_answer(
         text=text,
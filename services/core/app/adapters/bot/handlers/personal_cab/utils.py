@@ -11,14 +11,14 @@ from app.services import (
     get_worker_by_telegram_id,
     get_material_values,
     get_logins,
-    get_opened_today_worktime,
+    get_opened_today_worktime_async,
     get_hours_sum_in_month,
 )
 from app.schemas import WorkerSchema
 from app.adapters.bot.handlers.personal_cab.schemas import ShowLoginCallbackData
 
 
-def menu_text(worker: WorkerSchema) -> str:
+async def menu_text(worker: WorkerSchema) -> str:
     department_chef: Optional[WorkerSchema] = get_worker_chief(
         telegram_id=worker.telegram_id
     )
@@ -40,7 +40,7 @@ def menu_text(worker: WorkerSchema) -> str:
         )
     else:
         text += "Не найден"
-    worktime = get_opened_today_worktime(worker.id)
+    worktime = await get_opened_today_worktime_async(worker.id)
     text += f"""\nДата приема на работу: {worker.employment_date if worker.employment_date is not None else "Не найдена"}
 
 Открытая смена: {worktime.work_begin.strftime(settings.time_format) if worktime is not None else "Отсутствует"}
@@ -1,5 +1,5 @@
-from typing import Any, Awaitable, Callable, Optional
-from functools import cache
+from typing import Any, Awaitable, Callable, Iterable, Optional
+from functools import cache, lru_cache
 from aiogram.types import (
     Message,
     InlineKeyboardMarkup,
@@ -9,16 +9,21 @@ from aiogram.types import (
     PhotoSize,
     File,
     CallbackQuery,
+    BufferedInputFile,
+    InputMediaDocument,
 )
-from aiogram.exceptions import TelegramAPIError
+from aiogram.exceptions import TelegramAPIError, TelegramBadRequest
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import StatesGroup
 from aiogram.utils.markdown import hbold
 from fastapi import UploadFile
+from app.infra.config import settings
 from app.infra.database.models import FujiScope
-from app.schemas import WorkerSchema
+from app.schemas import LazyUploadFile, WorkerSchema
 import app.services as services
 from app.adapters.bot.bot import get_bot
+from app.adapters.bot.middlewares import reply_keyboard_tracker
+from app.adapters.bot.notifier import get_notifier
 from app.adapters.bot.kb import (
     fac_cc_menu_button,
     create_bid_menu_button,
@@ -54,6 +59,8 @@ from app.adapters.bot.handlers.department_request.kb import (
     td_button,  # territorial director
 )
 import asyncio
+import os
+import tempfile
 
 
 @cache
@@ -92,6 +99,26 @@ def get_scope_menu_dict() -> dict[FujiScope, InlineKeyboardMarkup]:
     }
 
 
+def get_menu_by_scopes(scopes: Iterable[FujiScope]) -> InlineKeyboardMarkup:
+    """Returns main menu with buttons available for `scopes`.
+
+    Menu is built once for each set of scopes.
+    """
+    return _build_menu(frozenset(scopes))
+
+
+@lru_cache(maxsize=256)
+def _build_menu(scopes: frozenset[FujiScope]) -> InlineKeyboardMarkup:
+    is_admin = FujiScope.admin in scopes
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [button]
+            for scope, button in get_scope_menu_dict().items()
+            if is_admin or scope in scopes
+        ]
+    )
+
+
 async def send_menu_by_scopes(message: Message, edit=None):
     """
     Sends specific menu for user by his role.
@@ -99,20 +126,16 @@ async def send_menu_by_scopes(message: Message, edit=None):
     If `edit = True` - calling `Message.edit_text` instead `Message.answer`
     """
     scopes = []
-    worker = services.get_worker_by_telegram_id(message.chat.id)
+    worker = await services.get_worker_by_telegram_id_async(message.chat.id)
     if worker:
         scopes = worker.post.scopes
 
-    menus = []
+    menu = get_menu_by_scopes(scopes)
 
-    for scope, button in get_scope_menu_dict().items():
-        if scope in scopes or FujiScope.admin in scopes:
-            menus.append([button])
-
-    menu = InlineKeyboardMarkup(inline_keyboard=menus)
-
-    msg = await message.answer("Загрузка...", reply_markup=ReplyKeyboardRemove())
-    await try_delete_message(msg)
+    # Menu can't remove reply keyboard, it's removed by separate message.
+    if reply_keyboard_tracker.is_shown(message.chat.id, message.message_id):
+        msg = await message.answer("Загрузка...", reply_markup=ReplyKeyboardRemove())
+        await try_delete_message(msg)
 
     if edit:
         await try_edit_or_answer(
@@ -197,30 +220,46 @@ async def try_edit_or_answer(
     return True
 
 
+def notify_workers(
+    workers: list[WorkerSchema],
+    message: str,
+    reply_markup: InlineKeyboardMarkup | None = None,
+    with_menu: bool = True,
+) -> None:
+    """
+    Queues notify `message` with follow-up menu to `workers`.
+
+    Doesn't wait for sending, messages are sent by notifier.
+    :param with_menu: Send menu by worker scopes after `message`.
+    """
+    notifier = get_notifier()
+    telegram_ids: set[int] = set()
+    for worker in workers:
+        if worker.telegram_id is None or worker.telegram_id in telegram_ids:
+            continue
+        telegram_ids.add(worker.telegram_id)
+        notifier.submit(
+            chat_id=worker.telegram_id,
+            text=message,
+            reply_markup=reply_markup,
+            menu=get_menu_by_scopes(worker.post.scopes) if with_menu else None,
+        )
+
+
 async def notify_workers_by_scope(
     scope: FujiScope, message: str, reply_markup: InlineKeyboardMarkup | None = None
 ) -> None:
     """
     Sends notify `message` to workers by their `scope`.
     """
-    telegram_ids: set[int] = {
-        worker.telegram_id
-        for worker in (
+    notify_workers(
+        workers=[
             *services.get_workers_by_scope(scope),
             *services.get_workers_by_scope(FujiScope.admin),
-        )
-        if worker.telegram_id is not None
-    }
-
-    for id in telegram_ids:
-        msg = await notify_worker_by_telegram_id(
-            id=id,
-            message=message,
-            reply_markup=reply_markup,
-        )
-        if not msg:
-            continue
-        await send_menu_by_scopes(message=msg)
+        ],
+        message=message,
+        reply_markup=reply_markup,
+    )
 
 
 async def notify_workers_in_department_by_scope(
@@ -232,22 +271,14 @@ async def notify_workers_in_department_by_scope(
     """
     Sends notify `message` to workers in department by their `scope`.
     """
-    workers: list[WorkerSchema] = [
-        *services.get_workers_in_department_by_scope(scope, department_id),
-        *services.get_workers_by_scope(FujiScope.admin),
-    ]
-
-    for worker in workers:
-        if not worker.telegram_id:
-            continue
-        msg = await notify_worker_by_telegram_id(
-            id=worker.telegram_id,
-            message=message,
-            reply_markup=reply_markup,
-        )
-        if not msg:
-            continue
-        await send_menu_by_scopes(message=msg)
+    notify_workers(
+        workers=[
+            *services.get_workers_in_department_by_scope(scope, department_id),
+            *services.get_workers_by_scope(FujiScope.admin),
+        ],
+        message=message,
+        reply_markup=reply_markup,
+    )
 
 
 async def notify_worker_by_telegram_id(
@@ -259,7 +290,7 @@ async def notify_worker_by_telegram_id(
     Returns sended `Message`.
     """
     try:
-        await get_bot().send_message(
+        return await get_notifier().send(
             chat_id=id, text=message, reply_markup=reply_markup
         )
     except Exception:
@@ -318,15 +349,25 @@ async def handle_documents(
         message.content_type == ContentType.DOCUMENT
         or message.content_type == ContentType.PHOTO
     ):
+        file = (
+            message.photo[-1]
+            if message.content_type == ContentType.PHOTO
+            else message.document
+        )
+        error = _check_file_size(file)
+        if error is not None:
+            await try_delete_message(message)
+            msg = await message.answer(error)
+            await asyncio.sleep(1)
+            await try_delete_message(msg)
+            return
+
         data = await state.get_data()
         documents: list = data.get("documents")
         msgs: list = data.get("msgs")
         if not documents:
             documents = []
-        if message.content_type == ContentType.PHOTO:
-            documents.append(message.photo[-1])
-        else:
-            documents.append(message.document)
+        documents.append(file)
         if not msgs:
             msgs = []
 
@@ -359,11 +400,129 @@ async def handle_documents_form(
     await state.update_data(msg=msg)
 
 
+def _check_file_size(file: Document | PhotoSize) -> str | None:
+    """Returns error if `file` can't be downloaded by bot."""
+    if file.file_size is not None and file.file_size > settings.bot_max_file_size:
+        return (
+            "Файл слишком большой! Максимальный размер "
+            f"{settings.bot_max_file_size // (1024 * 1024)} МБ."
+        )
+    return None
+
+
 async def download_file(file: Document | PhotoSize) -> UploadFile:
-    """Download the file (photo or document)"""
+    """Download the file (photo or document).
+
+    File is streamed by chunks to temporary file in storage directory,
+    temporary file is removed when returned file is closed.
+    Raises:
+        ValueError: if file is larger than `settings.bot_max_file_size`.
+    """
+    error = _check_file_size(file)
+    if error is not None:
+        raise ValueError(error)
+
     raw_file: File = await get_bot().get_file(file.file_id)
-    byte_file = await get_bot().download_file(raw_file.file_path)
-    return UploadFile(file=byte_file, filename=raw_file.file_path.split("/")[-1])
+    fd, path = tempfile.mkstemp(dir=settings.storage_path, prefix=".download_")
+    os.close(fd)
+    try:
+        await get_bot().download_file(raw_file.file_path, destination=path, timeout=120)
+        # Opened file is readable after unlink and is removed on close.
+        stream = open(path, "rb")
+    finally:
+        os.unlink(path)
+
+    return UploadFile(
+        file=stream,
+        filename=raw_file.file_path.split("/")[-1],
+        size=raw_file.file_size,
+    )
+
+
+_download_semaphore: asyncio.Semaphore | None = None
+
+
+async def download_files(files: list[Document | PhotoSize]) -> list[UploadFile]:
+    """Downloads `files` concurrently, up to `settings.bot_download_concurrency`
+    files at once. Files are returned in order of `files`."""
+    global _download_semaphore
+    if _download_semaphore is None:
+        _download_semaphore = asyncio.Semaphore(settings.bot_download_concurrency)
+
+    async def download(file: Document | PhotoSize) -> UploadFile:
+        async with _download_semaphore:
+            return await download_file(file)
+
+    results = await asyncio.gather(
+        *(download(file) for file in files), return_exceptions=True
+    )
+    errors = [result for result in results if isinstance(result, BaseException)]
+    if errors:
+        for result in results:
+            if isinstance(result, UploadFile):
+                result.file.close()
+        raise errors[0]
+    return results
+
+
+async def _to_input_media(
+    document: UploadFile, file_ids: dict[str, str]
+) -> InputMediaDocument:
+    if isinstance(document, LazyUploadFile) and document.path in file_ids:
+        return InputMediaDocument(media=file_ids[document.path])
+    await document.seek(0)
+    return InputMediaDocument(
+        media=BufferedInputFile(file=await document.read(), filename=document.filename)
+    )
+
+
+async def answer_documents(
+    message: Message, documents: list[UploadFile]
+) -> list[Message]:
+    """Answers to `message` with `documents` by media groups of 10.
+
+    Stored documents are sent by telegram file id after first upload,
+    so they aren't read from storage and uploaded again.
+    """
+    paths = [
+        document.path for document in documents if isinstance(document, LazyUploadFile)
+    ]
+    file_ids = await services.get_telegram_file_ids(paths)
+    msgs: list[Message] = []
+
+    for i in range(0, len(documents), 10):
+        chunk = documents[i : i + 10]
+        media = [await _to_input_media(document, file_ids) for document in chunk]
+        try:
+            sent = await message.answer_media_group(media=media)
+        except TelegramBadRequest:
+            # Saved file id can be rejected, such documents are uploaded again.
+            rejected = [
+                document.path
+                for document in chunk
+                if isinstance(document, LazyUploadFile) and document.path in file_ids
+            ]
+            if len(rejected) == 0:
+                raise
+            await services.delete_telegram_file_ids(rejected)
+            for path in rejected:
+                file_ids.pop(path)
+            media = [await _to_input_media(document, file_ids) for document in chunk]
+            sent = await message.answer_media_group(media=media)
+
+        uploaded = {
+            document.path: msg.document.file_id
+            for document, msg in zip(chunk, sent)
+            if isinstance(document, LazyUploadFile)
+            and document.path not in file_ids
+            and document.size is not None
+            and msg.document is not None
+        }
+        await services.set_telegram_file_ids(uploaded)
+        file_ids.update(uploaded)
+        msgs += sent
+
+    return msgs
 
 
 def get_worker_my_message(message: Message | CallbackQuery) -> WorkerSchema | None:
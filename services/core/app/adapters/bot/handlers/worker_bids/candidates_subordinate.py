@@ -228,9 +228,9 @@ async def set_status(message: Message, state: FSMContext):
         status = [
             key for key, text in worker_status_dict.items() if message.text == text
         ][0]
-        update_worker_state(int(data.get("id")), state=status)
+        await update_worker_state(int(data.get("id")), state=status)
         if status == "В штате":
-            notify_accounting(int(data.get("id")))
+            await notify_accounting(int(data.get("id")))
 
         await show_worker(
             message,
@@ -15,10 +15,10 @@ from aiogram.types import (
     Message,
     InlineKeyboardButton,
     InputMediaDocument,
-    BufferedInputFile,
 )
 from aiogram.fsm.context import FSMContext
 from app.adapters.bot.handlers.utils import (
+    answer_documents,
     try_edit_or_answer,
     try_delete_message,
     send_menu_by_scopes,
@@ -27,6 +27,7 @@ from app.adapters.bot.states import (
     Base,
     WorkerBidCoordination,
 )
+from app.adapters.bot.storage import register_fsm_callable
 from app.adapters.bot.handlers.worker_bids.utils import (
     get_full_worker_bid_info,
     get_worker_pending_bids_btns,
@@ -114,6 +115,9 @@ class WorkerBidCoordinationFactory:
             WorkerBidCallbackData.filter(F.endpoint_name == f"seek_docs_{self.name}"),
         )
 
+        # Stored in FSM data to return from comment forms.
+        register_fsm_callable(f"worker_bid_coordination_{name}_get_menu", self.get_menu)
+
     async def get_menu(self, message: CallbackQuery | Message):
         if isinstance(message, CallbackQuery):
             message = message.message
@@ -279,27 +283,10 @@ class WorkerBidCoordinationFactory:
         state: FSMContext,
     ):
         bid = get_worker_bid_by_id(callback_data.id)
-        msgs: list[Message] = []
-        docs_len = len(getattr(bid, callback_data.doc_type))
-
-        for iteration in range(docs_len // 10 + (1 if docs_len % 10 != 0 else 0)):
-            media: list[InputMediaDocument] = []
-
-            for photo in getattr(bid, callback_data.doc_type)[
-                iteration * 10 : iteration * 10 + 9
-            ]:
-                media.append(
-                    InputMediaDocument(
-                        media=BufferedInputFile(
-                            file=await photo.document.read(),
-                            filename=photo.document.filename,
-                        )
-                    )
-                )
-
-            msgs += await callback.message.answer_media_group(
-                media=media,
-            )
+        msgs = await answer_documents(
+            callback.message,
+            [photo.document for photo in getattr(bid, callback_data.doc_type)],
+        )
 
         await try_delete_message(callback.message)
         await state.update_data(msgs=msgs)
@@ -360,7 +347,7 @@ class WorkerBidCoordinationFactory:
         callback_data: WorkerBidCallbackData,
         state: FSMContext,
     ):
-        from app.adapters.output.file.zip_file import ZipFileManager
+        from app.adapters.output.file.zip_file import ZipFileManager, ZipInputFile
 
         bid = get_worker_bid_by_id(callback_data.id)
         zip_manager = ZipFileManager(
@@ -370,8 +357,8 @@ class WorkerBidCoordinationFactory:
 
         media: list[InputMediaDocument] = [
             InputMediaDocument(
-                media=BufferedInputFile(
-                    file=zip_manager.create_zip(),
+                media=ZipInputFile(
+                    zip_manager,
                     filename=f"Документы_{bid.l_name}_{bid.f_name[0]}_{bid.o_name[0] or 'о'}.zip",
                 )
             )
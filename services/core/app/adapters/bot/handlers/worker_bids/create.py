@@ -3,15 +3,12 @@ from aiogram.types import (
     CallbackQuery,
     Message,
     InlineKeyboardButton,
-    BufferedInputFile,
-    InputMediaDocument,
 )
 from aiogram.utils.markdown import hbold
 from aiogram.fsm.context import FSMContext
 from asyncio import sleep
 from datetime import datetime, timedelta
 
-from fastapi import UploadFile
 import app.adapters.bot.kb as kb
 from app.adapters.bot.handlers import utils
 from app.adapters.bot.states import WorkerBidCreating, WorkerBidUpdate, Base
@@ -75,16 +72,9 @@ async def save_worker_bid(callback: CallbackQuery, state: FSMContext):
     if not work_permission:
         work_permission = []
 
-    worksheet_files: list[UploadFile] = []
-    passport_files: list[UploadFile] = []
-    work_permission_files: list[UploadFile] = []
-
-    for doc in worksheet:
-        worksheet_files.append(await utils.download_file(doc))
-    for doc in passport:
-        passport_files.append(await utils.download_file(doc))
-    for doc in work_permission:
-        work_permission_files.append(await utils.download_file(doc))
+    worksheet_files = await utils.download_files(worksheet)
+    passport_files = await utils.download_files(passport)
+    work_permission_files = await utils.download_files(work_permission)
 
     await services.create_worker_bid(
         f_name,
@@ -587,34 +577,12 @@ async def get_documents(
     callback: CallbackQuery, callback_data: WorkerBidCallbackData, state: FSMContext
 ):
     bid = services.get_worker_bid_by_id(callback_data.id)
-    media: list[InputMediaDocument] = []
-    for doc in bid.worksheet:
-        media.append(
-            InputMediaDocument(
-                media=BufferedInputFile(
-                    file=await doc.document.read(), filename=doc.document.filename
-                )
-            )
-        )
-    for doc in bid.passport:
-        media.append(
-            InputMediaDocument(
-                media=BufferedInputFile(
-                    file=await doc.document.read(), filename=doc.document.filename
-                )
-            )
-        )
-    for doc in bid.work_permission:
-        media.append(
-            InputMediaDocument(
-                media=BufferedInputFile(
-                    file=await doc.document.read(), filename=doc.document.filename
-                )
-            )
-        )
+    documents = [
+        doc.document for doc in [*bid.worksheet, *bid.passport, *bid.work_permission]
+    ]
 
     await utils.try_delete_message(callback.message)
-    msgs = await callback.message.answer_media_group(media=media)
+    msgs = await utils.answer_documents(callback.message, documents)
     await state.update_data(msgs=msgs)
     await msgs[0].reply(
         text=hbold("Выберите действие:"),
@@ -801,34 +769,12 @@ async def get_documents_pending(
     callback: CallbackQuery, callback_data: WorkerBidCallbackData, state: FSMContext
 ):
     bid = services.get_worker_bid_by_id(callback_data.id)
-    media: list[InputMediaDocument] = []
-    for doc in bid.worksheet:
-        media.append(
-            InputMediaDocument(
-                media=BufferedInputFile(
-                    file=await doc.document.read(), filename=doc.document.filename
-                )
-            )
-        )
-    for doc in bid.passport:
-        media.append(
-            InputMediaDocument(
-                media=BufferedInputFile(
-                    file=await doc.document.read(), filename=doc.document.filename
-                )
-            )
-        )
-    for doc in bid.work_permission:
-        media.append(
-            InputMediaDocument(
-                media=BufferedInputFile(
-                    file=await doc.document.read(), filename=doc.document.filename
-                )
-            )
-        )
+    documents = [
+        doc.document for doc in [*bid.worksheet, *bid.passport, *bid.work_permission]
+    ]
 
     await utils.try_delete_message(callback.message)
-    msgs = await callback.message.answer_media_group(media=media)
+    msgs = await utils.answer_documents(callback.message, documents)
     await state.update_data(msgs=msgs)
     await msgs[0].reply(
         text=hbold("Выберите действие:"),
@@ -854,10 +800,7 @@ async def save_update(
 ):
     data = await state.get_data()
 
-    docs: list[UploadFile] = []
-
-    for doc in data.get("docs"):
-        docs.append(await utils.download_file(doc))
+    docs = await utils.download_files(data.get("docs"))
     await services.update_worker_bid_documents(bid_id=callback_data.id, files=docs)
     await state.clear()
     await state.set_state(Base)
@@ -103,7 +103,7 @@ def get_worker_bid_list_info(bid: WorkerBidSchema) -> str:
 
 async def notify_accounting(worker_id: int):
     worker = get_worker_by_id(worker_id)
-    notify_workers_by_scope(
+    await notify_workers_by_scope(
         FujiScope.bot_worker_bid_accounting_coordinate,
         message=f"{worker.l_name} {worker.f_name} {worker.o_name} успешно прошёл стажировку",
     )
@@ -0,0 +1,118 @@
+from typing import Any, Awaitable, Callable
+from aiogram import BaseMiddleware, Bot
+from aiogram.client.session.middlewares.base import (
+    BaseRequestMiddleware,
+    NextRequestMiddlewareType,
+)
+from aiogram.methods import Response, TelegramMethod
+from aiogram.methods.base import TelegramType
+from aiogram.types import (
+    ReplyKeyboardMarkup,
+    ReplyKeyboardRemove,
+    TelegramObject,
+    User,
+)
+
+from app.infra.cache import TTLCache
+
+from app.infra.database import async_orm
+from app.infra.database.database import session_scope
+
+
+class SessionScopeMiddleware(BaseMiddleware):
+    """Shares one database session between all orm calls of update."""
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        async with session_scope():
+            return await handler(event, data)
+
+
+class WorkerMiddleware(BaseMiddleware):
+    """Resolves update sender once per update.
+
+    Sender is passed to handlers as `worker` argument (`None` if sender
+    isn't worker), later lookups by his telegram id hit `worker_cache`.
+    """
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: dict[str, Any],
+    ) -> Any:
+        user: User | None = data.get("event_from_user")
+        data["worker"] = (
+            await async_orm.find_worker_by_telegram_id(user.id) if user else None
+        )
+        return await handler(event, data)
+
+
+class ReplyKeyboardTracker(BaseRequestMiddleware):
+    """Remembers chats where bot has shown reply keyboard.
+
+    State is known only for messages sent by this process, so keyboard
+    is treated as shown unless the last message sent by this process
+    is the latest bot message in chat and it removed keyboard.
+    """
+
+    def __init__(self):
+        # Chat id to id of last sent message and whether keyboard is shown.
+        self._shown: TTLCache[int, tuple[int, bool]] = TTLCache(
+            ttl=24 * 60 * 60, maxsize=100000
+        )
+
+    @staticmethod
+    def _get_message_id(result: Any) -> int | None:
+        if isinstance(result, list):
+            result = result[-1] if result else None
+        return getattr(result, "message_id", None)
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType],
+    ) -> Response[TelegramType]:
+        response = await make_request(bot, method)
+        chat_id = getattr(method, "chat_id", None)
+        message_id = self._get_message_id(response.result)
+        if not isinstance(chat_id, int) or message_id is None:
+            return response
+
+        reply_markup = getattr(method, "reply_markup", None)
+        last = self._shown.get(chat_id)
+        if isinstance(reply_markup, ReplyKeyboardMarkup):
+            shown = True
+        elif isinstance(reply_markup, ReplyKeyboardRemove):
+            shown = False
+        elif last is not None and last[0] == message_id - 1:
+            shown = last[1]
+        else:
+            # Message of other process may be sent between.
+            shown = True
+        if last is None or last[0] < message_id:
+            self._shown.set(chat_id, (message_id, shown))
+        return response
+
+    def is_shown(self, chat_id: int, message_id: int) -> bool:
+        """Returns whether keyboard may be shown in chat
+        where `message_id` is the latest message.
+
+        Only message of user right after last message of this process
+        or last message of this process itself prove that no other process
+        has shown keyboard since.
+        """
+        last = self._shown.get(chat_id)
+        if last is None or last[0] < message_id - 1:
+            return True
+        if last[0] < message_id:
+            self._shown.set(chat_id, (message_id, last[1]))
+        return last[1]
+
+
+reply_keyboard_tracker = ReplyKeyboardTracker()
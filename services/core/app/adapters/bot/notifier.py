@@ -0,0 +1,228 @@
+import asyncio
+from dataclasses import dataclass, field
+from functools import lru_cache
+from time import monotonic
+from typing import Any, Optional
+
+from aiogram.exceptions import TelegramAPIError, TelegramRetryAfter
+from aiogram.types import InlineKeyboardMarkup, Message
+from aiogram.utils.markdown import hbold
+
+from app.infra.cache import TTLCache
+from app.infra.config import settings
+from app.infra.logging import logger
+
+from app.adapters.bot.bot import get_bot
+
+
+class TokenBucket:
+    """Async token bucket, allows `rate` acquires per second
+    with bursts up to `capacity`."""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self):
+        """Waits until token is available and takes it."""
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, seconds: float):
+        """Empties bucket so next token is available after `seconds`."""
+        self._refill()
+        self._tokens = min(self._tokens, 0) - seconds * self.rate
+
+
+@dataclass
+class _Notification:
+    chat_id: int
+    text: str
+    reply_markup: Optional[InlineKeyboardMarkup] = None
+    menu: Optional[InlineKeyboardMarkup] = None
+    queued_at: float = field(default_factory=monotonic)
+
+
+class NotificationDispatcher:
+    """Sends notifications by pool of concurrent senders.
+
+    Sending respects Telegram limits: global messages per second
+    and messages per second in one chat.
+    Notification and its follow-up menu are sent by one sender one by one.
+    """
+
+    menu_text = hbold("Фуджи team")
+
+    def __init__(
+        self,
+        workers: int,
+        global_rate: float,
+        chat_rate: float,
+        max_retries: int = 3,
+    ):
+        """
+        :param workers: Count of concurrent senders.
+        :param global_rate: Max messages per second for bot.
+        :param chat_rate: Max messages per second for one chat.
+        :param max_retries: Max resends of message after `RetryAfter`.
+        """
+        self.workers = workers
+        self.chat_rate = chat_rate
+        self.max_retries = max_retries
+        self._global_bucket = TokenBucket(global_rate, global_rate)
+        # Idle chat bucket is full again after `1 / chat_rate` seconds,
+        # so it can be dropped.
+        self._chat_buckets: TTLCache[int, TokenBucket] = TTLCache(ttl=60, maxsize=10000)
+        self._queue: asyncio.Queue[_Notification] | None = None
+        self._tasks: list[asyncio.Task] = []
+
+        self.started_at = monotonic()
+        self.sent = 0
+        self.failed = 0
+        self.retries = 0
+        self.in_flight = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+
+    def _start(self):
+        self._queue = asyncio.Queue()
+        self._tasks = [
+            asyncio.create_task(self._run(), name=f"notifier_{i}")
+            for i in range(self.workers)
+        ]
+
+    def submit(
+        self,
+        chat_id: int,
+        text: str,
+        reply_markup: Optional[InlineKeyboardMarkup] = None,
+        menu: Optional[InlineKeyboardMarkup] = None,
+    ):
+        """Queues notification, `menu` is sent after it if passed.
+
+        Must be called from running event loop.
+        """
+        if self._queue is None:
+            self._start()
+        self._queue.put_nowait(_Notification(chat_id, text, reply_markup, menu))
+
+    async def send(
+        self,
+        chat_id: int,
+        text: str,
+        reply_markup: Optional[InlineKeyboardMarkup] = None,
+    ) -> Message:
+        """Sends message with respect to rate limits.
+
+        Retries after `TelegramRetryAfter` up to `max_retries` times.
+        """
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            bucket = TokenBucket(self.chat_rate, 1)
+        self._chat_buckets.set(chat_id, bucket)
+
+        for attempt in range(self.max_retries + 1):
+            await bucket.acquire()
+            await self._global_bucket.acquire()
+            try:
+                return await get_bot().send_message(
+                    chat_id=chat_id, text=text, reply_markup=reply_markup
+                )
+            except TelegramRetryAfter as e:
+                if attempt == self.max_retries:
+                    raise
+                self.retries += 1
+                logger.warning(
+                    f"Notification to {chat_id} is limited, retry after {e.retry_after}s"
+                )
+                self._global_bucket.pause(e.retry_after)
+                bucket.pause(e.retry_after)
+
+    async def _deliver(self, notification: _Notification):
+        try:
+            await self.send(
+                notification.chat_id, notification.text, notification.reply_markup
+            )
+        except TelegramAPIError as e:
+            self.failed += 1
+            logger.warning(f"Notification to {notification.chat_id} failed: {e}")
+            return
+
+        latency = monotonic() - notification.queued_at
+        self.sent += 1
+        self.latency_total += latency
+        self.latency_max = max(self.latency_max, latency)
+
+        if notification.menu is not None:
+            try:
+                await self.send(notification.chat_id, self.menu_text, notification.menu)
+            except TelegramAPIError as e:
+                logger.warning(f"Menu to {notification.chat_id} not sent: {e}")
+
+    async def _run(self):
+        queue = self._queue
+        while True:
+            notification = await queue.get()
+            self.in_flight += 1
+            try:
+                await self._deliver(notification)
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Notification to {notification.chat_id} failed: {e}")
+            finally:
+                self.in_flight -= 1
+                queue.task_done()
+
+    async def stop(self, timeout: float = 10):
+        """Waits until queued notifications are sent and stops senders."""
+        if self._queue is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Notifier stopped with {self._queue.qsize()} unsent notifications"
+            )
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._queue = None
+        self._tasks = []
+
+    def snapshot(self) -> dict[str, Any]:
+        """Returns delivery statistic."""
+        uptime = monotonic() - self.started_at
+        return dict(
+            queued=self._queue.qsize() if self._queue else 0,
+            in_flight=self.in_flight,
+            sent=self.sent,
+            failed=self.failed,
+            retries=self.retries,
+            latency_avg=self.latency_total / self.sent if self.sent else 0,
+            latency_max=self.latency_max,
+            throughput=self.sent / uptime if uptime else 0,
+        )
+
+
+@lru_cache
+def get_notifier() -> NotificationDispatcher:
+    return NotificationDispatcher(
+        workers=settings.notify_workers,
+        global_rate=settings.notify_global_rate,
+        chat_rate=settings.notify_chat_rate,
+    )
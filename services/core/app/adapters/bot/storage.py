@@ -0,0 +1,173 @@
+from dataclasses import astuple
+from datetime import date, datetime, timedelta
+import enum
+import importlib
+from typing import Any, Callable, Dict, Optional
+
+from aiogram.fsm.storage.base import BaseStorage, StateType, StorageKey
+from aiogram.fsm.storage.memory import MemoryStorage
+from aiogram.types import Message, TelegramObject
+import aiogram.types
+from pydantic import BaseModel
+
+import app.infra.database.async_orm as async_orm
+from app.infra.database.models import BotFSMState
+from app.infra.config import settings
+from app.infra.logging import logger
+
+
+_callables: dict[str, Callable] = {}
+
+# Stored messages are used only to edit, delete or answer them.
+_message_fields = {
+    "message_id": True,
+    "date": True,
+    "chat": {"id", "type"},
+    "message_thread_id": True,
+}
+
+
+def register_fsm_callable(name: str, func: Callable):
+    """Allows `func` to be stored in FSM data, it's stored by `name`.
+
+    `name` must be same in all processes.
+    """
+    _callables[name] = func
+
+
+def _get_path(obj: Any) -> str:
+    return f"{type(obj).__module__}:{type(obj).__qualname__}"
+
+
+def _import_path(path: str) -> Any:
+    module, qualname = path.split(":")
+    obj = importlib.import_module(module)
+    for name in qualname.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+def encode_fsm_value(value: Any) -> Any:
+    """Converts FSM data `value` to JSON compatible value.
+
+    Telegram objects are stored without empty fields,
+    messages are stored only with fields required to reference them.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (list, tuple, set)):
+        return [encode_fsm_value(item) for item in value]
+    if isinstance(value, dict):
+        return {str(key): encode_fsm_value(item) for key, item in value.items()}
+    if isinstance(value, Message):
+        return {
+            "__tg__": "Message",
+            "data": value.model_dump(
+                mode="json", include=_message_fields, exclude_none=True
+            ),
+        }
+    if isinstance(value, TelegramObject):
+        return {
+            "__tg__": type(value).__name__,
+            "data": value.model_dump(mode="json", exclude_none=True),
+        }
+    if isinstance(value, BaseModel):
+        return {"__model__": _get_path(value), "data": value.model_dump(mode="json")}
+    if isinstance(value, enum.Enum):
+        return {"__enum__": _get_path(value), "value": value.value}
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, date):
+        return {"__date__": value.isoformat()}
+    if callable(value):
+        for name, func in _callables.items():
+            if func == value:
+                return {"__callable__": name}
+    raise TypeError(f"Value of type {type(value)} can't be stored in FSM data")
+
+
+def decode_fsm_value(value: Any) -> Any:
+    """Restores FSM data `value` encoded by `encode_fsm_value`."""
+    if isinstance(value, list):
+        return [decode_fsm_value(item) for item in value]
+    if not isinstance(value, dict):
+        return value
+    if "__tg__" in value:
+        from app.adapters.bot.bot import get_bot
+
+        return getattr(aiogram.types, value["__tg__"]).model_validate(
+            value["data"], context={"bot": get_bot()}
+        )
+    if "__model__" in value:
+        return _import_path(value["__model__"]).model_validate(value["data"])
+    if "__enum__" in value:
+        return _import_path(value["__enum__"])(value["value"])
+    if "__datetime__" in value:
+        return datetime.fromisoformat(value["__datetime__"])
+    if "__date__" in value:
+        return date.fromisoformat(value["__date__"])
+    if "__callable__" in value:
+        return _callables[value["__callable__"]]
+    return {key: decode_fsm_value(item) for key, item in value.items()}
+
+
+class PostgreSQLStorage(BaseStorage):
+    """FSM storage shared between processes.
+
+    State and data are kept in `bot_fsm_states` table
+    and expire after `ttl` since last change.
+    """
+
+    def __init__(self, ttl: int):
+        """
+        :param ttl: Seconds while state and data are kept.
+        """
+        self.ttl = timedelta(seconds=ttl)
+
+    @staticmethod
+    def _build_key(key: StorageKey) -> str:
+        return ":".join(str(part) for part in astuple(key))
+
+    async def set_state(self, key: StorageKey, state: StateType = None) -> None:
+        await async_orm.set_fsm_record(
+            self._build_key(key),
+            BotFSMState.state,
+            state.state if hasattr(state, "state") else state,
+            datetime.now() + self.ttl,
+        )
+
+    async def get_state(self, key: StorageKey) -> Optional[str]:
+        record = await async_orm.get_fsm_record(self._build_key(key))
+        return record[0] if record else None
+
+    async def set_data(self, key: StorageKey, data: Dict[str, Any]) -> None:
+        await async_orm.set_fsm_record(
+            self._build_key(key),
+            BotFSMState.data,
+            encode_fsm_value(data),
+            datetime.now() + self.ttl,
+        )
+
+    async def get_data(self, key: StorageKey) -> Dict[str, Any]:
+        record = await async_orm.get_fsm_record(self._build_key(key))
+        return decode_fsm_value(record[1]) if record else {}
+
+    async def remove_expired(self) -> int:
+        """Deletes expired states, returns count of deleted."""
+        return await async_orm.delete_expired_fsm_records()
+
+    async def close(self) -> None:
+        pass
+
+
+def create_storage() -> BaseStorage:
+    """Returns FSM storage specified by `settings.bot_fsm_storage`."""
+    match settings.bot_fsm_storage:
+        case "postgres":
+            return PostgreSQLStorage(ttl=settings.bot_fsm_ttl)
+        case "memory":
+            return MemoryStorage()
+    logger.warning(
+        f"Unknown FSM storage {settings.bot_fsm_storage}, memory storage is used"
+    )
+    return MemoryStorage()
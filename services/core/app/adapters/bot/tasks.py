@@ -9,6 +9,8 @@ from aiogram.types import InlineKeyboardMarkup
 from app.infra.logging import logger
 import app.services as services
 
+from app.adapters.bot.bot import get_dispatcher
+from app.adapters.bot.storage import PostgreSQLStorage
 from app.adapters.bot.handlers.rate.utils import shift_closed
 from app.adapters.bot.text import unclosed_shift_notify, unclosed_shift_request
 from app.adapters.bot.handlers.utils import notify_worker_by_telegram_id
@@ -174,3 +176,26 @@ async def update_repairman_worktimes() -> None:  # Technical requests
         logger.info("Updating the working hours of the repairmen.")
         services.update_repairman_worktimes(9, 18)
         logger.info("Updating the working hours of the repairmen. Completed")
+
+
+@repeat_every(
+    seconds=60 * 60 * 24,
+    logger=logger,
+)
+async def remove_expired_fsm_states() -> None:
+    """Removes expired states from shared FSM storage."""
+    storage = get_dispatcher().storage
+    if isinstance(storage, PostgreSQLStorage):
+        count = await storage.remove_expired()
+        logger.info(f"Removed {count} expired FSM states.")
+
+
+@repeat_every(
+    seconds=60 * 60 * 24,
+    logger=logger,
+)
+def move_worktime_photos() -> None:
+    """Moves worktime photos from database to storage."""
+    logger.info("Moving worktime photos to storage.")
+    count = services.move_worktime_photos()
+    logger.info(f"Moved {count} worktime photos to storage.")
@@ -0,0 +1,127 @@
+import asyncio
+from dataclasses import dataclass, field
+from time import monotonic
+from typing import Any
+
+from aiogram import Bot, Dispatcher
+from aiogram.dispatcher.middlewares.user_context import UserContextMiddleware
+from aiogram.types import Update
+
+from app.infra.logging import logger
+
+
+@dataclass
+class _QueuedUpdate:
+    update: Update
+    queued_at: float = field(default_factory=monotonic)
+
+
+class UpdateQueue:
+    """Processes telegram updates by pool of consumers.
+
+    Updates of one chat are always processed by the same consumer,
+    so they are handled in order of receiving.
+    """
+
+    def __init__(self, dispatcher: Dispatcher, bot: Bot, workers: int, maxsize: int):
+        """
+        :param workers: Count of consumers.
+        :param maxsize: Max count of waiting updates for one consumer.
+        """
+        self.dispatcher = dispatcher
+        self.bot = bot
+        self.workers = workers
+        self.maxsize = maxsize
+        self._queues: list[asyncio.Queue[_QueuedUpdate]] = []
+        self._tasks: list[asyncio.Task] = []
+
+        self.processed = 0
+        self.failed = 0
+        self.blocked = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.handle_total = 0.0
+        self.handle_max = 0.0
+
+    def _start(self):
+        self._queues = [asyncio.Queue(self.maxsize) for _ in range(self.workers)]
+        self._tasks = [
+            asyncio.create_task(self._run(queue), name=f"bot_updates_{i}")
+            for i, queue in enumerate(self._queues)
+        ]
+
+    @staticmethod
+    def _get_chat_key(update: Update) -> int:
+        chat, user, _ = UserContextMiddleware.resolve_event_context(update)
+        if chat is not None:
+            return chat.id
+        if user is not None:
+            return user.id
+        return update.update_id
+
+    async def put(self, update: Update):
+        """Queues `update` for processing.
+
+        If consumer queue is full waits for free place,
+        so webhook slows down instead of breaking updates order.
+        """
+        if not self._queues:
+            self._start()
+        queue = self._queues[self._get_chat_key(update) % self.workers]
+        if queue.full():
+            self.blocked += 1
+        await queue.put(_QueuedUpdate(update))
+
+    async def _run(self, queue: asyncio.Queue[_QueuedUpdate]):
+        while True:
+            queued = await queue.get()
+            start = monotonic()
+            wait = start - queued.queued_at
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+            try:
+                await self.dispatcher.feed_update(bot=self.bot, update=queued.update)
+            except Exception as e:
+                self.failed += 1
+                logger.error(f"Bot update {queued.update.update_id} error: {e}")
+            finally:
+                handle = monotonic() - start
+                self.processed += 1
+                self.handle_total += handle
+                self.handle_max = max(self.handle_max, handle)
+                queue.task_done()
+
+    async def stop(self, timeout: float = 30):
+        """Waits until queued updates are processed and stops consumers."""
+        if not self._queues:
+            return
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(queue.join() for queue in self._queues)), timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Bot update queue stopped with {self.size()} unprocessed updates"
+            )
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._queues = []
+        self._tasks = []
+
+    def size(self) -> int:
+        return sum(queue.qsize() for queue in self._queues)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Returns queue state with processing statistic."""
+        return dict(
+            queued=self.size(),
+            max_queued=max((queue.qsize() for queue in self._queues), default=0),
+            processed=self.processed,
+            failed=self.failed,
+            blocked=self.blocked,
+            wait_avg=self.wait_total / self.processed if self.processed else 0,
+            wait_max=self.wait_max,
+            handle_avg=self.handle_total / self.processed if self.processed else 0,
+            handle_max=self.handle_max,
+        )
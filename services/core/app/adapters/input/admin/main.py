@@ -4,7 +4,7 @@ from uuid import uuid4
 
 from app.infra.logging import logger
 from app.infra.config import settings
-from app.infra.database.database import engine, session
+from app.infra.database.database import engine, session_factory
 
 from app.adapters.input.admin.admin import FujiAdmin, AdminAuth
 from app.adapters.input.admin.configure import configure
@@ -15,7 +15,7 @@ def create(app: FastAPI) -> FastAPI:
     admin = FujiAdmin(
         app,
         engine=engine,
-        session_maker=session,
+        session_maker=session_factory,
         title="Fuji admin",
         templates_dir=templates_dir,
         authentication_backend=AdminAuth(secret_key=uuid4()),
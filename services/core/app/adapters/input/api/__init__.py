@@ -1,3 +1,3 @@
-from app.adapters.input.api.main import create
+from app.adapters.input.api.main import create, lifespan
 
-__all__ = ["create"]
+__all__ = ["create", "lifespan"]
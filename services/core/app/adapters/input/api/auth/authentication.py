@@ -10,6 +10,7 @@ from pydantic import ValidationError
 from app.infra.database.models import FujiScope
 from app.schemas import WorkerSchema, AuthClientSchema
 from app.infra.config import settings
+from app.infra.database.orm import principal_cache
 from app import services
 from app.services import auth_client
 
@@ -131,28 +132,20 @@ def create_access_link(scopes: list[Union[str, FujiScope]] = None) -> str:
     return f"{link}/crm/guest?token={access_token}&token_type=bearer"
 
 
-async def get_user(
-    security_scopes: SecurityScopes, token: str = Depends(_oauth2_schema)
-) -> UserWithScopes:
-    """Validates user permissions.
-    Returns instance of `User` if user has enough permissions for `security scopes`,
-    throw `HTTPException` with `401` status code otherwise."""
-    required_all_scopes: list[str] = [
-        scope for scope in security_scopes.scopes if "|" not in scope
-    ]
-    required_any_scopes_groups: list[list[str]] = [
-        scope.split("|") for scope in security_scopes.scopes if "|" in scope
-    ]
+async def _get_principal(
+    token: str, credentials_exception: HTTPException
+) -> tuple[TokenData, UserWithScopes]:
+    """Returns data and user of verified `token`.
 
-    if security_scopes.scopes:
-        authenticate_value = f"Bearer scope='{security_scopes.scope_str}'"
-    else:
-        authenticate_value = "Bearer"
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": authenticate_value},
-    )
+    Principal is cached in `principal_cache` until token is expired.
+    """
+    key = sha256(token.encode()).hexdigest()
+    cached = principal_cache.get(key)
+    if cached is not None:
+        expire, token_data, user = cached
+        if timegm(datetime.now().utctimetuple()) <= expire:
+            return token_data, user.model_copy()
+        principal_cache.pop(key)
 
     try:
         payload = jwt.decode(
@@ -180,7 +173,7 @@ async def get_user(
             username="guest", full_name="guest", scopes=token_data.scopes
         )
     else:
-        worker = services.get_worker_by_phone_number(username)
+        worker = await services.get_worker_by_phone_number_async(username)
         if not worker:
             raise credentials_exception
         user = User(
@@ -189,6 +182,35 @@ async def get_user(
             scopes=token_data.scopes,
         )
 
+    principal_cache.set(key, (expire, token_data, user))
+    return token_data, user.model_copy()
+
+
+async def get_user(
+    security_scopes: SecurityScopes, token: str = Depends(_oauth2_schema)
+) -> UserWithScopes:
+    """Validates user permissions.
+    Returns instance of `User` if user has enough permissions for `security scopes`,
+    throw `HTTPException` with `401` status code otherwise."""
+    required_all_scopes: list[str] = [
+        scope for scope in security_scopes.scopes if "|" not in scope
+    ]
+    required_any_scopes_groups: list[list[str]] = [
+        scope.split("|") for scope in security_scopes.scopes if "|" in scope
+    ]
+
+    if security_scopes.scopes:
+        authenticate_value = f"Bearer scope='{security_scopes.scope_str}'"
+    else:
+        authenticate_value = "Bearer"
+    credentials_exception = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Could not validate credentials",
+        headers={"WWW-Authenticate": authenticate_value},
+    )
+
+    token_data, user = await _get_principal(token, credentials_exception)
+
     # For & scopes.
     if (
         required_all_scopes
@@ -1,13 +1,14 @@
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 import sys
 
 from app.infra.logging import logger
 
 from app.adapters.input.api.auth.configure import configure
+from app.adapters.input.api.dependencies import use_session_scope
 
 
 def create(app: FastAPI) -> FastAPI:
-    auth = FastAPI()
+    auth = FastAPI(dependencies=[Depends(use_session_scope)])
     try:
         configure(auth)
     except Exception as e:
@@ -1,4 +1,4 @@
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 import sys
 
 from app.infra.logging import logger
@@ -11,10 +11,12 @@ from app.adapters.input.api.crm.routers import bid
 from app.adapters.input.api.crm.routers import worktime
 from app.adapters.input.api.crm.routers import post
 from app.adapters.input.api.crm.routers import timesheet
+from app.adapters.input.api.crm.routers import export
+from app.adapters.input.api.dependencies import use_session_scope
 
 
 def create(api: FastAPI) -> FastAPI:
-    crm = FastAPI()
+    crm = FastAPI(dependencies=[Depends(use_session_scope)])
     try:
         configure(crm)
     except Exception as e:
@@ -35,3 +37,4 @@ def configure(crm: FastAPI):
     crm.include_router(worktime.router, prefix="/worktime")
     crm.include_router(post.router, prefix="/post")
     crm.include_router(timesheet.router, prefix="/timesheet")
+    crm.include_router(export.router, prefix="/export")
@@ -2,8 +2,10 @@ from fastapi import Response, Security, UploadFile
 from fastapi.responses import StreamingResponse
 from fastapi.exceptions import HTTPException
 from fastapi.routing import APIRouter
+from starlette.concurrency import run_in_threadpool
 
 from app.infra.database.models import ApprovalStatus
+from app.infra.database.query import InvalidCursorError
 from app import services
 import app.services.bid as bid_service
 from app.schemas import (
@@ -11,10 +13,14 @@ from app.schemas import (
     QuerySchema,
     TalbeInfoSchema,
     BidInSchema,
+    CursorPageSchema,
+    ExportJobSchema,
 )
 from app.adapters.bot.handlers.bids.utils import get_current_coordinator_field
 
 from app.adapters.input.api.auth import User, get_user
+from app.adapters.input.api.utils import iter_file
+from app.adapters.output.file.zip_file import ZipFileManager
 
 
 router = APIRouter()
@@ -27,8 +33,8 @@ async def get_bid_pages_info(
     records_per_page: int = 15,
     _: User = Security(get_user, scopes=["crm_bid|crm_bid_readonly"]),
 ) -> TalbeInfoSchema:
-    record_count = services.get_bid_count(query)
-    all_record_count = services.get_bid_count(QuerySchema())
+    record_count = await services.get_bid_count_async(query)
+    all_record_count = await services.get_approximate_bid_count_async()
     page_count = (record_count + records_per_page - 1) // records_per_page
 
     return TalbeInfoSchema(
@@ -45,7 +51,26 @@ async def get_bids(
     records_per_page: int = 15,
     _: User = Security(get_user, scopes=["crm_bid|crm_bid_readonly"]),
 ) -> list[BidOutSchema]:
-    return services.get_bid_record_at_page(page, records_per_page, query)
+    return await services.get_bid_record_at_page_async(page, records_per_page, query)
+
+
+@router.post("/cursor")
+async def get_bids_by_cursor(
+    query: QuerySchema,
+    cursor: str | None = None,
+    records_per_page: int = 15,
+    _: User = Security(get_user, scopes=["crm_bid|crm_bid_readonly"]),
+) -> CursorPageSchema[BidOutSchema]:
+    """Returns bids page after `cursor`, first page if `cursor` isn't passed.
+
+    Unlike `/page/{page}` doesn't slow down on deep pages.
+    """
+    try:
+        return await services.get_bid_records_by_cursor_async(
+            cursor, records_per_page, query
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.patch("/approve/{id}")
@@ -90,7 +115,7 @@ async def export_bids(
     file = services.export_bid_records(query)
 
     return StreamingResponse(
-        content=file,
+        content=iter_file(file),
         headers={
             "Content-Disposition": "filename=bids.xlsx",
         },
@@ -98,6 +123,20 @@ async def export_bids(
     )
 
 
+@router.post("/export/job")
+async def create_bids_export_job(
+    query: QuerySchema, user: User = Security(get_user, scopes=["crm_bid"])
+) -> ExportJobSchema:
+    return await run_in_threadpool(
+        services.create_export_job,
+        owner=user.username,
+        key=f"bids:{query.model_dump_json()}",
+        filename="bids.xlsx",
+        export=lambda progress: services.export_bid_records(query, progress),
+        count=lambda: services.get_bid_count(query.model_copy(deep=True)),
+    )
+
+
 @router.delete("/{id}")
 async def delete_bid(
     id: int, _: User = Security(get_user, scopes=["authenticated"])
@@ -123,6 +162,25 @@ async def add_document(
     services.add_documents_to_bid(id, files)
 
 
+@router.get("/{id}/documents")
+async def download_bid_documents(
+    id: int,
+    _: User = Security(get_user, scopes=["crm_bid|crm_bid_readonly"]),
+) -> Response:
+    """Returns zip archive with all documents of bid."""
+    bid = await services.get_bid_by_id_async(id)
+    if bid is None:
+        raise HTTPException(status_code=404, detail="Bid not found")
+
+    return StreamingResponse(
+        content=ZipFileManager(bid.documents).iter_zip(),
+        headers={
+            "Content-Disposition": f"filename=bid_{id}_documents.zip",
+        },
+        media_type="application/zip",
+    )
+
+
 # endregion
 
 
@@ -165,7 +223,7 @@ async def export_fac_cc_bids(
     file = bid_service.export_fac_or_cc_bid_records(query, user.username)
 
     return StreamingResponse(
-        content=file,
+        content=iter_file(file),
         headers={
             "Content-Disposition": "filename=fac_bids.xlsx",
         },
@@ -173,6 +231,24 @@ async def export_fac_cc_bids(
     )
 
 
+@router.post("/fac_cc/export/job")
+async def create_fac_cc_bids_export_job(
+    query: QuerySchema, user: User = Security(get_user, scopes=["crm_fac_cc_bid"])
+) -> ExportJobSchema:
+    return await run_in_threadpool(
+        services.create_export_job,
+        owner=user.username,
+        key=f"fac_cc_bids:{user.username}:{query.model_dump_json()}",
+        filename="fac_bids.xlsx",
+        export=lambda progress: bid_service.export_fac_or_cc_bid_records(
+            query, user.username, progress
+        ),
+        count=lambda: bid_service.get_fac_or_cc_bid_count(
+            query.model_copy(deep=True), user.username
+        ),
+    )
+
+
 @router.patch("/fac_cc/approve/{id}")
 async def approve_fac_cc_bid(
     id: int, user: User = Security(get_user, scopes=["crm_fac_cc_bid"])
@@ -330,7 +406,7 @@ async def export_paralegal_bids(
     file = services.export_coordintator_bid_records(query, user.username, "paralegal")
 
     return StreamingResponse(
-        content=file,
+        content=iter_file(file),
         headers={
             "Content-Disposition": "filename=paralegal_bids.xlsx",
         },
@@ -338,6 +414,28 @@ async def export_paralegal_bids(
     )
 
 
+@router.post("/paralegal/export/job")
+async def create_paralegal_bids_export_job(
+    query: QuerySchema,
+    user: User = Security(get_user, scopes=["crm_paralegal_bid"]),
+) -> ExportJobSchema:
+    services.apply_bid_status_filter(
+        query, "paralegal_state", ApprovalStatus.pending_approval, group=1
+    )
+    return await run_in_threadpool(
+        services.create_export_job,
+        owner=user.username,
+        key=f"paralegal_bids:{user.username}:{query.model_dump_json()}",
+        filename="paralegal_bids.xlsx",
+        export=lambda progress: services.export_coordintator_bid_records(
+            query, user.username, "paralegal", progress=progress
+        ),
+        count=lambda: services.get_coordinator_bid_count(
+            query.model_copy(deep=True), user.username, "paralegal"
+        ),
+    )
+
+
 @router.patch("/paralegal/approve/{id}")
 async def approve_paralegal_bid(
     id: int, user: User = Security(get_user, scopes=["crm_paralegal_bid"])
@@ -375,8 +473,8 @@ async def get_accountant_card_bid_pages_info(
     services.apply_bid_status_filter(
         query, "accountant_card_state", ApprovalStatus.pending_approval, group=1
     )
-    record_count = services.get_bid_count(query)
-    all_record_count = services.get_bid_count(
+    record_count = await services.get_bid_count_async(query)
+    all_record_count = await services.get_bid_count_async(
         services.apply_bid_status_filter(
             QuerySchema(),
             "accountant_card_state",
@@ -403,7 +501,7 @@ async def get_accountant_card_bids(
     services.apply_bid_status_filter(
         query, "accountant_card_state", ApprovalStatus.pending_approval, group=1
     )
-    return services.get_bid_record_at_page(page, records_per_page, query)
+    return await services.get_bid_record_at_page_async(page, records_per_page, query)
 
 
 @router.post("/accountant_card/export")
@@ -417,7 +515,7 @@ async def export_accountant_card_bids(
     file = services.export_bid_records(query)
 
     return StreamingResponse(
-        content=file,
+        content=iter_file(file),
         headers={
             "Content-Disposition": "filename=fac_bids.xlsx",
         },
@@ -425,6 +523,24 @@ async def export_accountant_card_bids(
     )
 
 
+@router.post("/accountant_card/export/job")
+async def create_accountant_card_bids_export_job(
+    query: QuerySchema,
+    user: User = Security(get_user, scopes=["crm_accountant_card_bid"]),
+) -> ExportJobSchema:
+    services.apply_bid_status_filter(
+        query, "accountant_card_state", ApprovalStatus.pending_approval, group=1
+    )
+    return await run_in_threadpool(
+        services.create_export_job,
+        owner=user.username,
+        key=f"accountant_card_bids:{query.model_dump_json()}",
+        filename="fac_bids.xlsx",
+        export=lambda progress: services.export_bid_records(query, progress),
+        count=lambda: services.get_bid_count(query.model_copy(deep=True)),
+    )
+
+
 @router.patch("/accountant_card/approve/{id}")
 async def approve_accountant_card_bid(
     id: int, user: User = Security(get_user, scopes=["crm_accountant_card_bid"])
@@ -460,8 +576,8 @@ async def get_my_bid_pages_info(
     user: User = Security(get_user, scopes=["authenticated"]),
 ) -> TalbeInfoSchema:
     services.apply_bid_creator_filter(query, user.username)
-    record_count = services.get_bid_count(query)
-    all_record_count = services.get_bid_count(
+    record_count = await services.get_bid_count_async(query)
+    all_record_count = await services.get_bid_count_async(
         services.apply_bid_creator_filter(QuerySchema(), user.username)
     )
     page_count = (record_count + records_per_page - 1) // records_per_page
@@ -481,7 +597,7 @@ async def get_my_bids(
     user: User = Security(get_user, scopes=["authenticated"]),
 ) -> list[BidOutSchema]:
     services.apply_bid_creator_filter(query, user.username)
-    return services.get_bid_record_at_page(page, records_per_page, query)
+    return await services.get_bid_record_at_page_async(page, records_per_page, query)
 
 
 @router.post("/my/export")
@@ -493,7 +609,7 @@ async def export_my_bids(
     file = services.export_bid_records(query)
 
     return StreamingResponse(
-        content=file,
+        content=iter_file(file),
         headers={
             "Content-Disposition": "filename=my_bids.xlsx",
         },
@@ -501,6 +617,22 @@ async def export_my_bids(
     )
 
 
+@router.post("/my/export/job")
+async def create_my_bids_export_job(
+    query: QuerySchema,
+    user: User = Security(get_user, scopes=["authenticated"]),
+) -> ExportJobSchema:
+    services.apply_bid_creator_filter(query, user.username)
+    return await run_in_threadpool(
+        services.create_export_job,
+        owner=user.username,
+        key=f"my_bids:{user.username}:{query.model_dump_json()}",
+        filename="my_bids.xlsx",
+        export=lambda progress: services.export_bid_records(query, progress),
+        count=lambda: services.get_bid_count(query.model_copy(deep=True)),
+    )
+
+
 # endregion
 
 
@@ -513,8 +645,8 @@ async def get_archive_bid_pages_info(
 ) -> TalbeInfoSchema:
     services.apply_bid_creator_filter(query, user.username)
     services.apply_bid_archive_filter(query)
-    record_count = services.get_bid_count(query)
-    all_record_count = services.get_bid_count(
+    record_count = await services.get_bid_count_async(query)
+    all_record_count = await services.get_bid_count_async(
         services.apply_bid_archive_filter(
             services.apply_bid_creator_filter(QuerySchema(), user.username)
         )
@@ -537,7 +669,7 @@ async def get_archive_bids(
 ) -> list[BidOutSchema]:
     services.apply_bid_creator_filter(query, user.username)
     services.apply_bid_archive_filter(query)
-    return services.get_bid_record_at_page(page, records_per_page, query)
+    return await services.get_bid_record_at_page_async(page, records_per_page, query)
 
 
 @router.post("/archive/export")
@@ -550,7 +682,7 @@ async def export_archive_bids(
     file = services.export_bid_records(query)
 
     return StreamingResponse(
-        content=file,
+        content=iter_file(file),
         headers={
             "Content-Disposition": "filename=my_bids.xlsx",
         },
@@ -558,6 +690,23 @@ async def export_archive_bids(
     )
 
 
+@router.post("/archive/export/job")
+async def create_archive_bids_export_job(
+    query: QuerySchema,
+    user: User = Security(get_user, scopes=["authenticated"]),
+) -> ExportJobSchema:
+    services.apply_bid_creator_filter(query, user.username)
+    services.apply_bid_archive_filter(query)
+    return await run_in_threadpool(
+        services.create_export_job,
+        owner=user.username,
+        key=f"archive_bids:{user.username}:{query.model_dump_json()}",
+        filename="my_bids.xlsx",
+        export=lambda progress: services.export_bid_records(query, progress),
+        count=lambda: services.get_bid_count(query.model_copy(deep=True)),
+    )
+
+
 # endregion
 
 
@@ -0,0 +1,41 @@
+from fastapi import HTTPException, Security, status
+from fastapi.responses import FileResponse
+from fastapi.routing import APIRouter
+from starlette.concurrency import run_in_threadpool
+
+from app import services
+from app.schemas import ExportJobSchema
+
+from app.adapters.input.api.auth import User, get_user
+
+
+router = APIRouter()
+
+
+@router.get("/{id}")
+async def get_export_job(
+    id: str, user: User = Security(get_user, scopes=["authenticated"])
+) -> ExportJobSchema:
+    """Returns export job state."""
+    job = await run_in_threadpool(services.get_export_job, id, user.username)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Export job not found"
+        )
+    return job
+
+
+@router.get("/{id}/download")
+async def download_export_job_file(
+    id: str, user: User = Security(get_user, scopes=["authenticated"])
+) -> FileResponse:
+    """Returns file of finished export job."""
+    result = await run_in_threadpool(services.get_export_job_file, id, user.username)
+    if result is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Export file not ready"
+        )
+    path, filename = result
+    return FileResponse(
+        path=path, filename=filename, media_type="application/octet-stream"
+    )
@@ -1,12 +1,14 @@
 from fastapi import Response, Security
 from fastapi.responses import StreamingResponse
 from fastapi.routing import APIRouter
+from starlette.concurrency import run_in_threadpool
 from datetime import datetime
 
-from app.services import timesheet
-from app.schemas import QuerySchema, TalbeInfoSchema, DateSchema
+from app.services import timesheet, export_job
+from app.schemas import QuerySchema, TalbeInfoSchema, DateSchema, ExportJobSchema
 
 from app.adapters.input.api.auth import User, get_user
+from app.adapters.input.api.utils import iter_file
 
 
 router = APIRouter()
@@ -54,9 +56,23 @@ async def export_worktimes(
     file = timesheet.export_timesheets(query)
 
     return StreamingResponse(
-        content=file,
+        content=iter_file(file),
         headers={
             "Content-Disposition": "filename=timesheets.xlsx",
         },
         media_type="application/octet-stream",
     )
+
+
+@router.post("/export/job")
+async def create_timesheets_export_job(
+    query: QuerySchema, user: User = Security(get_user, scopes=["crm_worktime"])
+) -> ExportJobSchema:
+    return await run_in_threadpool(
+        export_job.create_export_job,
+        owner=user.username,
+        key=f"timesheets:{query.model_dump_json()}",
+        filename="timesheets.xlsx",
+        export=lambda progress: timesheet.export_timesheets(query, progress),
+        count=lambda: timesheet.get_timesheet_count(query.model_copy(deep=True)),
+    )
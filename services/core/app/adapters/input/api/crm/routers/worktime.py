@@ -1,16 +1,23 @@
-from fastapi import Response, Security
-from fastapi.responses import StreamingResponse
+from fastapi import HTTPException, Response, Security
+from fastapi.responses import FileResponse, StreamingResponse
 from fastapi.routing import APIRouter
+from starlette.concurrency import run_in_threadpool
 
 import app.services.worktime as services
+from app.infra.config import settings
 from app.schemas import (
+    CursorPageSchema,
     WorkTimeSchema,
     QuerySchema,
     TalbeInfoSchema,
     WorkTimeSchemaFull,
+    ExportJobSchema,
 )
+from app.services.export_job import create_export_job
+from app.infra.database.query import InvalidCursorError
 
 from app.adapters.input.api.auth import User, get_user
+from app.adapters.input.api.utils import iter_file
 
 
 router = APIRouter()
@@ -30,8 +37,8 @@ async def get_pages_info(
     records_per_page: int = 15,
     _: User = Security(get_user, scopes=["crm_worktime"]),
 ) -> TalbeInfoSchema:
-    record_count = services.get_wortkime_count(query)
-    all_record_count = services.get_wortkime_count(QuerySchema())
+    record_count = await services.get_wortkime_count_async(query)
+    all_record_count = await services.get_approximate_worktime_count_async()
     page_count = (record_count + records_per_page - 1) // records_per_page
 
     return TalbeInfoSchema(
@@ -48,7 +55,26 @@ async def get_worktimes(
     records_per_page: int = 15,
     _: User = Security(get_user, scopes=["crm_worktime"]),
 ) -> list[WorkTimeSchemaFull]:
-    return services.get_worktimes_at_page(page, records_per_page, query)
+    return await services.get_worktimes_at_page_async(page, records_per_page, query)
+
+
+@router.post("/cursor")
+async def get_worktimes_by_cursor(
+    query: QuerySchema,
+    cursor: str | None = None,
+    records_per_page: int = 15,
+    _: User = Security(get_user, scopes=["crm_worktime"]),
+) -> CursorPageSchema[WorkTimeSchemaFull]:
+    """Returns work times page after `cursor`, first page if `cursor` isn't passed.
+
+    Unlike `/page/{page}` doesn't slow down on deep pages.
+    """
+    try:
+        return await services.get_worktimes_by_cursor_async(
+            cursor, records_per_page, query
+        )
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.post("/")
@@ -81,7 +107,7 @@ async def export_worktimes(
     file = services.export_worktimes(query)
 
     return StreamingResponse(
-        content=file,
+        content=iter_file(file),
         headers={
             "Content-Disposition": "filename=worktimes.xlsx",
         },
@@ -89,15 +115,39 @@ async def export_worktimes(
     )
 
 
+@router.post("/export/job")
+async def create_worktimes_export_job(
+    query: QuerySchema, user: User = Security(get_user, scopes=["crm_worktime"])
+) -> ExportJobSchema:
+    return await run_in_threadpool(
+        create_export_job,
+        owner=user.username,
+        key=f"worktimes:{query.model_dump_json()}",
+        filename="worktimes.xlsx",
+        export=lambda progress: services.export_worktimes(query, progress),
+        count=lambda: services.get_wortkime_count(query.model_copy(deep=True)),
+    )
+
+
 @router.get("/download_photo/{photo_id}")
 async def get_worktime_photo(
-    photo_id: int, _: User = Security(get_user, scopes=["crm_worktime"])
+    photo_id: int,
+    thumbnail: bool = False,
+    _: User = Security(get_user, scopes=["crm_worktime"]),
 ) -> Response:
-    photo = services.get_worktime_photo_by_id(photo_id)
-    return StreamingResponse(
-        content=photo,
+    """Returns worktime photo, its thumbnail if `thumbnail` is passed."""
+    file = await services.get_worktime_photo_file(photo_id, thumbnail)
+    headers = {"Content-Disposition": f"filename=photo_{photo_id}.jpg"}
+    if not isinstance(file, str):
+        # Photo isn't moved to storage yet, its thumbnail will differ.
+        return StreamingResponse(
+            content=file, headers=headers, media_type="application/octet-stream"
+        )
+    return FileResponse(
+        path=file,
         headers={
-            "Content-Disposition": f"filename=photo_{photo_id}.jpg",
+            **headers,
+            "Cache-Control": f"private, max-age={settings.worktime_photo_max_age}",
         },
         media_type="application/octet-stream",
     )
@@ -0,0 +1,9 @@
+from typing import AsyncIterator
+
+from app.infra.database.database import session_scope
+
+
+async def use_session_scope() -> AsyncIterator[None]:
+    """Shares one database session between all orm calls of request."""
+    async with session_scope():
+        yield
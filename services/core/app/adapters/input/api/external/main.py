@@ -1,13 +1,14 @@
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 import sys
 
 from app.infra.logging import logger
 
 from app.adapters.input.api.external.routers import equipment_status
+from app.adapters.input.api.dependencies import use_session_scope
 
 
 def create(api: FastAPI) -> FastAPI:
-    crm = FastAPI()
+    crm = FastAPI(dependencies=[Depends(use_session_scope)])
     try:
         configure(crm)
     except Exception as e:
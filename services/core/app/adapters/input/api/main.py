@@ -1,13 +1,21 @@
-from fastapi import FastAPI
+from fastapi import Depends, FastAPI
 import sys
+from typing import AsyncGenerator
 
+from app.infra.http import close_http_session
 from app.infra.logging import logger
+from app.services import shutdown_export_jobs
 
 from app.adapters.input.api.configure import configure
+from app.adapters.input.api.dependencies import use_session_scope
 
 
 def create(app: FastAPI) -> FastAPI:
-    api = FastAPI(docs_url=None, redoc_url=None)
+    api = FastAPI(
+        docs_url=None,
+        redoc_url=None,
+        dependencies=[Depends(use_session_scope)],
+    )
     try:
         configure(api)
     except Exception as e:
@@ -16,3 +24,9 @@ def create(app: FastAPI) -> FastAPI:
     logger.info("Api created")
     app.mount(path="/api", app=api)
     return api
+
+
+async def lifespan(_: FastAPI) -> AsyncGenerator:
+    yield
+    shutdown_export_jobs()
+    await close_http_session()
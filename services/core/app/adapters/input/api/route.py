@@ -4,11 +4,26 @@ from fastapi.responses import FileResponse
 
 from app.adapters.input.api.auth import User, get_user
 from app.infra.config import settings
+from app.infra.database.database import pool_metrics, async_pool_metrics
+from app.infra.database.orm import principal_cache, worker_cache
+from app.infra.database.query import count_cache, plan_cache
+from app.schemas import (
+    CacheMetricsSchema,
+    NotificationMetricsSchema,
+    PoolMetricsSchema,
+    UpdateQueueMetricsSchema,
+)
+from app.adapters.bot.bot import get_update_queue
+from app.adapters.bot.notifier import get_notifier
 
 
 def register_base_routes(api: FastAPI):
     """Registers base api routes"""
     api.get("/download")(get_file)
+    api.get("/metrics/db_pool")(get_db_pool_metrics)
+    api.get("/metrics/query_cache")(get_query_cache_metrics)
+    api.get("/metrics/notifications")(get_notification_metrics)
+    api.get("/metrics/bot_updates")(get_bot_update_metrics)
 
 
 async def get_file(
@@ -23,3 +38,44 @@ async def get_file(
         )
 
     return FileResponse(path=path, filename=name, media_type="application/octet-stream")
+
+
+async def get_db_pool_metrics(
+    _: User = Security(get_user, scopes=["admin"]),
+) -> list[PoolMetricsSchema]:
+    """Returns database connection pools state and checkout statistic."""
+    return [
+        PoolMetricsSchema(**metrics.snapshot())
+        for metrics in (pool_metrics, async_pool_metrics)
+    ]
+
+
+async def get_query_cache_metrics(
+    _: User = Security(get_user, scopes=["admin"]),
+) -> list[CacheMetricsSchema]:
+    """Returns query builder plan, count, worker and principal caches statistic."""
+    return [
+        CacheMetricsSchema(
+            name=name, size=len(cache), hits=cache.hits, misses=cache.misses
+        )
+        for name, cache in (
+            ("query_plans", plan_cache),
+            ("counts", count_cache),
+            ("workers", worker_cache),
+            ("principals", principal_cache),
+        )
+    ]
+
+
+async def get_notification_metrics(
+    _: User = Security(get_user, scopes=["admin"]),
+) -> NotificationMetricsSchema:
+    """Returns bot notifications delivery statistic."""
+    return NotificationMetricsSchema(**get_notifier().snapshot())
+
+
+async def get_bot_update_metrics(
+    _: User = Security(get_user, scopes=["admin"]),
+) -> UpdateQueueMetricsSchema:
+    """Returns bot update queue depth and processing statistic."""
+    return UpdateQueueMetricsSchema(**get_update_queue().snapshot())
@@ -0,0 +1,8 @@
+from typing import BinaryIO, Iterator
+
+
+def iter_file(file: BinaryIO, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """Yields `file` content by `chunk_size` bytes and closes it after."""
+    with file:
+        while chunk := file.read(chunk_size):
+            yield chunk
@@ -1,6 +1,7 @@
 from datetime import datetime
-from io import BytesIO
-from typing import Generator, Type
+from itertools import chain, islice
+from tempfile import TemporaryFile
+from typing import BinaryIO, Callable, Generator, Iterable, Type
 from xlsxwriter import Workbook
 
 from app.contracts.clients import XlSXExporter, FormatValue
@@ -11,6 +12,10 @@ from app.infra.database.converters import approval_status_dict
 
 
 class XlSXWriterExporter(XlSXExporter):
+    """Writes rows in xlsxwriter `constant_memory` mode to temporary file."""
+
+    width_sample_size = 100
+
     def __init__(self, field_formatters, exclude_columns, aliases):
         super().__init__(field_formatters, exclude_columns, aliases)
 
@@ -25,10 +30,9 @@ class XlSXWriterExporter(XlSXExporter):
         }
 
     def _get_headers(
-        self, rows: list[schemas.BaseSchema | dict], dumped: bool = False
+        self, row: schemas.BaseSchema | dict, dumped: bool = False
     ) -> list[str]:
         result = []
-        row = rows[0]
 
         if not dumped:
             row = row.model_fields
@@ -41,11 +45,10 @@ class XlSXWriterExporter(XlSXExporter):
 
     def _format_rows(
         self,
-        rows: list[schemas.BaseSchema | dict],
+        rows: Iterable[schemas.BaseSchema | dict],
         headers: list[str],
         dumped: bool = False,
     ) -> Generator[list[str], None, None]:
-        result = []
         for elem in rows:
             vals = []
             for name in headers:
@@ -55,31 +58,52 @@ class XlSXWriterExporter(XlSXExporter):
 
             yield vals
 
-        return result
-
     def export(
-        self, rows: list[schemas.BaseSchema], with_dump: bool = False
-    ) -> BytesIO:
-        result = BytesIO()
-        workbook = Workbook(result)
+        self,
+        rows: Iterable[schemas.BaseSchema],
+        with_dump: bool = False,
+        progress: Callable[[int], None] | None = None,
+    ) -> BinaryIO:
+        result = TemporaryFile()
+        workbook = Workbook(result, {"constant_memory": True})
         worksheet = workbook.add_worksheet()
 
-        if len(rows) == 0:
+        rows = iter(rows)
+        first_row = next(rows, None)
+
+        if first_row is None:
             workbook.close()
             result.seek(0)
             return result
 
-        data = [row.model_dump() for row in rows] if with_dump else rows
+        data = (
+            (row.model_dump() for row in chain([first_row], rows))
+            if with_dump
+            else chain([first_row], rows)
+        )
 
-        headers: list[str] = self._get_headers(data, with_dump)
+        headers: list[str] = self._get_headers(
+            first_row.model_dump() if with_dump else first_row, with_dump
+        )
+        formatted_data = self._format_rows(data, headers, with_dump)
+
+        # Column widths are calculated by first rows only,
+        # in constant memory mode rows are written once.
+        sample = list(islice(formatted_data, self.width_sample_size))
         rows_width: list[int] = []
 
-        for field_name in headers:
+        for name_index, field_name in enumerate(headers):
             width = len(field_name)
             if field_name in self._aliases:
                 width = max(width, len(self._aliases[field_name]))
+            for row in sample:
+                width = max(width, len(row[name_index]))
             rows_width.append(width)
 
+        # Sets columns width
+        for index, row_width in enumerate(rows_width):
+            worksheet.set_column(index, index, row_width + 2)
+
         worksheet.write_row(
             0,
             0,
@@ -89,18 +113,10 @@ class XlSXWriterExporter(XlSXExporter):
             ],
         )  # Writes headers
 
-        formatted_data = self._format_rows(data, headers, with_dump)
-
-        for index, row in enumerate(formatted_data):
-            for name_index in range(len(headers)):
-                if len(row[name_index]) > rows_width[name_index]:
-                    rows_width[name_index] = len(row[name_index])
-
+        for index, row in enumerate(chain(sample, formatted_data)):
             worksheet.write_row(index + 1, 0, row)  # Index + 1 (header row)
-
-        # Sets columns width
-        for index, row_width in enumerate(rows_width):
-            worksheet.set_column(index, index, row_width + 2)
+            if progress:
+                progress(index + 1)
 
         workbook.close()
         result.seek(0)
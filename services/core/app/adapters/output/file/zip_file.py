@@ -1,21 +1,114 @@
-from zipfile import ZipFile
+from io import RawIOBase
 from os import path
-from app.infra.config.settings import settings
+from typing import AsyncGenerator, Iterator
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
+
+from aiogram import Bot
+from aiogram.types import InputFile
+from starlette.concurrency import iterate_in_threadpool
+
 from app.schemas import DocumentSchema
-from io import BytesIO
+
+
+# Files which are already compressed, deflating them only wastes CPU.
+_compressed_extensions = {
+    ".pdf",
+    ".jpg",
+    ".jpeg",
+    ".png",
+    ".gif",
+    ".webp",
+    ".heic",
+    ".mp4",
+    ".zip",
+    ".rar",
+    ".7z",
+    ".docx",
+    ".xlsx",
+    ".pptx",
+}
+
+
+class _ChunkSink(RawIOBase):
+    """Unseekable stream which collects written bytes until they are taken."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def take(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
 
 
 class ZipFileManager:
-    def __init__(self, files: list[DocumentSchema]):
+    """Creates zip archive with documents from storage.
+
+    Archive is generated by chunks while documents are read,
+    so it's never kept in memory entirely.
+    """
+
+    def __init__(
+        self,
+        files: list[DocumentSchema],
+        store_only: bool = False,
+        chunk_size: int = 64 * 1024,
+    ):
+        """
+        :param store_only: Don't compress any file. Otherwise only files
+        which aren't compressed already are deflated.
+        :param chunk_size: Bytes read from document at once.
+        """
         self.files: list[DocumentSchema] = files
+        self.store_only = store_only
+        self.chunk_size = chunk_size
+
+    def _get_compress_type(self, filename: str) -> int:
+        if self.store_only:
+            return ZIP_STORED
+        if path.splitext(filename)[1].lower() in _compressed_extensions:
+            return ZIP_STORED
+        return ZIP_DEFLATED
 
-    def create_zip(self) -> bytes:
-        buffer = BytesIO()
-        with ZipFile(buffer, mode="w") as zf:
+    def iter_zip(self) -> Iterator[bytes]:
+        """Yields zip archive by chunks.
+
+        Documents which don't exist in storage are skipped.
+        """
+        sink = _ChunkSink()
+        with ZipFile(sink, mode="w") as zf:
             for file in self.files:
-                if path.exists(
-                    path.join(settings.storage_path, file.document.filename)
-                ):
-                    zf.write(path.join(settings.storage_path, file.document.filename))
-        buffer.seek(0)
-        return buffer.read()
+                file_path = file.document.path
+                if not path.isfile(file_path):
+                    continue
+
+                info = ZipInfo.from_file(file_path, path.basename(file_path))
+                info.compress_type = self._get_compress_type(file_path)
+                with open(file_path, "rb") as src, zf.open(info, mode="w") as dst:
+                    while chunk := src.read(self.chunk_size):
+                        dst.write(chunk)
+                        if data := sink.take():
+                            yield data
+                if data := sink.take():
+                    yield data
+        yield sink.take()
+
+
+class ZipInputFile(InputFile):
+    """Zip archive with documents which is uploaded to Telegram
+    while it's generated."""
+
+    def __init__(self, zip_manager: ZipFileManager, filename: str):
+        super().__init__(filename=filename, chunk_size=zip_manager.chunk_size)
+        self.zip_manager = zip_manager
+
+    async def read(self, bot: Bot) -> AsyncGenerator[bytes, None]:
+        async for chunk in iterate_in_threadpool(self.zip_manager.iter_zip()):
+            yield chunk
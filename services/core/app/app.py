@@ -24,9 +24,10 @@ async def global_lifespan(app: FastAPI):
     lifespans = []
 
     lifespans.append(bot.lifespan(app))
+    lifespans.append(api.lifespan(app))
 
     for lifespan in lifespans:
         await anext(lifespan)
     yield
     for lifespan in lifespans:
-        await anext(lifespan)
+        await anext(lifespan, None)
@@ -1,6 +1,5 @@
 from abc import ABC, abstractmethod
-from io import BytesIO
-from typing import Callable, TypeAlias
+from typing import BinaryIO, Callable, Iterable, TypeAlias
 
 from app.schemas import BaseSchema
 
@@ -28,9 +27,17 @@ class XlSXExporter(ABC):
         self._aliases = aliases
 
     @abstractmethod
-    def export(self, data: list[BaseSchema], with_dump: bool = False) -> BytesIO:
+    def export(
+        self,
+        data: Iterable[BaseSchema],
+        with_dump: bool = False,
+        progress: Callable[[int], None] | None = None,
+    ) -> BinaryIO:
         """Generates xlsx file.
 
+        `data` is consumed once, so it can be generator.
+
         :param with_dump: If `True` then row will dump by `BaseModel.dump_model` before format.
-        :return: Generated xlsx file in `BytesIO` representation.
+        :param progress: Called with count of written rows.
+        :return: Generated xlsx file opened for reading.
         """
@@ -0,0 +1,62 @@
+from collections import OrderedDict
+import threading
+import time
+from typing import Any, Generic, Hashable, TypeVar
+
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ValueT = TypeVar("ValueT")
+
+_missing = object()
+
+
+class TTLCache(Generic[KeyT, ValueT]):
+    """Thread safe in-memory cache with entry lifetime and size limit.
+
+    When `maxsize` is reached least recently used entry is removed.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        """
+        :param ttl: Entry lifetime in seconds.
+        :param maxsize: Max count of entries.
+        """
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[KeyT, tuple[float, ValueT]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: KeyT, default: Any = None) -> ValueT | Any:
+        """Returns cached value for `key` or `default` if it's missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key, _missing)
+            if entry is _missing or entry[0] < time.monotonic():
+                if entry is not _missing:
+                    del self._entries[key]
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: KeyT, value: ValueT):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: KeyT):
+        """Removes `key` from cache if it exists."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -6,3 +6,33 @@ class BotSettings(BaseSettings):
     bot_token: str = Field(validate_default="BOT_TOKEN")
     telegram_token: str = Field(validate_default="TELEGRAM_TOKEN")
     bot_webhook_url: str = Field(validate_default="BOT_WEBHOOK_URL")
+
+    # Notifications sending, Telegram allows ~30 messages per second
+    # for bot and ~1 message per second in one chat.
+    notify_workers: int = Field(validation_alias="NOTIFY_WORKERS", default=8)
+    notify_global_rate: float = Field(validation_alias="NOTIFY_GLOBAL_RATE", default=25)
+    notify_chat_rate: float = Field(validation_alias="NOTIFY_CHAT_RATE", default=1)
+
+    # Webhook answers at once and updates are processed by consumers pool.
+    bot_update_queue: bool = Field(validation_alias="BOT_UPDATE_QUEUE", default=False)
+    bot_update_workers: int = Field(validation_alias="BOT_UPDATE_WORKERS", default=8)
+    # Max count of waiting updates for one consumer,
+    # webhook waits while consumer queue is full.
+    bot_update_queue_size: int = Field(
+        validation_alias="BOT_UPDATE_QUEUE_SIZE", default=100
+    )
+
+    # FSM storage: "memory" or "postgres", postgres storage
+    # is shared between processes and survives restarts.
+    bot_fsm_storage: str = Field(validation_alias="BOT_FSM_STORAGE", default="memory")
+    # Seconds while unchanged FSM state and data are kept.
+    bot_fsm_ttl: int = Field(validation_alias="BOT_FSM_TTL", default=3 * 24 * 60 * 60)
+
+    # Bot API allows bots to download files up to 20 MB.
+    bot_max_file_size: int = Field(
+        validation_alias="BOT_MAX_FILE_SIZE", default=20 * 1024 * 1024
+    )
+    # Max count of files downloaded from Telegram at once.
+    bot_download_concurrency: int = Field(
+        validation_alias="BOT_DOWNLOAD_CONCURRENCY", default=4
+    )
@@ -9,6 +9,23 @@ class PostgreSQLSettings(BaseSettings):
     psql_port: int = Field(validation_alias="POSTGRES_PORT", default=5432)
     psql_db_name: str = Field(validation_alias="POSTGRES_DB_NAME", default="postgres")
 
+    # Pool settings, applied to sync and async engine separately.
+    psql_pool_size: int = Field(validation_alias="POSTGRES_POOL_SIZE", default=5)
+    psql_max_overflow: int = Field(validation_alias="POSTGRES_MAX_OVERFLOW", default=10)
+    psql_pool_timeout: float = Field(
+        validation_alias="POSTGRES_POOL_TIMEOUT", default=30
+    )
+    psql_pool_recycle: int = Field(
+        validation_alias="POSTGRES_POOL_RECYCLE", default=1800
+    )
+    psql_pool_pre_ping: bool = Field(
+        validation_alias="POSTGRES_POOL_PRE_PING", default=True
+    )
+    # Seconds while result of table count query is cached.
+    psql_count_cache_ttl: int = Field(
+        validation_alias="POSTGRES_COUNT_CACHE_TTL", default=15
+    )
+
     @computed_field
     @property
     def psql_dsn(self) -> str:
@@ -16,3 +33,11 @@ class PostgreSQLSettings(BaseSettings):
             f"postgresql+psycopg://{self.psql_user}:{self.psql_pass}"
             + f"@{self.psql_host}:{self.psql_port}/{self.psql_db_name}"
         )
+
+    @computed_field
+    @property
+    def psql_async_dsn(self) -> str:
+        return (
+            f"postgresql+asyncpg://{self.psql_user}:{self.psql_pass}"
+            + f"@{self.psql_host}:{self.psql_port}/{self.psql_db_name}"
+        )
@@ -22,6 +22,30 @@ class Settings(PostgreSQLSettings, BotSettings, SecuritySettings):
 
     storage_path: str = Field(validation_alias="STORAGE_PATH", default="/tmp")
 
+    export_workers: int = Field(validation_alias="EXPORT_WORKERS", default=2)
+    # Seconds while finished export job file is available.
+    export_job_ttl: int = Field(validation_alias="EXPORT_JOB_TTL", default=3600)
+
+    # Seconds while worker found by telegram id is cached.
+    worker_cache_ttl: int = Field(validation_alias="WORKER_CACHE_TTL", default=60)
+    # Max seconds while principal of verified token is cached.
+    principal_cache_ttl: int = Field(
+        validation_alias="PRINCIPAL_CACHE_TTL", default=300
+    )
+
+    # Max width and height of worktime photo thumbnail in pixels.
+    worktime_thumbnail_size: int = Field(
+        validation_alias="WORKTIME_THUMBNAIL_SIZE", default=256
+    )
+    # Count of worktime photos moved to storage in one transaction.
+    worktime_photo_batch_size: int = Field(
+        validation_alias="WORKTIME_PHOTO_BATCH_SIZE", default=100
+    )
+    # Seconds while worktime photo is cached by clients.
+    worktime_photo_max_age: int = Field(
+        validation_alias="WORKTIME_PHOTO_MAX_AGE", default=86400
+    )
+
     @computed_field
     @property
     def storage(self) -> FileSystemStorage:
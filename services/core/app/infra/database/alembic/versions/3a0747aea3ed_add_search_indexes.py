@@ -0,0 +1,85 @@
+"""add search indexes
+
+Revision ID: 3a0747aea3ed
+Revises: 5d77a8e6f5e3
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3a0747aea3ed"
+down_revision: Union[str, None] = "5d77a8e6f5e3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Columns searched by `ILIKE '%term%'`.
+trgm_columns = [
+    ("workers", "l_name"),
+    ("workers", "f_name"),
+    ("workers", "o_name"),
+    ("departments", "name"),
+    ("posts", "name"),
+    ("expenditures", "name"),
+    ("expenditures", "chapter"),
+    ("bids", "purpose"),
+    ("bids", "comment"),
+]
+
+# Foreign keys filtered by search subqueries (`worker_id IN (SELECT ...)`).
+fk_columns = [
+    ("bids", "worker_id"),
+    ("bids", "department_id"),
+    ("bids", "expenditure_id"),
+    ("work_times", "worker_id"),
+    ("work_times", "department_id"),
+    ("work_times", "post_id"),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Indexes are built without locking tables for writes.
+    with op.get_context().autocommit_block():
+        for table, column in trgm_columns:
+            op.create_index(
+                f"ix_{table}_{column}_trgm",
+                table,
+                [column],
+                postgresql_using="gin",
+                postgresql_ops={column: "gin_trgm_ops"},
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for table, column in fk_columns:
+            op.create_index(
+                f"ix_{table}_{column}",
+                table,
+                [column],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, column in fk_columns:
+            op.drop_index(
+                f"ix_{table}_{column}",
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+        for table, column in trgm_columns:
+            op.drop_index(
+                f"ix_{table}_{column}_trgm",
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
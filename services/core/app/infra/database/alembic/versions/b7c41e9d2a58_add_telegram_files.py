@@ -0,0 +1,34 @@
+"""add telegram files
+
+Revision ID: b7c41e9d2a58
+Revises: f3936f90263a
+Create Date: 2026-10-18 21:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b7c41e9d2a58"
+down_revision: Union[str, None] = "f3936f90263a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "telegram_files",
+        sa.Column("path", sa.String(), nullable=False),
+        sa.Column("file_id", sa.String(), nullable=False),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("path"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("telegram_files")
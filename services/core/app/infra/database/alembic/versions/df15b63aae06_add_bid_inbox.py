@@ -0,0 +1,97 @@
+"""add bid inbox
+
+Revision ID: df15b63aae06
+Revises: 3a0747aea3ed
+Create Date: 2026-10-18 14:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "df15b63aae06"
+down_revision: Union[str, None] = "3a0747aea3ed"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "bid_inbox",
+        sa.Column("bid_id", sa.Integer(), nullable=False),
+        sa.Column("state_name", sa.String(), nullable=False),
+        sa.Column("coordinator_id", sa.Integer(), nullable=True),
+        sa.Column("department_id", sa.Integer(), nullable=True),
+        sa.Column("since", sa.DateTime(), nullable=False),
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["bid_id"], ["bids.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["coordinator_id"], ["workers.id"]),
+        sa.ForeignKeyConstraint(["department_id"], ["departments.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("bid_id"),
+    )
+    op.create_index(
+        "ix_bid_inbox_state_name", "bid_inbox", ["state_name"], unique=False
+    )
+    op.create_index(
+        "ix_bid_inbox_coordinator",
+        "bid_inbox",
+        ["coordinator_id", "state_name"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_bid_inbox_department",
+        "bid_inbox",
+        ["department_id", "state_name"],
+        unique=False,
+    )
+
+    # First pending state of every bid, in coordination order.
+    op.execute(
+        """
+        INSERT INTO bid_inbox (bid_id, state_name, coordinator_id, department_id, since)
+        SELECT
+            bids.id,
+            pending.state_name,
+            CASE pending.state_name
+                WHEN 'fac_state' THEN expenditures.fac_id
+                WHEN 'cc_state' THEN expenditures.cc_id
+                WHEN 'paralegal_state' THEN expenditures.paralegal_id
+            END,
+            CASE pending.state_name
+                WHEN 'teller_cash_state' THEN bids.paying_department_id
+            END,
+            bids.create_date
+        FROM bids
+        JOIN expenditures ON expenditures.id = bids.expenditure_id
+        CROSS JOIN LATERAL (
+            SELECT states.state_name
+            FROM (
+                VALUES
+                    (1, 'fac_state', bids.fac_state),
+                    (2, 'cc_state', bids.cc_state),
+                    (3, 'paralegal_state', bids.paralegal_state),
+                    (4, 'kru_state', bids.kru_state),
+                    (5, 'owner_state', bids.owner_state),
+                    (6, 'accountant_card_state', bids.accountant_card_state),
+                    (7, 'accountant_cash_state', bids.accountant_cash_state),
+                    (8, 'teller_card_state', bids.teller_card_state),
+                    (9, 'teller_cash_state', bids.teller_cash_state)
+            ) AS states (position, state_name, state)
+            WHERE states.state = 'pending_approval'
+            ORDER BY states.position
+            LIMIT 1
+        ) AS pending
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_bid_inbox_department", table_name="bid_inbox")
+    op.drop_index("ix_bid_inbox_coordinator", table_name="bid_inbox")
+    op.drop_index("ix_bid_inbox_state_name", table_name="bid_inbox")
+    op.drop_table("bid_inbox")
@@ -0,0 +1,51 @@
+"""move worktime photos to storage
+
+Revision ID: e2a95d3c7f14
+Revises: b7c41e9d2a58
+Create Date: 2026-10-18 22:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from app.infra.config import settings
+from fastapi_storages.integrations.sqlalchemy import FileType
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e2a95d3c7f14"
+down_revision: Union[str, None] = "b7c41e9d2a58"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Photos are moved from `photo_b64` by `move_worktime_photos` task,
+    # `photo_b64` stays readable until all photos are moved.
+    op.add_column(
+        "work_times",
+        sa.Column("photo", FileType(storage=settings.storage), nullable=True),
+    )
+    op.add_column(
+        "work_times",
+        sa.Column("photo_thumbnail", FileType(storage=settings.storage), nullable=True),
+    )
+    op.create_index(
+        "ix_work_times_inline_photo",
+        "work_times",
+        ["id"],
+        unique=False,
+        postgresql_where="photo IS NULL AND photo_b64 IS NOT NULL",
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_work_times_inline_photo",
+        table_name="work_times",
+        postgresql_where="photo IS NULL AND photo_b64 IS NOT NULL",
+    )
+    op.drop_column("work_times", "photo_thumbnail")
+    op.drop_column("work_times", "photo")
@@ -0,0 +1,502 @@
+"""Async versions of `orm` functions used on hot paths.
+
+Functions execute queries through `async_session` and convert models
+into schemas inside `AsyncSession.run_sync`, so lazy loaded relationships
+are still available for `model_validate`.
+"""
+
+from datetime import datetime
+from typing import Type, TypeVar
+from pydantic import BaseModel
+from sqlalchemy import Select, and_, case, delete, func, null, or_, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.infra.database.database import Base, async_session
+from app.infra.database.orm import _not_cached, create_query_builder, worker_cache
+from app.infra.database.loading import schema_loader_options
+from app.infra.database.query import QueryBuilder
+from app.infra.database.models import (
+    Bid,
+    BidInbox,
+    BotFSMState,
+    TelegramFile,
+    WorkTime,
+    Worker,
+)
+from app.schemas import (
+    BidSchema,
+    CursorPageSchema,
+    QuerySchema,
+    WorkerSchema,
+    WorkTimeSchema,
+    WorkTimeSchemaFull,
+)
+
+
+SchemaT = TypeVar("SchemaT", bound=BaseModel)
+
+
+async def _validate(
+    s: AsyncSession, schema_type: Type[SchemaT], models: list[Base]
+) -> list[SchemaT]:
+    """Converts `models` to `schema_type` schemas inside `s`."""
+    return await s.run_sync(
+        lambda _: [schema_type.model_validate(model) for model in models]
+    )
+
+
+async def _validate_one(
+    s: AsyncSession, schema_type: Type[SchemaT], model: Base | None
+) -> SchemaT | None:
+    """Converts `model` to `schema_type` schema inside `s`.
+    If `model` is `None` returns `None`."""
+    if model is None:
+        return None
+    return await s.run_sync(lambda _: schema_type.model_validate(model))
+
+
+async def _find_by_column(
+    model_type: Type[Base], schema_type: Type[SchemaT], column: any, value: any
+) -> SchemaT | None:
+    async with async_session.begin() as s:
+        raw_model = (
+            (
+                await s.execute(
+                    select(model_type)
+                    .filter(column == value)
+                    .limit(1)
+                    .options(*schema_loader_options(model_type, schema_type))
+                )
+            )
+            .scalars()
+            .first()
+        )
+        return await _validate_one(s, schema_type, raw_model)
+
+
+async def find_worker_by_column(column: any, value: any) -> WorkerSchema | None:
+    """
+    Returns worker in database by `column` with `value`.
+    If worker not exist return `None`.
+    """
+    return await _find_by_column(Worker, WorkerSchema, column, value)
+
+
+async def find_worker_by_telegram_id(telegram_id: int) -> WorkerSchema | None:
+    """Async version of `orm.find_worker_by_telegram_id`, shares its cache."""
+    worker = worker_cache.get(int(telegram_id), _not_cached)
+    if worker is _not_cached:
+        worker = await find_worker_by_column(Worker.telegram_id, telegram_id)
+        worker_cache.set(int(telegram_id), worker)
+    return worker.model_copy(deep=True) if worker else None
+
+
+async def find_bid_by_column(column: any, value: any) -> BidSchema | None:
+    """
+    Returns bid in database by `column` with `value`.
+    If bid not exist return `None`.
+    """
+    return await _find_by_column(Bid, BidSchema, column, value)
+
+
+# region Bids
+
+
+async def _get_bids(bids_select: Select) -> list[BidSchema]:
+    async with async_session.begin() as s:
+        raw_bids = (
+            (
+                await s.execute(
+                    bids_select.options(*schema_loader_options(Bid, BidSchema))
+                )
+            )
+            .scalars()
+            .all()
+        )
+        return await _validate(s, BidSchema, raw_bids)
+
+
+async def get_pending_bids_by_worker(worker: WorkerSchema) -> list[BidSchema]:
+    """
+    Returns all bids in database by worker.
+    """
+    return await _get_bids(
+        select(Bid).join(Bid.inbox).filter(Bid.worker_id == worker.id)
+    )
+
+
+async def get_specified_pending_bids(pending_column) -> list[BidSchema]:
+    """
+    Returns all bids in database with
+    pending approval state in `pending_column`.
+    """
+    return await _get_bids(
+        select(Bid).join(Bid.inbox).filter(BidInbox.state_name == pending_column.key)
+    )
+
+
+async def get_specified_pending_bids_for_teller_cash(tg_id: int) -> list[BidSchema]:
+    """
+    Returns all bids in database with pending_approval
+    state in teller_cash_state collumn for teller cash with tg_id.
+    """
+    department_id = (
+        select(Worker.department_id)
+        .filter(Worker.telegram_id == tg_id)
+        .limit(1)
+        .scalar_subquery()
+    )
+    return await _get_bids(
+        select(Bid)
+        .join(Bid.inbox)
+        .filter(
+            BidInbox.department_id == department_id,
+            BidInbox.state_name == "teller_cash_state",
+        )
+    )
+
+
+async def get_pending_bids_for_cc_fac(tg_id: int) -> list[BidSchema]:
+    worker_id = select(Worker.id).filter(Worker.telegram_id == tg_id).scalar_subquery()
+    return await _get_bids(
+        select(Bid)
+        .join(Bid.inbox)
+        .filter(
+            BidInbox.coordinator_id == worker_id,
+            BidInbox.state_name.in_(["fac_state", "cc_state"]),
+        )
+    )
+
+
+# endregion
+
+# region Model general
+
+
+async def get_model_count(
+    model_type: Type[Base],
+    query_schema: QuerySchema,
+    select_query: Select | None = None,
+) -> int:
+    """Return count of `model` in bd."""
+    async with async_session.begin() as s:
+        query_schema.order_by_query = None
+        query_builder = create_query_builder(model_type, query_schema, s, select_query)
+
+        return await query_builder.count_async()
+
+
+async def get_approximate_model_count(model_type: Type[Base]) -> int:
+    """Returns estimated count of all `model_type` rows from table statistic.
+
+    If table has no statistic yet returns exact count.
+    """
+    async with async_session.begin() as s:
+        estimate = (
+            await s.execute(
+                text(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(:t)"
+                ),
+                dict(t=model_type.__tablename__),
+            )
+        ).scalar()
+        if estimate is not None and estimate > 0:
+            return estimate
+        return (await s.execute(select(func.count()).select_from(model_type))).scalar()
+
+
+async def get_models(
+    model_type: Type[Base],
+    schema_type: Type[SchemaT],
+    page: int,
+    records_per_page: int,
+    query_schema: QuerySchema,
+    select_query: Select | None = None,
+) -> list[SchemaT]:
+    """Returns `model_type` schemas with applied instructions.
+
+    See `QueryBuilder.apply` for more info applied instructions.
+    """
+    async with async_session.begin() as s:
+        query_builder = create_query_builder(model_type, query_schema, s, select_query)
+        query_builder.select = (
+            query_builder.select.offset((page - 1) * records_per_page)
+            .limit(records_per_page)
+            .options(*schema_loader_options(model_type, schema_type))
+        )
+
+        raw_models = (await s.execute(query_builder.select)).scalars().all()
+        return await _validate(s, schema_type, raw_models)
+
+
+async def get_models_by_cursor(
+    model_type: Type[Base],
+    schema_type: Type[SchemaT],
+    cursor: str | None,
+    records_per_page: int,
+    query_schema: QuerySchema,
+    select_query: Select | None = None,
+) -> CursorPageSchema[SchemaT]:
+    """Returns page of `model_type` schemas after `cursor`.
+
+    See `QueryBuilder.apply_cursor` for more info about cursor.
+
+    - Note: raises `InvalidCursorError` if `cursor` is invalid.
+    """
+    async with async_session.begin() as s:
+        query_builder = create_query_builder(model_type, query_schema, s, select_query)
+        query_builder.apply_cursor(cursor, records_per_page)
+        query_builder.select = query_builder.select.options(
+            *schema_loader_options(model_type, schema_type)
+        )
+
+        rows = (await s.execute(query_builder.select)).all()
+        page, next_cursor, prev_cursor = query_builder.cursor_page(rows)
+
+        return CursorPageSchema[schema_type](
+            items=await _validate(s, schema_type, [row[0] for row in page]),
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
+        )
+
+
+# endregion
+
+# region WorkTimes
+
+
+def _worktimes_without_photo_select() -> Select:
+    """Selects worktimes with `"exist"` or empty string instead of photo."""
+    return select(
+        WorkTime,
+    ).add_columns(
+        case(
+            (
+                or_(WorkTime.photo.isnot(None), WorkTime.photo_b64.isnot(None)),
+                "exist",
+            ),
+            else_="",
+        ).label("photo_b64")
+    )
+
+
+def _worktimes_to_full_schemas(rows: list[tuple]) -> list[WorkTimeSchemaFull]:
+    result: list[WorkTimeSchemaFull] = []
+    for worktime_raw, photo in rows:
+        worktime = WorkTimeSchema.model_validate(worktime_raw)
+        worktime_full = WorkTimeSchemaFull.model_validate(worktime)
+        worktime_full.photo_b64 = photo
+        result.append(worktime_full)
+    return result
+
+
+async def get_worktimes_without_photo(
+    page: int,
+    records_per_page: int,
+    query_schema: QuerySchema,
+) -> list[WorkTimeSchemaFull]:
+    async with async_session.begin() as s:
+        query_builder = QueryBuilder(
+            _worktimes_without_photo_select(),
+            s,
+        )
+        query_builder.apply(query_schema)
+        query_builder.select = (
+            query_builder.select.offset((page - 1) * records_per_page)
+            .limit(records_per_page)
+            .options(*schema_loader_options(WorkTime, WorkTimeSchema))
+        )
+
+        rows = (await s.execute(query_builder.select)).all()
+
+        return await s.run_sync(lambda _: _worktimes_to_full_schemas(rows))
+
+
+async def get_worktimes_without_photo_by_cursor(
+    cursor: str | None,
+    records_per_page: int,
+    query_schema: QuerySchema,
+) -> CursorPageSchema[WorkTimeSchemaFull]:
+    """Keyset pagination version of `get_worktimes_without_photo`.
+
+    - Note: raises `InvalidCursorError` if `cursor` is invalid.
+    """
+    async with async_session.begin() as s:
+        query_builder = QueryBuilder(
+            _worktimes_without_photo_select(),
+            s,
+        )
+        query_builder.apply(query_schema)
+        query_builder.apply_cursor(cursor, records_per_page)
+        query_builder.select = query_builder.select.options(
+            *schema_loader_options(WorkTime, WorkTimeSchema)
+        )
+
+        rows = (await s.execute(query_builder.select)).all()
+        page, next_cursor, prev_cursor = query_builder.cursor_page(rows)
+
+        return CursorPageSchema[WorkTimeSchemaFull](
+            items=await s.run_sync(lambda _: _worktimes_to_full_schemas(page)),
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
+        )
+
+
+async def get_worktime_photo_paths(
+    id: int,
+) -> tuple[str | None, str | None, bool] | None:
+    """Returns paths to photo and thumbnail of worktime in storage
+    and whether it has photo which isn't moved to storage yet.
+
+    Returns `None` if worktime not exist.
+    """
+    async with async_session.begin() as s:
+        row = (
+            await s.execute(
+                select(
+                    WorkTime.photo,
+                    WorkTime.photo_thumbnail,
+                    WorkTime.photo_b64.isnot(None),
+                ).filter(WorkTime.id == id)
+            )
+        ).one_or_none()
+        if row is None:
+            return None
+        photo, thumbnail, inline = row
+        return (
+            photo.path if photo is not None else None,
+            thumbnail.path if thumbnail is not None else None,
+            inline,
+        )
+
+
+async def get_worktime_inline_photo(id: int) -> str | None:
+    """Returns base64 photo of worktime which isn't moved to storage yet."""
+    async with async_session.begin() as s:
+        return (
+            await s.execute(select(WorkTime.photo_b64).filter(WorkTime.id == id))
+        ).scalar_one_or_none()
+
+
+async def get_openned_today_worktime(worker_id: int) -> WorkTimeSchema | None:
+    async with async_session.begin() as s:
+        raw_worktime = (
+            (
+                await s.execute(
+                    select(WorkTime)
+                    .filter(
+                        and_(
+                            WorkTime.worker_id == worker_id,
+                            WorkTime.work_end == null(),
+                            WorkTime.day == datetime.now().date(),
+                        )
+                    )
+                    .order_by(WorkTime.id.desc())
+                    .options(*schema_loader_options(WorkTime, WorkTimeSchema))
+                )
+            )
+            .scalars()
+            .first()
+        )
+        return await _validate_one(s, WorkTimeSchema, raw_worktime)
+
+
+# endregion
+
+
+# region Bot FSM
+
+
+async def get_fsm_record(key: str) -> tuple[str | None, dict] | None:
+    """Returns state and data of bot FSM `key` if it's not expired."""
+    async with async_session.begin() as s:
+        row = (
+            await s.execute(
+                select(BotFSMState.state, BotFSMState.data).filter(
+                    BotFSMState.key == key, BotFSMState.expires_at > datetime.now()
+                )
+            )
+        ).first()
+        return (row.state, row.data) if row else None
+
+
+async def set_fsm_record(key: str, column: any, value: any, expires_at: datetime):
+    """Sets `column` (`BotFSMState.state` or `BotFSMState.data`) of bot FSM `key`
+    and prolongs it to `expires_at`.
+
+    Other column is reset if record is expired.
+    """
+    other = BotFSMState.data if column is BotFSMState.state else BotFSMState.state
+    values = dict(key=key, state=None, data={}, expires_at=expires_at)
+    values[column.key] = value
+    query = insert(BotFSMState).values(**values)
+    query = query.on_conflict_do_update(
+        index_elements=[BotFSMState.key],
+        set_={
+            column.key: query.excluded[column.key],
+            other.key: case(
+                (BotFSMState.expires_at <= datetime.now(), query.excluded[other.key]),
+                else_=other,
+            ),
+            BotFSMState.expires_at.key: query.excluded.expires_at,
+        },
+    )
+    async with async_session.begin() as s:
+        await s.execute(query)
+
+
+async def delete_expired_fsm_records() -> int:
+    """Deletes expired bot FSM records, returns count of deleted."""
+    async with async_session.begin() as s:
+        result = await s.execute(
+            delete(BotFSMState).filter(BotFSMState.expires_at <= datetime.now())
+        )
+        return result.rowcount
+
+
+# endregion
+
+
+# region Telegram files
+
+
+async def get_telegram_file_ids(paths: list[str]) -> dict[str, str]:
+    """Returns telegram file ids of files stored by `paths`."""
+    if len(paths) == 0:
+        return {}
+    async with async_session.begin() as s:
+        rows = (
+            await s.execute(
+                select(TelegramFile.path, TelegramFile.file_id).filter(
+                    TelegramFile.path.in_(paths)
+                )
+            )
+        ).all()
+        return {row.path: row.file_id for row in rows}
+
+
+async def set_telegram_file_ids(file_ids: dict[str, str]):
+    """Saves telegram file ids by paths of stored files."""
+    if len(file_ids) == 0:
+        return
+    query = insert(TelegramFile).values(
+        [dict(path=path, file_id=file_id) for path, file_id in file_ids.items()]
+    )
+    query = query.on_conflict_do_update(
+        index_elements=[TelegramFile.path],
+        set_={TelegramFile.file_id.key: query.excluded.file_id},
+    )
+    async with async_session.begin() as s:
+        await s.execute(query)
+
+
+async def delete_telegram_file_ids(paths: list[str]):
+    """Removes telegram file ids of files stored by `paths`."""
+    if len(paths) == 0:
+        return
+    async with async_session.begin() as s:
+        await s.execute(delete(TelegramFile).filter(TelegramFile.path.in_(paths)))
+
+
+# endregion
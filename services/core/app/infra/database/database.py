@@ -1,12 +1,185 @@
-from typing import Annotated
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+import threading
+from typing import Annotated, Any, AsyncIterator, Iterator
 from sqlalchemy import create_engine
-from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy.ext.asyncio import (
+    AsyncSession,
+    create_async_engine,
+    async_sessionmaker,
+)
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from app.infra.config import settings
+from app.infra.database.metrics import PoolMetrics
 from sqlalchemy.orm import mapped_column, Mapped
 
-engine = create_engine(settings.psql_dsn)
 
-session = sessionmaker(engine)
+def _owner() -> Any:
+    """Returns current asyncio task or current thread outside event loop."""
+    try:
+        return asyncio.current_task()
+    except RuntimeError:
+        return threading.get_ident()
+
+
+@dataclass
+class _Scope:
+    owner: Any
+    session: Session | AsyncSession | None = None
+
+
+class ScopedSessionMaker:
+    """Wrapper over `sessionmaker` used by orm functions.
+
+    Outside `ScopedSessionMaker.scope` behaves like `sessionmaker`.
+    Inside scope all `ScopedSessionMaker.begin` calls share one session,
+    nested calls share its transaction. Every outermost `begin` block
+    commits on exit and returns pool connection, so scope doesn't hold
+    connection while it waits for network or other threads.
+
+    - Note: scope is shared only with code running in the same task/thread
+    that opened it, spawned tasks use own sessions.
+    """
+
+    def __init__(self, maker: sessionmaker):
+        self.maker = maker
+        self._scope: ContextVar[_Scope | None] = ContextVar(
+            f"session_scope_{id(self)}", default=None
+        )
+
+    def __call__(self, **kwargs) -> Session:
+        return self.maker(**kwargs)
+
+    @contextmanager
+    def begin(self) -> Iterator[Session]:
+        scope = self._scope.get()
+        if scope is None or scope.owner != _owner():
+            with self.maker.begin() as s:
+                yield s
+            return
+
+        if scope.session is None:
+            scope.session = self.maker()
+
+        s: Session = scope.session
+        if s.in_transaction():
+            yield s
+            return
+        with s.begin():
+            yield s
+
+    @contextmanager
+    def scope(self) -> Iterator[None]:
+        """Shares one session between orm calls inside."""
+        if self._scope.get() is not None:
+            yield
+            return
+
+        scope = _Scope(owner=_owner())
+        token = self._scope.set(scope)
+        try:
+            yield
+        finally:
+            self._scope.reset(token)
+            if scope.session is not None:
+                scope.session.close()
+
+
+class AsyncScopedSessionMaker:
+    """Async version of `ScopedSessionMaker`."""
+
+    def __init__(self, maker: async_sessionmaker):
+        self.maker = maker
+        self._scope: ContextVar[_Scope | None] = ContextVar(
+            f"async_session_scope_{id(self)}", default=None
+        )
+
+    def __call__(self, **kwargs) -> AsyncSession:
+        return self.maker(**kwargs)
+
+    @asynccontextmanager
+    async def begin(self) -> AsyncIterator[AsyncSession]:
+        scope = self._scope.get()
+        if scope is None or scope.owner != _owner():
+            async with self.maker.begin() as s:
+                yield s
+            return
+
+        if scope.session is None:
+            scope.session = self.maker()
+
+        s: AsyncSession = scope.session
+        if s.in_transaction():
+            yield s
+            return
+        async with s.begin():
+            yield s
+
+    @asynccontextmanager
+    async def scope(self) -> AsyncIterator[None]:
+        """Shares one session between async orm calls inside."""
+        if self._scope.get() is not None:
+            yield
+            return
+
+        scope = _Scope(owner=_owner())
+        token = self._scope.set(scope)
+        try:
+            yield
+        finally:
+            self._scope.reset(token)
+            if scope.session is not None:
+                await scope.session.close()
+
+
+_pool_settings = dict(
+    pool_size=settings.psql_pool_size,
+    max_overflow=settings.psql_max_overflow,
+    pool_timeout=settings.psql_pool_timeout,
+    pool_recycle=settings.psql_pool_recycle,
+    pool_pre_ping=settings.psql_pool_pre_ping,
+)
+
+pool_metrics = PoolMetrics("sync")
+
+engine = create_engine(
+    settings.psql_dsn,
+    poolclass=pool_metrics.pool_class(QueuePool),
+    **_pool_settings,
+)
+pool_metrics.attach(engine)
+
+session_factory = sessionmaker(engine)
+
+session = ScopedSessionMaker(session_factory)
+
+async_pool_metrics = PoolMetrics("async")
+
+async_engine = create_async_engine(
+    settings.psql_async_dsn,
+    poolclass=async_pool_metrics.pool_class(AsyncAdaptedQueuePool),
+    **_pool_settings,
+)
+async_pool_metrics.attach(async_engine.sync_engine)
+
+async_session_factory = async_sessionmaker(async_engine)
+
+async_session = AsyncScopedSessionMaker(async_session_factory)
+
+
+@asynccontextmanager
+async def session_scope() -> AsyncIterator[None]:
+    """Shares sync and async sessions between all orm calls inside.
+
+    Used per api request and per bot update.
+    """
+    async with async_session.scope():
+        with session.scope():
+            yield
+
 
 intpk = Annotated[int, mapped_column(primary_key=True)]
 strpk = Annotated[str, mapped_column(primary_key=True)]
@@ -0,0 +1,89 @@
+from functools import lru_cache
+import typing
+from typing import Type
+from pydantic import BaseModel
+from sqlalchemy import inspect
+from sqlalchemy.orm import (
+    Load,
+    RelationshipProperty,
+    joinedload,
+    selectinload,
+)
+from sqlalchemy.orm.strategy_options import _AbstractLoad
+
+from app.infra.database.database import Base
+
+
+def _get_schema_type(annotation: typing.Any) -> Type[BaseModel] | None:
+    """Returns first pydantic model in `annotation`.
+
+    Supports `Optional`, `Union`, `list` and `Annotated`.
+    """
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation
+    for arg in typing.get_args(annotation):
+        schema_type = _get_schema_type(arg)
+        if schema_type is not None:
+            return schema_type
+    return None
+
+
+def _relationship_loader(
+    parent: _AbstractLoad | None, relationship: RelationshipProperty
+) -> _AbstractLoad:
+    """Many-to-one relationships are joined, collections are loaded by
+    separate `SELECT ... IN` query."""
+    attribute = relationship.class_attribute
+    if relationship.uselist:
+        return parent.selectinload(attribute) if parent else selectinload(attribute)
+    return parent.joinedload(attribute) if parent else joinedload(attribute)
+
+
+def _build_loaders(
+    model_type: Type[Base],
+    schema_type: Type[BaseModel],
+    parent: _AbstractLoad | None,
+    visited: frozenset[tuple[type, type]],
+) -> list[_AbstractLoad]:
+    relationships = inspect(model_type).relationships
+    hints = typing.get_type_hints(schema_type)
+    loaders: list[_AbstractLoad] = []
+
+    for field_name in schema_type.model_fields:
+        if field_name not in relationships:
+            continue
+
+        relationship = relationships[field_name]
+        loader = _relationship_loader(parent, relationship)
+
+        nested_model = relationship.mapper.class_
+        nested_schema = _get_schema_type(hints[field_name])
+        key = (nested_model, nested_schema)
+        if nested_schema is None or key in visited:
+            loaders.append(loader)
+            continue
+
+        nested_loaders = _build_loaders(
+            nested_model, nested_schema, loader, visited | {key}
+        )
+        loaders.extend(nested_loaders if nested_loaders else [loader])
+
+    return loaders
+
+
+@lru_cache
+def schema_loader_options(
+    model_type: Type[Base], schema_type: Type[BaseModel]
+) -> tuple[Load, ...]:
+    """Returns loader options which loads all `model_type` relationships
+    needed for `schema_type.model_validate`.
+
+    Loaders tree repeats `schema_type` fields shape,
+    for example for `BidSchema` loads `Bid.worker.post.scopes`,
+    `Bid.department.company`, `Bid.expenditure.fac`, `Bid.documents` etc.
+    """
+    return tuple(
+        _build_loaders(
+            model_type, schema_type, None, frozenset({(model_type, schema_type)})
+        )
+    )
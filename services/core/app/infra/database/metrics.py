@@ -0,0 +1,75 @@
+from time import perf_counter
+from typing import Any, Type
+from sqlalchemy import Engine, event
+from sqlalchemy.pool import QueuePool
+
+
+class PoolMetrics:
+    """Collects checkout statistic for engine connection pool.
+
+    Usage:
+    - Create engine with `poolclass=metrics.pool_class(QueuePool)`.
+    - Call `metrics.attach(engine)`.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._engine: Engine | None = None
+
+        self.checkouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def pool_class(self, base: Type[QueuePool]) -> Type[QueuePool]:
+        """Returns `base` subclass which measures time of connection waiting."""
+        metrics = self
+
+        class MeasuredPool(base):
+            def _do_get(self):
+                start = perf_counter()
+                try:
+                    return super()._do_get()
+                finally:
+                    metrics._observe_wait(perf_counter() - start)
+
+        return MeasuredPool
+
+    def attach(self, engine: Engine):
+        """Listens pool events of `engine`.
+
+        For async engine `AsyncEngine.sync_engine` must be passed.
+        """
+        self._engine = engine
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "invalidate", self._on_invalidate)
+
+    def snapshot(self) -> dict[str, Any]:
+        """Returns current pool state with collected statistic."""
+        pool = self._engine.pool if self._engine else None
+        return dict(
+            name=self.name,
+            size=pool.size() if isinstance(pool, QueuePool) else 0,
+            checked_out=pool.checkedout() if isinstance(pool, QueuePool) else 0,
+            overflow=pool.overflow() if isinstance(pool, QueuePool) else 0,
+            checkouts=self.checkouts,
+            connects=self.connects,
+            invalidations=self.invalidations,
+            wait_avg=self.wait_total / self.checkouts if self.checkouts else 0,
+            wait_max=self.wait_max,
+        )
+
+    def _observe_wait(self, seconds: float):
+        self.wait_total += seconds
+        self.wait_max = max(self.wait_max, seconds)
+
+    def _on_checkout(self, *_):
+        self.checkouts += 1
+
+    def _on_connect(self, *_):
+        self.connects += 1
+
+    def _on_invalidate(self, *_):
+        self.invalidations += 1
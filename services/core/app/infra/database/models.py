@@ -1,5 +1,6 @@
-from sqlalchemy import ForeignKey, CheckConstraint, BigInteger, Enum, String
+from sqlalchemy import ForeignKey, CheckConstraint, BigInteger, Enum, Index, String
 from fastapi_storages.integrations.sqlalchemy import FileType
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import mapped_column, Mapped, relationship
 from typing import Annotated, List, Optional
 from uuid import UUID
@@ -10,6 +11,19 @@ from app.infra.database.database import Base
 from app.infra.config import settings
 
 
+def trgm_index(table: str, column: str) -> Index:
+    """Returns GIN trigram index used by `ILIKE '%term%'` search.
+
+    - Note: requires `pg_trgm` extension.
+    """
+    return Index(
+        f"ix_{table}_{column}_trgm",
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "gin_trgm_ops"},
+    )
+
+
 class ApprovalStatus(enum.Enum):
     pending = 1
     approved = 2
@@ -151,6 +165,7 @@ class Post(Base):
     """Должности у работников"""
 
     __tablename__ = "posts"
+    __table_args__ = (trgm_index("posts", "name"),)
 
     def __str__(self) -> str:
         return self.name
@@ -206,6 +221,7 @@ class Department(Base):
     """Подразделения (рестораны)"""
 
     __tablename__ = "departments"
+    __table_args__ = (trgm_index("departments", "name"),)
 
     def __str__(self) -> str:
         return self.name
@@ -353,6 +369,11 @@ class Group(Base):
 
 class Worker(Base):
     __tablename__ = "workers"
+    __table_args__ = (
+        trgm_index("workers", "l_name"),
+        trgm_index("workers", "f_name"),
+        trgm_index("workers", "o_name"),
+    )
 
     def __str__(self) -> str:
         return f"{self.l_name} {self.f_name} {self.o_name}"
@@ -558,6 +579,10 @@ class Bid(Base):
     """Заявки"""
 
     __tablename__ = "bids"
+    __table_args__ = (
+        trgm_index("bids", "purpose"),
+        trgm_index("bids", "comment"),
+    )
 
     def __str__(self) -> str:
         return f"Заявка от {self.create_date.strftime('%H:%M %d.%m.%y')}"
@@ -575,7 +600,7 @@ class Bid(Base):
     activity_type: Mapped[str] = mapped_column(nullable=False)
 
     department_id: Mapped[int] = mapped_column(
-        ForeignKey("departments.id", name="department_id")
+        ForeignKey("departments.id", name="department_id"), index=True
     )
     department: Mapped["Department"] = relationship(
         "Department",
@@ -591,10 +616,12 @@ class Bid(Base):
         foreign_keys=[paying_department_id],
     )
 
-    worker_id: Mapped[int] = mapped_column(ForeignKey("workers.id"))
+    worker_id: Mapped[int] = mapped_column(ForeignKey("workers.id"), index=True)
     worker: Mapped["Worker"] = relationship("Worker", back_populates="bids")
 
-    expenditure_id: Mapped[int] = mapped_column(ForeignKey("expenditures.id"))
+    expenditure_id: Mapped[int] = mapped_column(
+        ForeignKey("expenditures.id"), index=True
+    )
     expenditure: Mapped["Expenditure"] = relationship(
         "Expenditure", back_populates="bids"
     )
@@ -605,6 +632,9 @@ class Bid(Base):
     coordinators: Mapped[List["BidCoordinator"]] = relationship(
         "BidCoordinator", cascade="all,delete"
     )
+    inbox: Mapped[Optional["BidInbox"]] = relationship(
+        "BidInbox", back_populates="bid", cascade="all,delete"
+    )
 
     # States
     fac_state: Mapped[approvalstatus]
@@ -618,6 +648,53 @@ class Bid(Base):
     teller_card_state: Mapped[approvalstatus]
 
 
+# Bid states in coordination order.
+bid_states = [
+    "fac_state",
+    "cc_state",
+    "paralegal_state",
+    "kru_state",
+    "owner_state",
+    "accountant_card_state",
+    "accountant_cash_state",
+    "teller_card_state",
+    "teller_cash_state",
+]
+
+
+class BidInbox(Base):
+    """Заявки, ожидающие согласования.
+
+    Row exists while bid has state with `ApprovalStatus.pending_approval`,
+    `state_name` is this state.
+    Coordinator is specified for personal states (`fac_state`, `cc_state`,
+    `paralegal_state`), department for `teller_cash_state`,
+    other states are coordinated by scope.
+    """
+
+    __tablename__ = "bid_inbox"
+    __table_args__ = (
+        Index("ix_bid_inbox_coordinator", "coordinator_id", "state_name"),
+        Index("ix_bid_inbox_department", "department_id", "state_name"),
+    )
+
+    bid_id: Mapped[int] = mapped_column(
+        ForeignKey("bids.id", ondelete="CASCADE"), unique=True
+    )
+    bid: Mapped["Bid"] = relationship("Bid", back_populates="inbox")
+
+    state_name: Mapped[str] = mapped_column(nullable=False, index=True)
+
+    coordinator_id: Mapped[int] = mapped_column(ForeignKey("workers.id"), nullable=True)
+    coordinator: Mapped[Optional["Worker"]] = relationship("Worker")
+    department_id: Mapped[int] = mapped_column(
+        ForeignKey("departments.id"), nullable=True
+    )
+    department: Mapped[Optional["Department"]] = relationship("Department")
+
+    since: Mapped[datetime.datetime] = mapped_column(nullable=False)
+
+
 class BidCoordinator(Base):
     """Таблица, показывающая - кто согласовывал заявки."""
 
@@ -784,17 +861,27 @@ class WorkTime(Base):
     """Табель работы"""
 
     __tablename__ = "work_times"
+    __table_args__ = (
+        # Photos which are not moved to storage yet.
+        Index(
+            "ix_work_times_inline_photo",
+            "id",
+            postgresql_where="photo IS NULL AND photo_b64 IS NOT NULL",
+        ),
+    )
 
-    worker_id: Mapped[int] = mapped_column(ForeignKey("workers.id"))
+    worker_id: Mapped[int] = mapped_column(ForeignKey("workers.id"), index=True)
     worker: Mapped["Worker"] = relationship("Worker", back_populates="work_times")
 
     company_id: Mapped[int] = mapped_column(ForeignKey("companies.id"), nullable=True)
     company: Mapped["Company"] = relationship("Company", back_populates="work_times")
 
-    post_id: Mapped[int] = mapped_column(ForeignKey("posts.id"), nullable=False)
+    post_id: Mapped[int] = mapped_column(
+        ForeignKey("posts.id"), nullable=False, index=True
+    )
     post: Mapped["Post"] = relationship("Post", back_populates="work_times")
 
-    department_id: Mapped[int] = mapped_column(ForeignKey("departments.id"))
+    department_id: Mapped[int] = mapped_column(ForeignKey("departments.id"), index=True)
     department: Mapped["Department"] = relationship(
         "Department", back_populates="work_times"
     )
@@ -807,13 +894,24 @@ class WorkTime(Base):
     rating: Mapped[int] = mapped_column(nullable=True)
     fine: Mapped[int] = mapped_column(nullable=True)
     salary: Mapped[int] = mapped_column(nullable=True)
+    # Inline photo, it's moved to `photo` by `move_worktime_photos`.
     photo_b64: Mapped[str] = mapped_column(nullable=True, deferred=True)
+    photo: Mapped[FileType] = mapped_column(
+        FileType(storage=settings.storage), nullable=True
+    )
+    photo_thumbnail: Mapped[FileType] = mapped_column(
+        FileType(storage=settings.storage), nullable=True
+    )
 
 
 class Expenditure(Base):
     """Статьи"""
 
     __tablename__ = "expenditures"
+    __table_args__ = (
+        trgm_index("expenditures", "name"),
+        trgm_index("expenditures", "chapter"),
+    )
 
     name: Mapped[str] = mapped_column(nullable=False)
     chapter: Mapped[str] = mapped_column(nullable=False)
@@ -1506,3 +1604,31 @@ class CleaningRequest(Base):
     reopen_confirmation_date: Mapped[datetime.datetime] = mapped_column(nullable=True)
     close_date: Mapped[datetime.datetime] = mapped_column(nullable=True)
     close_description: Mapped[str] = mapped_column(nullable=True)
+
+
+class BotFSMState(Base):
+    """Состояния FSM бота.
+
+    Row is identified by `key` built from aiogram `StorageKey`,
+    it's ignored after `expires_at`.
+    """
+
+    __tablename__ = "bot_fsm_states"
+
+    key: Mapped[str] = mapped_column(unique=True)
+    state: Mapped[Optional[str]] = mapped_column(nullable=True)
+    data: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict)
+    expires_at: Mapped[datetime.datetime] = mapped_column(nullable=False, index=True)
+
+
+class TelegramFile(Base):
+    """Telegram идентификаторы сохраненных файлов.
+
+    File stored by `path` is sent by bot by `file_id`
+    after its first upload.
+    """
+
+    __tablename__ = "telegram_files"
+
+    path: Mapped[str] = mapped_column(unique=True)
+    file_id: Mapped[str] = mapped_column(nullable=False)
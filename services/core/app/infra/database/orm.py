@@ -1,13 +1,26 @@
 from datetime import datetime, date
-from io import BytesIO
-from typing import Any, Callable, Optional, Type, TypeVar
+from typing import Any, BinaryIO, Callable, Iterator, Optional, Type, TypeVar
+from fastapi import UploadFile
 from pydantic import BaseModel
 from sqlalchemy.sql.expression import func
 from sqlalchemy.orm import selectinload, Session
-from sqlalchemy import Select, case, null, or_, and_, desc, select, inspect, update
+from sqlalchemy import (
+    Select,
+    case,
+    event,
+    null,
+    or_,
+    and_,
+    desc,
+    select,
+    inspect,
+    update,
+)
 import pytz
 
+from app.infra.cache import TTLCache
 from app.infra.database.query import QueryBuilder
+from app.infra.database.loading import schema_loader_options
 from app.adapters.output.file.export import XlSXWriterExporter
 from app.infra.database.database import Base, engine, session
 from app.infra.config import settings
@@ -15,6 +28,7 @@ from app.infra.database.models import (
     Bid,
     BidCoordinator,
     BidDocument,
+    BidInbox,
     BudgetRecord,
     EquipmentIncident,
     EquipmentStatus,
@@ -54,6 +68,7 @@ from app.infra.database.models import (
     CleaningRequest,
     CleaningRequestCleaningPhoto,
     CleaningRequestProblemPhoto,
+    bid_states,
 )
 from app.schemas import (
     BidSchema,
@@ -103,6 +118,78 @@ def find_worker_by_column(column: any, value: any) -> WorkerSchema:
         return WorkerSchema.model_validate(raw_worker)
 
 
+# Workers by telegram id, `None` is cached for unknown telegram ids.
+worker_cache: TTLCache[int, WorkerSchema | None] = TTLCache(
+    ttl=settings.worker_cache_ttl, maxsize=4096
+)
+_not_cached = object()
+
+
+def _clear_worker_cache(*_):
+    worker_cache.clear()
+
+
+# Cached workers contain post with scopes and department.
+for _model in (PostScope, Post, Department):
+    for _event in ("after_insert", "after_update", "after_delete"):
+        event.listen(_model, _event, _clear_worker_cache)
+
+
+# Principals of verified api tokens by token hash.
+principal_cache: TTLCache[str, Any] = TTLCache(
+    ttl=settings.principal_cache_ttl, maxsize=4096
+)
+
+# Worker fields which principal depends on.
+_principal_fields = (
+    "phone_number",
+    "f_name",
+    "l_name",
+    "password",
+    "can_use_crm",
+    "post_id",
+)
+
+
+def _clear_principal_cache(_, __, worker: Worker):
+    state = inspect(worker)
+    if any(state.attrs[field].history.has_changes() for field in _principal_fields):
+        principal_cache.clear()
+
+
+event.listen(Worker, "after_update", _clear_principal_cache)
+event.listen(Worker, "after_delete", lambda *_: principal_cache.clear())
+
+
+def find_worker_by_telegram_id(telegram_id: int) -> WorkerSchema | None:
+    """
+    Returns worker by `telegram_id` from `worker_cache` or database.
+    If worker not exist return `None`.
+    """
+    worker = worker_cache.get(int(telegram_id), _not_cached)
+    if worker is _not_cached:
+        worker = find_worker_by_column(Worker.telegram_id, telegram_id)
+        worker_cache.set(int(telegram_id), worker)
+    return worker.model_copy(deep=True) if worker else None
+
+
+def invalidate_worker_cache(*telegram_ids: int | None):
+    """Removes workers with `telegram_ids` from `worker_cache`."""
+    for telegram_id in telegram_ids:
+        if telegram_id is not None:
+            worker_cache.pop(int(telegram_id))
+
+
+def _invalidate_changed_worker(_, __, worker: Worker):
+    """Removes `worker` from `worker_cache` by his current and old telegram id."""
+    history = inspect(worker).attrs["telegram_id"].history
+    invalidate_worker_cache(worker.telegram_id, *history.deleted)
+
+
+for _event in ("after_insert", "after_update", "after_delete"):
+    event.listen(Worker, _event, _invalidate_changed_worker)
+
+
 def find_workers_by_name(name: str) -> list[WorkerSchema]:
     """
     Returns workers in database by given `name`.
@@ -238,6 +325,113 @@ def add_documents_to_bid(id, documents: list[DocumentSchema]):
             s.add(BidDocument(bid=bid, document=document.document))
 
 
+def _get_inbox_coordinator(
+    s: Session, bid: Bid, state_name: str
+) -> tuple[Worker | None, Department | None]:
+    """Returns coordinator and department responsible for `state_name`."""
+    match state_name:
+        case "fac_state" | "cc_state" | "paralegal_state":
+            expenditure = _get_related(s, bid, "expenditure", Expenditure)
+            if expenditure is None:
+                return None, None
+            coordinator = state_name.removesuffix("_state")
+            return _get_related(s, expenditure, coordinator, Worker), None
+        case "teller_cash_state":
+            return None, _get_related(s, bid, "paying_department", Department)
+    return None, None
+
+
+def _get_related(s: Session, model: Base, relationship: str, related_type: type):
+    """Returns `model` many-to-one `relationship`, which may be changed
+    by object or by id without flush yet."""
+    foreign_key = f"{relationship}_id"
+    if inspect(model).attrs[foreign_key].history.has_changes():
+        related_id = getattr(model, foreign_key)
+        return s.get(related_type, related_id) if related_id is not None else None
+    return getattr(model, relationship)
+
+
+def update_bid_inbox(s: Session, bid: Bid):
+    """Syncs `BidInbox` row of `bid` with its states inside `s` transaction.
+
+    Called on flush of every changed bid, see `_sync_bid_inboxes`.
+    """
+    state_name = next(
+        (
+            name
+            for name in bid_states
+            if getattr(bid, name) == ApprovalStatus.pending_approval
+        ),
+        None,
+    )
+    inbox = bid.inbox
+
+    if state_name is None:
+        if inbox is not None:
+            s.delete(inbox)
+        return
+
+    if inbox is None:
+        inbox = BidInbox(bid=bid, since=datetime.now())
+        s.add(inbox)
+    elif inbox.state_name != state_name:
+        inbox.since = datetime.now()
+
+    inbox.state_name = state_name
+    inbox.coordinator, inbox.department = _get_inbox_coordinator(s, bid, state_name)
+
+
+# Bid fields which inbox depends on.
+_bid_inbox_fields = (
+    *bid_states,
+    "expenditure",
+    "expenditure_id",
+    "paying_department",
+    "paying_department_id",
+)
+
+# Expenditure coordinators by personal bid states.
+_expenditure_coordinators = {
+    "fac_state": "fac",
+    "cc_state": "cc",
+    "paralegal_state": "paralegal",
+}
+
+
+def _has_changes(model: Base, fields: tuple[str, ...]) -> bool:
+    state = inspect(model)
+    return any(state.attrs[field].history.has_changes() for field in fields)
+
+
+def _sync_bid_inboxes(s: Session, *_):
+    """Keeps `BidInbox` in sync with bids and expenditures changed
+    by any writer (orm functions, admin, etc.)."""
+    for model in (*s.new, *s.dirty):
+        if isinstance(model, Bid) and (
+            model in s.new or _has_changes(model, _bid_inbox_fields)
+        ):
+            update_bid_inbox(s, model)
+        elif isinstance(model, Expenditure) and model not in s.new:
+            # Pending bids of expenditure move to new coordinators.
+            for state_name, coordinator in _expenditure_coordinators.items():
+                if not _has_changes(model, (coordinator, f"{coordinator}_id")):
+                    continue
+                inboxes = s.scalars(
+                    select(BidInbox)
+                    .join(BidInbox.bid)
+                    .filter(
+                        BidInbox.state_name == state_name,
+                        Bid.expenditure_id == model.id,
+                    )
+                )
+                worker = _get_related(s, model, coordinator, Worker)
+                for inbox in inboxes:
+                    inbox.coordinator = worker
+
+
+event.listen(Session, "before_flush", _sync_bid_inboxes)
+
+
 def add_bid(bid: BidSchema) -> BidSchema:
     """
     Adds `bid` to database.
@@ -359,23 +553,8 @@ def get_pending_bids_by_worker(worker: WorkerSchema) -> list[BidSchema]:
     """
     with session.begin() as s:
         raw_bids = (
-            s.query(Bid)
-            .filter(
-                and_(
-                    Bid.worker_id == worker.id,
-                    or_(
-                        Bid.fac_state == ApprovalStatus.pending_approval,
-                        Bid.cc_state == ApprovalStatus.pending_approval,
-                        Bid.paralegal_state == ApprovalStatus.pending_approval,
-                        Bid.accountant_card_state == ApprovalStatus.pending_approval,
-                        Bid.accountant_cash_state == ApprovalStatus.pending_approval,
-                        Bid.teller_card_state == ApprovalStatus.pending_approval,
-                        Bid.teller_cash_state == ApprovalStatus.pending_approval,
-                        Bid.kru_state == ApprovalStatus.pending_approval,
-                        Bid.owner_state == ApprovalStatus.pending_approval,
-                    ),
-                )
-            )
+            s.execute(select(Bid).join(Bid.inbox).filter(Bid.worker_id == worker.id))
+            .scalars()
             .all()
         )
         return [BidSchema.model_validate(raw_bid) for raw_bid in raw_bids]
@@ -388,7 +567,13 @@ def get_specified_pending_bids(pending_column) -> list[BidSchema]:
     """
     with session.begin() as s:
         raw_bids = (
-            s.query(Bid).filter(pending_column == ApprovalStatus.pending_approval).all()
+            s.execute(
+                select(Bid)
+                .join(Bid.inbox)
+                .filter(BidInbox.state_name == pending_column.key)
+            )
+            .scalars()
+            .all()
         )
         return [BidSchema.model_validate(raw_bid) for raw_bid in raw_bids]
 
@@ -403,13 +588,15 @@ def get_specified_pending_bids_for_teller_cash(tg_id: int) -> list[BidSchema]:
             s.query(Worker).filter(Worker.telegram_id == tg_id).first().department_id
         )
         raw_bids = (
-            s.query(Bid)
-            .filter(
-                and_(
-                    Bid.teller_cash_state == ApprovalStatus.pending_approval,
-                    Bid.paying_department_id == department_id,
+            s.execute(
+                select(Bid)
+                .join(Bid.inbox)
+                .filter(
+                    BidInbox.department_id == department_id,
+                    BidInbox.state_name == "teller_cash_state",
                 )
             )
+            .scalars()
             .all()
         )
         return [BidSchema.model_validate(raw_bid) for raw_bid in raw_bids]
@@ -420,29 +607,13 @@ def get_pending_bids_for_cc_fac(tg_id: int) -> list[BidSchema]:
         worker_id = s.execute(
             select(Worker.id).filter(Worker.telegram_id == tg_id)
         ).scalar_one()
-        fac_expenditures_ids = (
-            s.execute(select(Expenditure.id).filter(Expenditure.fac_id == worker_id))
-            .scalars()
-            .all()
-        )
-        cc_expenditures_ids = (
-            s.execute(select(Expenditure.id).filter(Expenditure.cc_id == worker_id))
-            .scalars()
-            .all()
-        )
         raw_bids = (
             s.execute(
-                select(Bid).filter(
-                    or_(
-                        and_(
-                            Bid.expenditure_id.in_(cc_expenditures_ids),
-                            Bid.cc_state == ApprovalStatus.pending_approval,
-                        ),
-                        and_(
-                            Bid.expenditure_id.in_(fac_expenditures_ids),
-                            Bid.fac_state == ApprovalStatus.pending_approval,
-                        ),
-                    )
+                select(Bid)
+                .join(Bid.inbox)
+                .filter(
+                    BidInbox.coordinator_id == worker_id,
+                    BidInbox.state_name.in_(["fac_state", "cc_state"]),
                 )
             )
             .scalars()
@@ -623,8 +794,12 @@ def get_workers_with_post_by_column(column: Any, value: Any) -> list[WorkerSchem
     Returns all `Worker` as `WorkerSchema` in database
     by `column` with `value`.
 
-    Using `get_workers_with_post_by_columns`.
+    Using `get_workers_with_post_by_columns`,
+    workers by `Worker.telegram_id` are taken from `worker_cache`.
     """
+    if column is Worker.telegram_id and value is not None:
+        worker = find_worker_by_telegram_id(value)
+        return [worker] if worker else []
     return get_workers_with_post_by_columns([column], [value])
 
 
@@ -1655,9 +1830,11 @@ def get_models(
     """
     with session.begin() as s:
         query_builder = create_query_builder(model_type, query_schema, s, select_query)
-        query_builder.select = query_builder.select.offset(
-            (page - 1) * records_per_page
-        ).limit(records_per_page)
+        query_builder.select = (
+            query_builder.select.offset((page - 1) * records_per_page)
+            .limit(records_per_page)
+            .options(*schema_loader_options(model_type, schema_type))
+        )
 
         return [
             schema_type.model_validate(raw_model)
@@ -1672,13 +1849,19 @@ def export_models(
     exclude_columns: list[str] = [],
     aliases: dict[str, str] = {},
     select_query: Select | None = None,
-) -> BytesIO:
-    """Returns xlsx file with `model_type` records filtered by `query_schema`."""
+    progress: Callable[[int], None] | None = None,
+) -> BinaryIO:
+    """Returns xlsx file with `model_type` records filtered by `query_schema`.
+
+    Records are streamed from database directly to file.
+
+    :param progress: Called with count of written records.
+    """
     with session.begin() as s:
         query_builder = create_query_builder(model_type, query_schema, s, select_query)
         exporter = XlSXWriterExporter(formatters, exclude_columns, aliases)
 
-        return query_builder.export(exporter)
+        return query_builder.export(exporter, progress)
 
 
 # endregion
@@ -1735,81 +1918,126 @@ def get_timesheet_count(query_schema: QuerySchema) -> int:
         return count if count is not None else 0
 
 
-def get_timesheets(
-    query_schema: QuerySchema,
-    page: int | None = None,
-    records_per_page: int | None = None,
-) -> list[TimeSheetSchema]:
-    with session.begin() as s:
-        local = pytz.timezone(settings.timezone)
+def _timesheet_selects(
+    query_schema: QuerySchema, s: Session
+) -> tuple[Select, Select, Select]:
+    """Returns selects of workers, their shift durations per day
+    and total durations with shifts count for timesheets."""
+    local = pytz.timezone(settings.timezone)
 
-        start = (
-            query_schema.date_query.start.astimezone(local)
-            if query_schema.date_query.start.tzinfo
-            else local.localize(query_schema.date_query.start)
-        )
+    start = (
+        query_schema.date_query.start.astimezone(local)
+        if query_schema.date_query.start.tzinfo
+        else local.localize(query_schema.date_query.start)
+    )
 
-        end = (
-            query_schema.date_query.end.astimezone(local)
-            if query_schema.date_query.end.tzinfo
-            else local.localize(query_schema.date_query.end)
-        )
+    end = (
+        query_schema.date_query.end.astimezone(local)
+        if query_schema.date_query.end.tzinfo
+        else local.localize(query_schema.date_query.end)
+    )
 
-        query_schema.date_query = None
+    query_schema.date_query = None
+
+    if query_schema.order_by_query:
+        if query_schema.order_by_query.column == "worker_fullname":
+            query_schema.order_by_query.column = "l_name"
+        elif query_schema.order_by_query.column == "post_name":
+            query_schema.order_by_query.column = "post"
+        elif query_schema.order_by_query.column == "department_name":
+            query_schema.order_by_query.column = "department"
+
+    query_builder = create_query_builder(Worker, query_schema, s)
+
+    workers_sel = query_builder.select
+    w_sub = workers_sel.subquery()
+
+    # Worker id, worktime id, day, duration
+    per_day_sel = (
+        select(
+            w_sub.c.id,
+            WorkTime.id,
+            WorkTime.day,
+            func.sum(WorkTime.work_duration).label("hours"),
+        )
+        .join(w_sub, w_sub.c.id == WorkTime.worker_id)
+        .group_by(w_sub.c.id, WorkTime.day, WorkTime.id)
+        .where(
+            WorkTime.work_duration != null(),
+            WorkTime.work_duration != 0,
+            WorkTime.work_begin != null(),
+            WorkTime.work_end != null(),
+            WorkTime.work_begin >= start,
+            WorkTime.work_end <= end,
+        )
+        .having(
+            WorkTime.day != null(),
+            func.sum(WorkTime.work_duration) > 0,
+        )
+        .order_by(WorkTime.day)
+    )
 
-        if query_schema.order_by_query:
-            if query_schema.order_by_query.column == "worker_fullname":
-                query_schema.order_by_query.column = "l_name"
-            elif query_schema.order_by_query.column == "post_name":
-                query_schema.order_by_query.column = "post"
-            elif query_schema.order_by_query.column == "department_name":
-                query_schema.order_by_query.column = "department"
+    # Worker id, total duration, total shifts
+    total_sel = (
+        select(w_sub.c.id, func.sum(WorkTime.work_duration), func.count())
+        .join(w_sub, w_sub.c.id == WorkTime.worker_id)
+        .where(
+            WorkTime.work_duration != null(),
+            WorkTime.work_duration != 0,
+            WorkTime.work_begin != null(),
+            WorkTime.work_end != null(),
+            WorkTime.work_begin >= start,
+            WorkTime.work_end <= end,
+        )
+        .having(func.count() > 0)
+        .group_by(w_sub.c.id)
+    )
 
-        query_builder = create_query_builder(Worker, query_schema, s)
+    return workers_sel, per_day_sel, total_sel
 
-        workers_sel = query_builder.select
-        w_sub = workers_sel.subquery()
 
-        # Worker id, worktime id, day, duration
-        per_day_sel = (
-            select(
-                w_sub.c.id,
-                WorkTime.id,
-                WorkTime.day,
-                func.sum(WorkTime.work_duration).label("hours"),
-            )
-            .join(w_sub, w_sub.c.id == WorkTime.worker_id)
-            .group_by(w_sub.c.id, WorkTime.day, WorkTime.id)
-            .where(
-                WorkTime.work_duration != null(),
-                WorkTime.work_duration != 0,
-                WorkTime.work_begin != null(),
-                WorkTime.work_end != null(),
-                WorkTime.work_begin >= start,
-                WorkTime.work_end <= end,
-            )
-            .having(
-                WorkTime.day != null(),
-                func.sum(WorkTime.work_duration) > 0,
-            )
-            .order_by(WorkTime.day)
+def _build_timesheets(
+    workers: list[Worker],
+    totals: list[tuple[int, float, int]],
+    per_days: list[tuple[int, int, date, float]],
+) -> list[TimeSheetSchema]:
+    total_dict = {total[0]: (total[1], total[2]) for total in totals}
+    per_days_dict: dict[int, dict[date, ShiftDurationSchema]] = {}
+
+    for worker_id, worktime_id, day, duration in per_days:
+        per_days_dict.setdefault(worker_id, {})[day] = ShiftDurationSchema(
+            duration=duration, worktime_id=worktime_id
         )
 
-        # Worker id, total duration, total shifts
-        total_sel = (
-            select(w_sub.c.id, func.sum(WorkTime.work_duration), func.count())
-            .join(w_sub, w_sub.c.id == WorkTime.worker_id)
-            .where(
-                WorkTime.work_duration != null(),
-                WorkTime.work_duration != 0,
-                WorkTime.work_begin != null(),
-                WorkTime.work_end != null(),
-                WorkTime.work_begin >= start,
-                WorkTime.work_end <= end,
-            )
-            .having(func.count() > 0)
-            .group_by(w_sub.c.id)
+    result: list[TimeSheetSchema] = []
+
+    for worker in workers:
+        worker_fullname = f"{worker.l_name} {worker.f_name} {worker.o_name}"
+        post_name = worker.post.name
+        total_hours, total_shifts = total_dict.get(worker.id, (0, 0))
+        duration_per_day = per_days_dict.get(worker.id, {})
+
+        timesheet = TimeSheetSchema(
+            id=worker.id,
+            worker_fullname=worker_fullname,
+            post_name=post_name,
+            department_name=worker.department.name,
+            total_hours=total_hours,
+            total_shifts=total_shifts,
+            duration_per_day=duration_per_day,
         )
+        result.append(timesheet)
+
+    return result
+
+
+def get_timesheets(
+    query_schema: QuerySchema,
+    page: int | None = None,
+    records_per_page: int | None = None,
+) -> list[TimeSheetSchema]:
+    with session.begin() as s:
+        workers_sel, per_day_sel, total_sel = _timesheet_selects(query_schema, s)
 
         if records_per_page is not None and query_schema is not None:
             total_sel = total_sel.offset((page - 1) * records_per_page).limit(
@@ -1826,34 +2054,33 @@ def get_timesheets(
             .all()
         )
 
-        total_dict = {total[0]: (total[1], total[2]) for total in totals}
-        per_days_dict: dict[int, dict[date, ShiftDurationSchema]] = {}
+        return _build_timesheets(workers, totals, per_days)
 
-        for worker_id, worktime_id, day, duration in per_days:
-            per_days_dict.setdefault(worker_id, {})[day] = ShiftDurationSchema(
-                duration=duration, worktime_id=worktime_id
-            )
 
-        result: list[TimeSheetSchema] = []
+def iter_timesheets(
+    query_schema: QuerySchema, batch_size: int = 500
+) -> Iterator[TimeSheetSchema]:
+    """Yields timesheets of all workers with shifts filtered by `query_schema`.
 
-        for worker in workers:
-            worker_fullname = f"{worker.l_name} {worker.f_name} {worker.o_name}"
-            post_name = worker.post.name
-            total_hours, total_shifts = total_dict.get(worker.id, (0, 0))
-            duration_per_day = per_days_dict.get(worker.id, {})
+    Workers are fetched from server side cursor by `batch_size` rows,
+    their shifts are loaded for every batch.
+    """
+    with session.begin() as s:
+        workers_sel, per_day_sel, total_sel = _timesheet_selects(query_schema, s)
+        worker_id = total_sel.selected_columns[0]
+        with_shifts = select(total_sel.subquery().c[0])
 
-            timesheet = TimeSheetSchema(
-                id=worker.id,
-                worker_fullname=worker_fullname,
-                post_name=post_name,
-                department_name=worker.department.name,
-                total_hours=total_hours,
-                total_shifts=total_shifts,
-                duration_per_day=duration_per_day,
-            )
-            result.append(timesheet)
+        workers = s.execute(
+            workers_sel.where(Worker.id.in_(with_shifts))
+            .options(selectinload(Worker.post), selectinload(Worker.department))
+            .execution_options(yield_per=batch_size)
+        ).scalars()
 
-        return result
+        for batch in workers.partitions():
+            ids = [worker.id for worker in batch]
+            totals = s.execute(total_sel.where(worker_id.in_(ids))).all()
+            per_days = s.execute(per_day_sel.where(worker_id.in_(ids))).all()
+            yield from _build_timesheets(batch, totals, per_days)
 
 
 # region Bids
@@ -1861,22 +2088,13 @@ def get_timesheets(
 
 def create_fac_or_cc_select_query(phone: str) -> Select:
     worker_id = select(Worker.id).filter(Worker.phone_number == phone)
-    fac_expenditures = select(Expenditure.id).filter(Expenditure.fac_id.in_(worker_id))
-    cc_expenditures = select(Expenditure.id).filter(Expenditure.cc_id.in_(worker_id))
-
-    bids_select = select(Bid).filter(
-        or_(
-            and_(
-                Bid.expenditure_id.in_(fac_expenditures),
-                Bid.fac_state == "pending_approval",
-            ),
-            and_(
-                Bid.expenditure_id.in_(cc_expenditures),
-                Bid.cc_state == "pending_approval",
-            ),
-        )
+    pending_bids = select(BidInbox.bid_id).filter(
+        BidInbox.coordinator_id.in_(worker_id),
+        BidInbox.state_name.in_(["fac_state", "cc_state"]),
     )
 
+    bids_select = select(Bid).filter(Bid.id.in_(pending_bids))
+
     return bids_select
 
 
@@ -1895,7 +2113,7 @@ def get_worktimes_without_photo(
         ).add_columns(
             case(
                 (
-                    WorkTime.photo_b64.isnot(None),
+                    or_(WorkTime.photo.isnot(None), WorkTime.photo_b64.isnot(None)),
                     "exist",
                 ),
                 else_="",
@@ -1906,9 +2124,11 @@ def get_worktimes_without_photo(
             s,
         )
         query_builder.apply(query_schema)
-        query_builder.select = query_builder.select.offset(
-            (page - 1) * records_per_page
-        ).limit(records_per_page)
+        query_builder.select = (
+            query_builder.select.offset((page - 1) * records_per_page)
+            .limit(records_per_page)
+            .options(*schema_loader_options(WorkTime, WorkTimeSchema))
+        )
 
         rows = s.execute(query_builder.select).all()
 
@@ -1923,11 +2143,55 @@ def get_worktimes_without_photo(
         return result
 
 
-def get_worktime_photo(id: int) -> str:
+def get_worktime_ids_with_inline_photo(after_id: int, limit: int) -> list[int]:
+    """Returns ids of worktimes with photo which isn't moved to storage,
+    ordered by id and starting after `after_id`."""
     with session.begin() as s:
-        return s.execute(
-            select(WorkTime.photo_b64).filter(WorkTime.id == id)
-        ).scalar_one()
+        return (
+            s.execute(
+                select(WorkTime.id)
+                .filter(
+                    WorkTime.photo.is_(None),
+                    WorkTime.photo_b64.isnot(None),
+                    WorkTime.id > after_id,
+                )
+                .order_by(WorkTime.id)
+                .limit(limit)
+            )
+            .scalars()
+            .all()
+        )
+
+
+def move_worktime_photo(
+    id: int, convert: Callable[[str], tuple[UploadFile, UploadFile | None]]
+) -> bool:
+    """Saves photo and thumbnail of worktime to storage, they are created
+    by `convert` from base64 photo.
+
+    Row is locked while photo is moved, returns `False` if photo
+    is already moved or is being moved by other process.
+    """
+    with session.begin() as s:
+        photo_b64 = s.execute(
+            select(WorkTime.photo_b64)
+            .filter(
+                WorkTime.id == id,
+                WorkTime.photo.is_(None),
+                WorkTime.photo_b64.isnot(None),
+            )
+            .with_for_update(skip_locked=True)
+        ).scalar_one_or_none()
+        if photo_b64 is None:
+            return False
+
+        photo, thumbnail = convert(photo_b64)
+        s.execute(
+            update(WorkTime)
+            .filter(WorkTime.id == id)
+            .values(photo=photo, photo_thumbnail=thumbnail)
+        )
+        return True
 
 
 def get_openned_today_worktime(worker_id: int) -> WorkTimeSchema | None:
@@ -2350,12 +2614,11 @@ def set_department_for_worker(telegram_id: int, department_name: str) -> bool:
             s.query(Department).filter(Department.name == department_name).first()
         )
 
-        if department:
-            worker.department = department
-            worker.department_id = department.id
-            return True
-        else:
+        if not department:
             return False
+        worker.department = department
+        worker.department_id = department.id
+    return True
 
 
 # region Equipment statuses and incidents
@@ -2687,7 +2950,7 @@ def set_tellers_cash_department() -> list[WorkerSchema]:
             teller.department = department
             teller_schemas.append(WorkerSchema.model_validate(teller))
 
-        return teller_schemas
+    return teller_schemas
 
 
 def add_coordinator_to_bid(bid_id, coordinator_id: int):
@@ -1,12 +1,22 @@
-from io import BytesIO
-from typing import Callable, Type
+import base64
+from dataclasses import dataclass
+from functools import lru_cache
+import json
+import math
+from typing import Any, BinaryIO, Callable, Iterator, Sequence, Type
 import typing
 from abc import ABC
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import to_jsonable_python
 from sqlalchemy import (
     BinaryExpression,
     Result,
+    Row,
     Select,
+    ColumnElement,
     and_,
+    bindparam,
+    false,
     or_,
     desc,
     select,
@@ -15,28 +25,147 @@ from sqlalchemy import (
     String,
 )
 from sqlalchemy.orm import InstrumentedAttribute, Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.infra.cache import TTLCache
+from app.infra.config import settings
 from app.infra.logging import logger
 import app.infra.database.models as models
 from app.infra.database.database import Base
+from app.infra.database.loading import schema_loader_options
 
 from app import schemas
 
 from app.contracts.clients import XlSXExporter
 
 
+class InvalidCursorError(ValueError):
+    """Raised when keyset pagination cursor can't be decoded."""
+
+
+# Count query results by compiled query with parameters.
+count_cache: TTLCache[tuple[str, str], int] = TTLCache(
+    ttl=settings.psql_count_cache_ttl
+)
+
+# `QueryBuilder` plans by model and `QuerySchema` shape.
+plan_cache: TTLCache[tuple, "_QueryPlan"] = TTLCache(ttl=math.inf, maxsize=512)
+
+
+@dataclass(frozen=True)
+class _QueryPlan:
+    """Clauses of applied `QuerySchema` with values replaced
+    by named bind parameters, see `_get_query_shape`."""
+
+    date_clause: ColumnElement[bool] | None
+    filter_clause: ColumnElement[bool] | None
+    search_clause: ColumnElement[bool] | None
+    order_by_schema: schemas.OrderBySchema | None
+    order_join: InstrumentedAttribute[any] | None
+    order_columns: tuple[InstrumentedAttribute[any], ...]
+
+
+def _get_query_shape(
+    query_schema: schemas.QuerySchema,
+) -> tuple[tuple, dict[str, Any]]:
+    """Returns structure of `query_schema` without values
+    and values by bind parameter names.
+
+    Search terms and filter values are named by their position,
+    for example `search_0_1` is term of second dependency of first search.
+    """
+    params: dict[str, Any] = {}
+
+    def search_shape(search_schemas: list[schemas.SearchSchema], prefix: str):
+        shape = []
+        for index, search_schema in enumerate(search_schemas):
+            param_name = f"{prefix}_{index}"
+            params[param_name] = f"%{search_schema.term}%"
+            shape.append(
+                (
+                    search_schema.column,
+                    bool(search_schema.term),
+                    tuple(search_schema.groups),
+                    search_shape(search_schema.dependencies, param_name),
+                )
+            )
+        return tuple(shape)
+
+    def filter_shape(filter_schemas: list[schemas.FilterSchema], prefix: str):
+        shape = []
+        for index, filter_schema in enumerate(filter_schemas):
+            param_name = f"{prefix}_{index}"
+            params[param_name] = filter_schema.value
+            shape.append(
+                (
+                    filter_schema.column,
+                    filter_schema.value is None,
+                    tuple(filter_schema.groups),
+                    filter_shape(filter_schema.dependencies, param_name),
+                )
+            )
+        return tuple(shape)
+
+    date_query = query_schema.date_query
+    if date_query:
+        params["date_start"] = date_query.start
+        params["date_end"] = date_query.end
+    order_by_query = query_schema.order_by_query
+
+    shape = (
+        date_query.column if date_query else None,
+        filter_shape(query_schema.filter_query, "filter"),
+        search_shape(query_schema.search_query, "search"),
+        (order_by_query.column, order_by_query.desc) if order_by_query else None,
+    )
+    return shape, params
+
+
+@lru_cache
+def _get_schema_column_type(
+    schema_type: Type[schemas.BaseSchema], column_name: str
+) -> Type:
+    column_model_hint = typing.get_type_hints(schema_type)[column_name]
+
+    column_model_type = None
+    type_args = typing.get_args(column_model_hint)
+    if len(type_args) > 0:
+        column_model_type = typing.get_args(column_model_hint)[0]
+    else:
+        column_model_type = column_model_hint
+
+    return column_model_type
+
+
 class Builder(ABC):
     """Base class for sqlalchemy based builder.
 
     - Note:
     Builder works inside session only.
+    For `AsyncSession` use `Builder.all_async` and `Builder.count_async`.
     """
 
     name = "|BUILDER|"
 
     logger = logger
 
-    def __init__(self, initial_select: Select, session: Session):
+    # Schema to model dict
+    _schema_to_model: dict[Type[schemas.BaseSchema], Type[Base]] = {
+        schemas.WorkerSchema: models.Worker,
+        schemas.DepartmentSchema: models.Department,
+        schemas.ExpenditureSchema: models.Expenditure,
+        schemas.BidSchema: models.Bid,
+        schemas.PostSchema: models.Post,
+        schemas.BudgetRecordSchema: models.BudgetRecord,
+        schemas.WorkTimeSchema: models.WorkTime,
+    }
+
+    # Model to schema dict
+    _model_to_schema: dict[Type[Base], Type[schemas.BaseSchema]] = {
+        model: schema for schema, model in _schema_to_model.items()
+    }
+
+    def __init__(self, initial_select: Select, session: Session | AsyncSession):
         """
         :param initial_query: Initially generated query for table `model_type` by `Session`.
         """
@@ -56,46 +185,86 @@ class Builder(ABC):
         self.session = session
         self._model_type = entities[0]
 
-        # Schema to model dict
-        self._schema_to_model: dict[Type[schemas.BaseSchema], Type[Base]] = {
-            schemas.WorkerSchema: models.Worker,
-            schemas.DepartmentSchema: models.Department,
-            schemas.ExpenditureSchema: models.Expenditure,
-            schemas.BidSchema: models.Bid,
-            schemas.PostSchema: models.Post,
-            schemas.BudgetRecordSchema: models.BudgetRecord,
-            schemas.WorkTimeSchema: models.WorkTime,
-        }
-
-        # Model to schema dict
-        self._model_to_schema: dict[Type[Base], Type[schemas.BaseSchema]] = {
-            self._schema_to_model[schema]: schema for schema in self._schema_to_model
-        }
-
     def all(self) -> list[schemas.BaseSchema]:
         """Returns all entries in database with `self.query`."""
         schema_type = self._model_to_schema[self._model_type]
-        rows = self.session.execute(self.select).scalars().all()
+        rows = self.session.execute(self._loaded_select(schema_type)).scalars().all()
         return [schema_type.model_validate(model) for model in rows]
 
+    def iter_all(self, batch_size: int = 500) -> Iterator[schemas.BaseSchema]:
+        """Yields all entries in database with `self.query`.
+
+        Rows are fetched from server side cursor by `batch_size` rows.
+        """
+        schema_type = self._model_to_schema[self._model_type]
+        rows = self.session.execute(
+            self._loaded_select(schema_type).execution_options(yield_per=batch_size)
+        ).scalars()
+        for model in rows:
+            yield schema_type.model_validate(model)
+
     def count(self) -> int:
-        """Returns count of all entries in database with `self.query`."""
-        res: Result = self.session.execute(
-            select(func.count()).select_from(self.select)
+        """Returns count of all entries in database with `self.query`.
+
+        Result is cached for `settings.psql_count_cache_ttl` seconds.
+        """
+        count_select, key = self._count_select()
+        count = count_cache.get(key)
+        if count is None:
+            res: Result = self.session.execute(count_select)
+            count = res.scalar()
+            count_cache.set(key, count)
+        return count
+
+    async def all_async(self) -> list[schemas.BaseSchema]:
+        """Async version of `Builder.all`."""
+        schema_type = self._model_to_schema[self._model_type]
+        rows = (
+            (await self.session.execute(self._loaded_select(schema_type)))
+            .scalars()
+            .all()
+        )
+        return await self.session.run_sync(
+            lambda _: [schema_type.model_validate(model) for model in rows]
+        )
+
+    async def count_async(self) -> int:
+        """Async version of `Builder.count`."""
+        count_select, key = self._count_select()
+        count = count_cache.get(key)
+        if count is None:
+            res: Result = await self.session.execute(count_select)
+            count = res.scalar()
+            count_cache.set(key, count)
+        return count
+
+    def _count_select(self) -> tuple[Select, tuple[str, str]]:
+        """Returns count query for `self.select` and its cache key."""
+        count_select = select(func.count()).select_from(self.select)
+        compiled = count_select.compile()
+        return count_select, (str(compiled), repr(sorted(compiled.params.items())))
+
+    def _loaded_select(self, schema_type: Type[schemas.BaseSchema]) -> Select:
+        """Returns `self.select` with eager loading of `schema_type` relationships."""
+        return self.select.options(
+            *schema_loader_options(self._model_type, schema_type)
         )
-        return res.scalar()
 
     def _warning(self, msg: str):
         """Logs `msg`."""
         self.logger.warning(f"{self.name} {msg}")
 
-    def export(self, exporter: XlSXExporter) -> BytesIO:
-        """Generates xlsx file with data from `Builder.all`.
+    def export(
+        self,
+        exporter: XlSXExporter,
+        progress: Callable[[int], None] | None = None,
+    ) -> BinaryIO:
+        """Generates xlsx file with data from `Builder.iter_all`.
 
-        :return: Generated xlsx file in `BytesIO` representation.
+        :param progress: Called with count of written rows.
+        :return: Generated xlsx file opened for reading.
         """
-        data = self.all()
-        return exporter.export(data)
+        return exporter.export(self.iter_all(), progress=progress)
 
 
 class QueryBuilder(Builder):
@@ -110,39 +279,65 @@ class QueryBuilder(Builder):
     Filtering also supports groups, but  different groups handles by `and_` statement,
     terms inside group handles by `_or` statement.
     3) Searching use `ilike('%term%')` syntax.
+    Searched string columns have `pg_trgm` GIN indexes (see `models.trgm_index`),
+    PostgreSQL uses them for terms with 3 and more characters.
     Filtering use `column == value` syntax.
     4) Order by can work with up level field (not Dog.owner.name, only Dow.owner).
     5) Order by can applying for field inherit `schemas.BaseSchema` and simple field.
+    6) Clauses are cached in `plan_cache` by model and `QuerySchema` shape
+    (columns, groups, dependencies and order), values are passed as bind parameters.
     """
 
     name = "|QUERYBUILDER|"
 
-    def __init__(self, initial_select: Select, session: Session):
+    # Order by columns of schema tables.
+    _order_by_columns: dict[
+        Type[schemas.BaseSchema], list[InstrumentedAttribute[any]]
+    ] = {
+        schemas.WorkerSchema: [
+            models.Worker.l_name,
+            models.Worker.f_name,
+            models.Worker.o_name,
+        ],
+        schemas.DepartmentSchema: [models.Department.name],
+        schemas.ExpenditureSchema: [
+            models.Expenditure.name,
+            models.Expenditure.chapter,
+        ],
+        schemas.PostSchema: [models.Post.name],
+    }
+
+    # Search columns of schema tables.
+    _search_columns: dict[
+        Type[schemas.BaseSchema], list[InstrumentedAttribute[any]]
+    ] = {
+        schemas.WorkerSchema: [
+            models.Worker.l_name,
+            models.Worker.f_name,
+            models.Worker.o_name,
+        ],
+        schemas.DepartmentSchema: [models.Department.name],
+        schemas.ExpenditureSchema: [
+            models.Expenditure.name,
+            models.Expenditure.chapter,
+        ],
+        schemas.PostSchema: [models.Post.name],
+    }
+
+    def __init__(self, initial_select: Select, session: Session | AsyncSession):
         """
         :param initial_query: Initially generated query for table `model_type` by `Session`.
         """
         super().__init__(initial_select, session)
 
-        # Order by builders.
-        self._order_by_builders: dict[
-            schemas.BaseSchema, Callable[[InstrumentedAttribute[any], bool], Select]
-        ] = {
-            schemas.WorkerSchema: self._order_by_worker,
-            schemas.DepartmentSchema: self._order_by_department,
-            schemas.ExpenditureSchema: self._order_by_expenditure,
-            schemas.PostSchema: self._order_by_post,
-        }
-
-        # Search builders.
-        self._search_builders: dict[
-            schemas.BaseSchema,
-            Callable[[str], Select],
-        ] = {
-            schemas.WorkerSchema: self._search_by_worker,
-            schemas.DepartmentSchema: self._search_by_department,
-            schemas.ExpenditureSchema: self._search_by_expenditure,
-            schemas.PostSchema: self._search_by_post,
-        }
+        # Applied order, used by keyset pagination.
+        self._order_by_schema: schemas.OrderBySchema | None = None
+        self._order_columns: list[InstrumentedAttribute[any]] = []
+
+        # Keyset pagination state, see `QueryBuilder.apply_cursor`.
+        self._cursor_limit = 0
+        self._cursor_backward = False
+        self._cursor_applied = False
 
     def apply(self, query_schema: schemas.QuerySchema):
         """
@@ -154,37 +349,82 @@ class QueryBuilder(Builder):
         3) Search by
         4) Order by
         """
-        if query_schema.date_query:
-            self._apply_date(query_schema.date_query)
+        shape, params = _get_query_shape(query_schema)
+        key = (self._model_type, shape)
 
-        self._apply_filter(query_schema.filter_query)
+        plan = plan_cache.get(key)
+        if plan is None:
+            plan = self._build_plan(query_schema)
+            plan_cache.set(key, plan)
 
-        self._apply_search(query_schema.search_query)
-
-        if query_schema.order_by_query:
-            self._apply_order_by(query_schema.order_by_query)
+        self._apply_plan(plan, params)
 
     def _get_schema_column_type(
         self, schema_type: Type[schemas.BaseSchema], column_name: str
     ) -> Type:
-        column_model_hint = typing.get_type_hints(schema_type)[column_name]
+        return _get_schema_column_type(schema_type, column_name)
 
-        column_model_type = None
-        type_args = typing.get_args(column_model_hint)
-        if len(type_args) > 0:
-            column_model_type = typing.get_args(column_model_hint)[0]
-        else:
-            column_model_type = column_model_hint
+    # region Plan
+    def _build_plan(self, query_schema: schemas.QuerySchema) -> _QueryPlan:
+        """Builds clauses for `query_schema` shape."""
+        date_clause = None
+        if query_schema.date_query:
+            date_clause = self._get_date_clause(query_schema.date_query)
+
+        order_by_schema = query_schema.order_by_query
+        order_join, order_columns = None, None
+        if order_by_schema:
+            order_join, order_columns = self._get_order_by(order_by_schema)
+
+        return _QueryPlan(
+            date_clause=date_clause,
+            filter_clause=self._get_filter_clause(
+                self._model_type, query_schema.filter_query, "filter"
+            ),
+            search_clause=self._get_search_clause(
+                self._model_type, query_schema.search_query, "search"
+            ),
+            order_by_schema=(
+                order_by_schema.model_copy() if order_columns is not None else None
+            ),
+            order_join=order_join,
+            order_columns=order_columns or (),
+        )
+
+    def _apply_plan(self, plan: _QueryPlan, params: dict[str, Any]):
+        """Applies `plan` clauses with `params` values."""
+        for clause in (plan.date_clause, plan.filter_clause, plan.search_clause):
+            if clause is not None:
+                self.select = self.select.filter(clause.params(params))
 
-        return column_model_type
+        if plan.order_by_schema is None:
+            return
+
+        if plan.order_join is not None:
+            self.select = self.select.join(plan.order_join)
+        self._order_by_schema = plan.order_by_schema
+        self._order_columns = list(plan.order_columns)
+
+        columns = self._order_columns
+        if plan.order_by_schema.desc:
+            columns = [desc(o_column) for o_column in columns]
+        self.select = self.select.order_by(*columns)
+
+    # endregion
 
     # region Order by
-    def _apply_order_by(self, order_by_schema: schemas.OrderBySchema):
+    def _get_order_by(
+        self, order_by_schema: schemas.OrderBySchema
+    ) -> tuple[
+        InstrumentedAttribute[any] | None,
+        tuple[InstrumentedAttribute[any], ...] | None,
+    ]:
         """
-        Applies `order_by_schema`.
+        Returns relationship for join and columns for `order_by_schema`.
+
+        If order by isn't implemented for column returns `(None, None)`.
         """
         column_name = order_by_schema.column
-        is_desc = order_by_schema.desc
         model_type = self._model_type
         schema_type = self._model_to_schema[model_type]
 
@@ -192,85 +432,211 @@ class QueryBuilder(Builder):
         column = getattr(model_type, column_name)
 
         # If column is pydantic schema.
-        if column_type in self._order_by_builders:
-            builder = self._order_by_builders[column_type]
-            self.select = builder(column, is_desc)
+        if column_type in self._order_by_columns:
+            return column, tuple(self._order_by_columns[column_type])
         # If column is simple type.
         elif not issubclass(column_type, schemas.BaseSchema):
-            if is_desc:
-                column = desc(column)
-            self.select = self.select.order_by(column)
+            return None, (column,)
         # If column is schema with non implemented order by.
         else:
             self._warning(
                 f"Attempt to order by non implemented method, column type: {column_type}"
             )
+            return None, None
 
-    def _order_by_worker(
-        self, column: InstrumentedAttribute[any], is_desc: bool = False
-    ) -> Select:
-        columns = [models.Worker.l_name, models.Worker.f_name, models.Worker.o_name]
-        if is_desc:
-            columns = [desc(w_column) for w_column in columns]
-        return self.select.join(column).order_by(*columns)
+    # endregion
 
-    def _order_by_department(
-        self, column: InstrumentedAttribute[any], is_desc: bool = False
-    ) -> Select:
-        columns = [models.Department.name]
-        if is_desc:
-            columns = [desc(w_column) for w_column in columns]
-        return self.select.join(column).order_by(*columns)
+    # region Cursor
+    def apply_cursor(self, cursor: str | None, limit: int):
+        """
+        Applies keyset pagination instead of `offset`.
 
-    def _order_by_expenditure(
-        self, column: InstrumentedAttribute[any], is_desc: bool = False
-    ) -> Select:
-        columns = [models.Expenditure.name, models.Expenditure.chapter]
-        if is_desc:
-            columns = [desc(w_column) for w_column in columns]
-        return self.select.join(column).order_by(*columns)
+        Rows are ordered by applied order by columns and `id`,
+        query returns `limit` rows after `cursor` row and one extra row
+        for checking next page existence.
+        Order columns are added to the end of selected columns,
+        use `QueryBuilder.cursor_page` for getting page from result rows.
 
-    def _order_by_post(
-        self, column: InstrumentedAttribute[any], is_desc: bool = False
-    ) -> Select:
-        columns = [models.Post.name]
-        if is_desc:
-            columns = [desc(w_column) for w_column in columns]
-        return self.select.join(column).order_by(*columns)
+        - Note: must be called after `QueryBuilder.apply`.
 
-    # endregion
+        :param cursor: Cursor returned by `QueryBuilder.cursor_page`.
+        If `None` first page is returned.
+        """
+        keys = self._order_columns + [self._model_type.id]
+        values: list[Any] | None = None
+        self._cursor_backward = False
+
+        if cursor is not None:
+            payload = self._decode_cursor(cursor)
+            if payload["order"] != self._cursor_order():
+                self._warning("Cursor doesn't match applied order, first page is used")
+            else:
+                values = [
+                    self._load_cursor_value(column, value)
+                    for column, value in zip(keys, payload["values"])
+                ]
+                self._cursor_backward = payload["backward"]
+
+        is_desc = self._cursor_is_desc()
+        if values is not None:
+            self.select = self.select.filter(
+                self._get_keyset_clause(keys, values, is_desc)
+            )
 
-    # region Search
-    def _apply_search(
-        self,
-        search_query: list[schemas.SearchSchema],
-    ):
+        self.select = (
+            self.select.order_by(None)
+            .order_by(*[desc(key) if is_desc else key for key in keys])
+            .add_columns(*keys)
+            .limit(limit + 1)
+        )
+        self._cursor_limit = limit
+        self._cursor_applied = values is not None
+
+    def cursor_page(
+        self, rows: Sequence[Row]
+    ) -> tuple[list[tuple], str | None, str | None]:
         """
-        Applies `search_query`.
+        Returns page from rows selected with `QueryBuilder.apply_cursor`.
+
+        :return: Rows without order columns, next page cursor
+        and previous page cursor. Cursor is `None` if page not exist.
+        """
+        key_count = len(self._order_columns) + 1
+        has_more = len(rows) > self._cursor_limit
+        rows = rows[: self._cursor_limit]
+        if self._cursor_backward:
+            rows = rows[::-1]
+        if len(rows) == 0:
+            return [], None, None
+
+        first_key = list(rows[0][-key_count:])
+        last_key = list(rows[-1][-key_count:])
+        page = [tuple(row[:-key_count]) for row in rows]
+
+        if self._cursor_backward:
+            next_cursor = self._encode_cursor(last_key, backward=False)
+            prev_cursor = (
+                self._encode_cursor(first_key, backward=True) if has_more else None
+            )
+        else:
+            next_cursor = (
+                self._encode_cursor(last_key, backward=False) if has_more else None
+            )
+            prev_cursor = (
+                self._encode_cursor(first_key, backward=True)
+                if self._cursor_applied
+                else None
+            )
+
+        return page, next_cursor, prev_cursor
+
+    def _cursor_order(self) -> list[Any]:
+        """Returns identifier of applied order stored in cursor."""
+        if self._order_by_schema is None:
+            return [None, False]
+        return [self._order_by_schema.column, self._order_by_schema.desc]
+
+    def _cursor_is_desc(self) -> bool:
+        """Backward pages are selected in reversed order."""
+        is_desc = self._order_by_schema.desc if self._order_by_schema else False
+        return is_desc != self._cursor_backward
+
+    def _encode_cursor(self, values: list[Any], backward: bool) -> str:
+        payload = dict(
+            order=self._cursor_order(),
+            values=to_jsonable_python(values),
+            backward=backward,
+        )
+        return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+    def _decode_cursor(self, cursor: str) -> dict[str, Any]:
+        """Raises `InvalidCursorError` if `cursor` is invalid."""
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+            if len(payload["values"]) != len(self._order_columns) + 1:
+                raise InvalidCursorError("Cursor values count mismatch")
+            return payload
+        except (ValueError, KeyError, TypeError) as e:
+            raise InvalidCursorError(f"Invalid cursor: {e}")
+
+    def _load_cursor_value(self, column: InstrumentedAttribute[any], value: Any) -> Any:
+        """Converts json `value` to `column` python type."""
+        if value is None:
+            return None
+        try:
+            python_type = column.type.python_type
+        except NotImplementedError:
+            return value
+        try:
+            return TypeAdapter(python_type).validate_python(value)
+        except ValidationError as e:
+            raise InvalidCursorError(f"Invalid cursor value: {e}")
+
+    def _get_keyset_clause(
+        self,
+        keys: list[InstrumentedAttribute[any]],
+        values: list[Any],
+        is_desc: bool,
+    ) -> BinaryExpression[bool]:
+        """Generates clause for rows after `values` in `keys` order.
+
+        `(k1, k2) > (v1, v2)` is expanded to `k1 > v1 or (k1 = v1 and k2 > v2)`
+        because keys can be nullable.
         """
-        search_clause = self._get_search_clause(self._model_type, search_query)
-        if search_clause is not None:
-            self.select = self.select.filter(search_clause)
+        clauses = []
+        for i, (key, value) in enumerate(zip(keys, values)):
+            equal_clauses = [
+                prev_key.is_(None) if prev_value is None else prev_key == prev_value
+                for prev_key, prev_value in zip(keys[:i], values[:i])
+            ]
+            clauses.append(
+                and_(*equal_clauses, self._get_after_clause(key, value, is_desc))
+            )
+        return or_(*clauses)
+
+    def _get_after_clause(
+        self, key: InstrumentedAttribute[any], value: Any, is_desc: bool
+    ) -> BinaryExpression[bool]:
+        """PostgreSQL places nulls last for ascending order
+        and first for descending."""
+        nullable = getattr(key.expression, "nullable", True)
+        if is_desc:
+            if value is None:
+                return key.is_not(None)
+            return key < value
+        if value is None:
+            return false()
+        if nullable:
+            return or_(key > value, key.is_(None))
+        return key > value
 
+    # endregion
+
+    # region Search
     def _get_search_clause(
         self,
         model_type: Type[Base],
         search_schemas: list[schemas.SearchSchema],
+        prefix: str,
     ) -> BinaryExpression[bool] | None:
-        """Generates recursive search clause."""
+        """Generates recursive search clause.
+
+        Terms are bound as `{prefix}_{index}` parameters.
+        """
         schema_type = self._model_to_schema[model_type]
 
         # Dict for all groups in current level.
-        groups: dict[int, list[schemas.SearchSchema]] = {-1: []}
-        for search_schema in search_schemas:
+        groups: dict[int, list[tuple[str, schemas.SearchSchema]]] = {-1: []}
+        for index, search_schema in enumerate(search_schemas):
+            param_name = f"{prefix}_{index}"
             for group in search_schema.groups:
                 if group in groups:
-                    groups[group].append(search_schema)
+                    groups[group].append((param_name, search_schema))
                 else:
-                    groups[group] = [search_schema]
+                    groups[group] = [(param_name, search_schema)]
 
             if len(search_schema.groups) == 0:
-                groups[-1].append(search_schema)
+                groups[-1].append((param_name, search_schema))
 
         # Calcs clause for every group
         group_clauses = []
@@ -278,9 +644,9 @@ class QueryBuilder(Builder):
             group = groups[group_id]
             inside_group_clauses: list[BinaryExpression[bool]] = []
 
-            for search_schema in group:
+            for param_name, search_schema in group:
                 column_name = search_schema.column
-                term = search_schema.term
+                term = bindparam(param_name, f"%{search_schema.term}%", type_=String)
 
                 search_clause: BinaryExpression[bool] = None
 
@@ -288,21 +654,22 @@ class QueryBuilder(Builder):
                 column_type = self._get_schema_column_type(schema_type, column_name)
 
                 # If column is pydantic schema.
-                if column_type in self._search_builders:
+                if column_type in self._search_columns:
                     column: InstrumentedAttribute[any] = getattr(
                         model_type, column_name + "_id"
                     )
-                    builder = self._search_builders[column_type]
                     column_model_type = self._schema_to_model[column_type]
 
                     # Builds select for schema table.
                     cur_level_select = (
-                        builder(term) if term else select(column_model_type.id)
+                        self._search_by_columns(column_model_type, column_type, term)
+                        if search_schema.term
+                        else select(column_model_type.id)
                     )
 
                     if len(search_schema.dependencies) > 0:
                         dependency_clause = self._get_search_clause(
-                            column_model_type, search_schema.dependencies
+                            column_model_type, search_schema.dependencies, param_name
                         )
                         if dependency_clause is not None:
                             cur_level_select = cur_level_select.filter(
@@ -319,9 +686,9 @@ class QueryBuilder(Builder):
                     )
 
                     if issubclass(column_type, str):
-                        search_clause = column.ilike(f"%{term}%")
+                        search_clause = column.ilike(term)
                     else:
-                        search_clause = cast(column, String).ilike(f"%{term}%")
+                        search_clause = cast(column, String).ilike(term)
                 # If column is schema with non implemented search.
                 else:
                     self._warning(
@@ -343,98 +710,64 @@ class QueryBuilder(Builder):
 
         return or_(*group_clauses) if len(group_clauses) > 0 else None
 
-    def _search_by_worker(self, term: str) -> Select:
-        search_columns = [
-            models.Worker.l_name,
-            models.Worker.f_name,
-            models.Worker.o_name,
-        ]
-
-        search_clauses = []
-
-        for search_column in search_columns:
-            search_clauses.append(search_column.ilike(f"%{term}%"))
-
-        return select(models.Worker.id).filter(or_(*search_clauses))
-
-    def _search_by_department(self, term: str) -> Select:
-        search_columns = [models.Department.name]
-
-        search_clauses = []
-
-        for search_column in search_columns:
-            search_clauses.append(search_column.ilike(f"%{term}%"))
-
-        return select(models.Department.id).filter(or_(*search_clauses))
-
-    def _search_by_post(self, term: str) -> Select:
-        search_columns = [models.Post.name]
-
-        search_clauses = []
-
-        for search_column in search_columns:
-            search_clauses.append(search_column.ilike(f"%{term}%"))
-
-        return select(models.Post.id).filter(or_(*search_clauses))
-
-    def _search_by_expenditure(self, term: str) -> Select:
-        search_columns = [models.Expenditure.name, models.Expenditure.chapter]
-
+    def _search_by_columns(
+        self,
+        model_type: Type[Base],
+        schema_type: Type[schemas.BaseSchema],
+        term: ColumnElement[str],
+    ) -> Select:
         search_clauses = []
 
-        for search_column in search_columns:
-            search_clauses.append(search_column.ilike(f"%{term}%"))
+        for search_column in self._search_columns[schema_type]:
+            search_clauses.append(search_column.ilike(term))
 
-        return select(models.Expenditure.id).filter(or_(*search_clauses))
+        return select(model_type.id).filter(or_(*search_clauses))
 
     # endregion
 
     # region Date
-    def _apply_date(self, date_query: schemas.DateSchema):
+    def _get_date_clause(self, date_query: schemas.DateSchema) -> BinaryExpression:
         """
-        Applies `date_query`.
+        Returns clause for `date_query`.
+
+        Bounds are bound as `date_start` and `date_end` parameters.
         """
         column_name = date_query.column
-        start = date_query.start
-        end = date_query.end
         model_type = self._model_type
 
         column = getattr(model_type, column_name)
+        start = bindparam("date_start", date_query.start, type_=column.type)
+        end = bindparam("date_end", date_query.end, type_=column.type)
 
-        self.select = self.select.filter(and_(column <= end, column >= start))
+        return and_(column <= end, column >= start)
 
     # endregion
 
     # region Filter by
-    def _apply_filter(
-        self,
-        filter_query: list[schemas.FilterSchema],
-    ):
-        """
-        Applies `filter_query`.
-        """
-        filter_clause = self._get_filter_clause(self._model_type, filter_query)
-        if filter_clause is not None:
-            self.select = self.select.filter(filter_clause)
-
     def _get_filter_clause(
         self,
         model_type: Type[Base],
         filter_schemas: list[schemas.FilterSchema],
+        prefix: str,
     ):
+        """Generates recursive filter clause.
+
+        Values are bound as `{prefix}_{index}` parameters.
+        """
         schema_type = self._model_to_schema[model_type]
 
         # Dict for all groups in current level.
-        groups: dict[int, list[schemas.SearchSchema]] = {-1: []}
-        for filter_schema in filter_schemas:
+        groups: dict[int, list[tuple[str, schemas.FilterSchema]]] = {-1: []}
+        for index, filter_schema in enumerate(filter_schemas):
+            param_name = f"{prefix}_{index}"
             for group in filter_schema.groups:
                 if group in groups:
-                    groups[group].append(filter_schema)
+                    groups[group].append((param_name, filter_schema))
                 else:
-                    groups[group] = [filter_schema]
+                    groups[group] = [(param_name, filter_schema)]
 
             if len(filter_schema.groups) == 0:
-                groups[-1].append(filter_schema)
+                groups[-1].append((param_name, filter_schema))
 
         # Calcs clause for every group
         group_clauses = []
@@ -442,7 +775,7 @@ class QueryBuilder(Builder):
             group = groups[group_id]
             inside_group_clauses: list[BinaryExpression[bool]] = []
 
-            for filter_schema in group:
+            for param_name, filter_schema in group:
                 column_name = filter_schema.column
                 value = filter_schema.value
 
@@ -462,7 +795,7 @@ class QueryBuilder(Builder):
                         cur_level_select = select(column_model_type.id)
 
                         dependency_clause = self._get_filter_clause(
-                            column_model_type, filter_schema.dependencies
+                            column_model_type, filter_schema.dependencies, param_name
                         )
                         if dependency_clause is not None:
                             cur_level_select = cur_level_select.filter(
@@ -482,7 +815,12 @@ class QueryBuilder(Builder):
                     column: InstrumentedAttribute[any] = getattr(
                         model_type, column_name
                     )
-                    filter_clause = column == value
+                    if value is None:
+                        filter_clause = column.is_(None)
+                    else:
+                        filter_clause = column == bindparam(
+                            param_name, value, type_=column.type
+                        )
 
                 inside_group_clauses.append(filter_clause)
 
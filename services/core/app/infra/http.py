@@ -0,0 +1,31 @@
+import aiohttp
+
+
+_session: aiohttp.ClientSession | None = None
+
+
+def get_http_session() -> aiohttp.ClientSession:
+    """Returns client session shared by external API requests.
+
+    Session keeps connections alive, so requests to same host
+    don't open new connection every time.
+    Must be called from running event loop.
+    """
+    global _session
+    if _session is None or _session.closed:
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=20,
+            keepalive_timeout=30,
+            ttl_dns_cache=300,
+        )
+        _session = aiohttp.ClientSession(connector=connector)
+    return _session
+
+
+async def close_http_session():
+    """Closes shared client session."""
+    global _session
+    if _session is not None:
+        await _session.close()
+        _session = None
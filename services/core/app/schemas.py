@@ -1,7 +1,8 @@
-from typing import Any, Optional, Type, TypeVar, Annotated
+from typing import Any, BinaryIO, Generic, Optional, Type, TypeVar, Annotated
 from fastapi_storages import StorageFile
 from pydantic import BaseModel, ConfigDict, Field, field_validator, StringConstraints
 import datetime
+import enum
 from pathlib import Path
 from fastapi import UploadFile
 from app.infra.database.models import (
@@ -31,6 +32,48 @@ class BaseSchemaPK(BaseSchema):
     id: int | None = -1
 
 
+class LazyUploadFile(UploadFile):
+    """`UploadFile` referencing file in storage.
+
+    File is opened on first access to `file` (`read`, `seek`, etc.),
+    size is calculated on first access to `size`.
+    If file not exist in storage content is `b"File not exist"`.
+    """
+
+    def __init__(self, path: str, filename: str):
+        self.path = path
+        self._file = None
+        self._size = None
+        super().__init__(file=None, filename=filename)
+
+    @property
+    def file(self) -> BinaryIO:
+        if self._file is None:
+            if Path(self.path).is_file():
+                self._file = open(self.path, "rb")
+            else:
+                self._file = BytesIO(b"File not exist")
+        return self._file
+
+    @file.setter
+    def file(self, file: BinaryIO | None):
+        self._file = file
+
+    @property
+    def size(self) -> int | None:
+        if self._size is None and Path(self.path).is_file():
+            self._size = Path(self.path).stat().st_size
+        return self._size
+
+    @size.setter
+    def size(self, size: int | None):
+        self._size = size
+
+    async def close(self) -> None:
+        if self._file is not None:
+            await super().close()
+
+
 class DocumentSchema(BaseSchemaPK):
     document: UploadFile
 
@@ -38,10 +81,7 @@ class DocumentSchema(BaseSchemaPK):
     @classmethod
     def upload_file_validate(cls, val):
         if isinstance(val, StorageFile):
-            if Path(val.path).is_file():
-                return UploadFile(val.open(), filename=val.name)
-            else:
-                return UploadFile(BytesIO(b"File not exist"), filename=val.name)
+            return LazyUploadFile(val.path, filename=val.name)
         return val
 
 
@@ -549,6 +589,78 @@ class TalbeInfoSchema(BaseModel):
     all_record_count: int
 
 
+PageItemT = TypeVar("PageItemT")
+
+
+class CursorPageSchema(BaseModel, Generic[PageItemT]):
+    """Page of table selected by keyset pagination."""
+
+    items: list[PageItemT]
+
+    next_cursor: str | None = None
+    """Cursor of next page, `None` if page is last."""
+
+    prev_cursor: str | None = None
+    """Cursor of previous page, `None` if page is first."""
+
+
+class ExportJobStatus(enum.Enum):
+    pending = "pending"
+    running = "running"
+    done = "done"
+    failed = "failed"
+
+
+class ExportJobSchema(BaseModel):
+    id: str
+    status: ExportJobStatus
+    rows_written: int = 0
+    total: int | None = None
+    error: str | None = None
+
+
+class PoolMetricsSchema(BaseModel):
+    name: str
+    size: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    connects: int
+    invalidations: int
+    wait_avg: float
+    wait_max: float
+
+
+class CacheMetricsSchema(BaseModel):
+    name: str
+    size: int
+    hits: int
+    misses: int
+
+
+class NotificationMetricsSchema(BaseModel):
+    queued: int
+    in_flight: int
+    sent: int
+    failed: int
+    retries: int
+    latency_avg: float
+    latency_max: float
+    throughput: float
+
+
+class UpdateQueueMetricsSchema(BaseModel):
+    queued: int
+    max_queued: int
+    processed: int
+    failed: int
+    blocked: int
+    wait_avg: float
+    wait_max: float
+    handle_avg: float
+    handle_max: float
+
+
 # region Query schema
 
 
@@ -11,6 +11,11 @@ from app.services.bid import (
     get_bid_by_id,
     get_bid_count,
     get_bid_record_at_page,
+    get_bid_by_id_async,
+    get_bid_count_async,
+    get_bid_record_at_page_async,
+    get_approximate_bid_count_async,
+    get_bid_records_by_cursor_async,
     get_bid_records,
     get_bids_by_worker_telegram_id,
     get_coordinator_bid_count,
@@ -22,6 +27,10 @@ from app.services.bid import (
     get_pending_bids_for_teller_cash,
     get_pending_bids_by_worker_telegram_id,
     get_pending_bids_for_cc_fac,
+    get_pending_bids_by_column_async,
+    get_pending_bids_for_teller_cash_async,
+    get_pending_bids_by_worker_telegram_id_async,
+    get_pending_bids_for_cc_fac_async,
     notify_next_coordinator,
     remove_bid,
     skip_repeating_bid_state,
@@ -68,6 +77,8 @@ from app.services.extra import (
     get_worker_by_id,
     get_worker_by_phone_number,
     get_worker_by_telegram_id,
+    get_worker_by_phone_number_async,
+    get_worker_by_telegram_id_async,
     get_worker_chief,
     get_worker_department_by_telegram_id,
     get_workers_by_scope,
@@ -77,6 +88,9 @@ from app.services.extra import (
     get_companies_names,
     set_tellers_cash_department,
     get_last_worker_passport_id,
+    get_telegram_file_ids,
+    set_telegram_file_ids,
+    delete_telegram_file_ids,
 )
 from app.services.it_problem import (
     create_bid_it,
@@ -148,6 +162,12 @@ from app.services.worker_bid import (
     update_view_state_worker_bid,
     get_worker_bid_coordinators,
 )
+from app.services.export_job import (
+    create_export_job,
+    get_export_job,
+    get_export_job_file,
+    shutdown_export_jobs,
+)
 from app.services.worktime import (
     create_worktime,
     dump_worktime,
@@ -156,10 +176,16 @@ from app.services.worktime import (
     get_work_time_records_by_day_and_department,
     get_worktimes_at_page,
     get_wortkime_count,
+    get_worktimes_at_page_async,
+    get_wortkime_count_async,
+    get_approximate_worktime_count_async,
+    get_worktimes_by_cursor_async,
+    move_worktime_photos,
     remove_worktime,
     update_work_time_record,
     update_worktime,
     get_opened_today_worktime,
+    get_opened_today_worktime_async,
     get_last_completed_worktimes_by_tg_id,
     get_hours_sum_in_month,
 )
@@ -192,6 +218,7 @@ __all__ = [
     "create_bid_it",
     "create_budget_record",
     "create_expenditure",
+    "create_export_job",
     "create_technical_request",
     "create_worker_bid",
     "create_worktime",
@@ -215,9 +242,14 @@ __all__ = [
     "get_all_waiting_technical_requests_for_worker",
     "get_all_worker_in_group",
     "get_bid_by_id",
+    "get_bid_by_id_async",
     "get_bid_count",
+    "get_bid_count_async",
+    "get_approximate_bid_count_async",
+    "get_bid_records_by_cursor_async",
     "get_bid_it_by_id",
     "get_bid_record_at_page",
+    "get_bid_record_at_page_async",
     "get_bid_records",
     "get_bids_by_worker_telegram_id",
     "get_budget_record_by_id",
@@ -238,6 +270,8 @@ __all__ = [
     "get_expenditure_by_id",
     "get_expenditure_count",
     "get_expenditures",
+    "get_export_job",
+    "get_export_job_file",
     "get_expenditures_at_page",
     "get_expenditures_names_by_chapter",
     "get_file_data",
@@ -254,9 +288,13 @@ __all__ = [
     "get_material_value_by_inventory_number",
     "get_material_values",
     "get_pending_bids_by_column",
+    "get_pending_bids_by_column_async",
     "get_pending_bids_for_teller_cash",
+    "get_pending_bids_for_teller_cash_async",
     "get_pending_bids_by_worker_telegram_id",
+    "get_pending_bids_by_worker_telegram_id_async",
     "get_pending_bids_for_cc_fac",
+    "get_pending_bids_for_cc_fac_async",
     "get_pending_bids_it_by_repairman",
     "get_pending_bids_it_by_worker_telegram_id",
     "get_pending_bids_it_for_territorial_manager",
@@ -276,11 +314,15 @@ __all__ = [
     "get_last_completed_worktimes_by_tg_id",
     "get_hours_sum_in_month",
     "get_opened_today_worktime",
+    "get_opened_today_worktime_async",
+    "move_worktime_photos",
     "get_work_time_records_by_day_and_department",
     "get_worker_bid_by_id",
     "get_worker_by_id",
     "get_worker_by_phone_number",
+    "get_worker_by_phone_number_async",
     "get_worker_by_telegram_id",
+    "get_worker_by_telegram_id_async",
     "get_worker_chief",
     "get_companies_names",
     "set_tellers_cash_department",
@@ -289,7 +331,11 @@ __all__ = [
     "get_workers_by_scope",
     "get_workers_in_department_by_scope",
     "get_worktimes_at_page",
+    "get_worktimes_at_page_async",
+    "get_approximate_worktime_count_async",
+    "get_worktimes_by_cursor_async",
     "get_wortkime_count",
+    "get_wortkime_count_async",
     "notify_next_coordinator",
     "remove_bid",
     "remove_budget_record",
@@ -310,6 +356,7 @@ __all__ = [
     "update_worker_bid_state",
     "update_worker_tg_id_by_number",
     "set_department_for_worker",
+    "shutdown_export_jobs",
     "update_worktime",
     "find_bid_for_worker",
     "update_repairman_worktimes",
@@ -319,6 +366,9 @@ __all__ = [
     "update_worker_state",
     "search_subordinate",
     "get_last_worker_passport_id",
+    "get_telegram_file_ids",
+    "set_telegram_file_ids",
+    "delete_telegram_file_ids",
     "get_workers_bids_pending_sender",
     "get_worker_bid_documents_requests",
     "add_worker_bids_documents_requests",
@@ -1,12 +1,12 @@
-from io import BytesIO
 from pathlib import Path
 from datetime import datetime
 from fastapi import UploadFile
-from typing import Any, Optional, Tuple
+from typing import Any, BinaryIO, Callable, Optional, Tuple
 
 from app.infra.logging import logger
 
 import app.infra.database.orm as orm
+import app.infra.database.async_orm as async_orm
 from app.infra.database.models import (
     Department,
     ApprovalStatus,
@@ -14,10 +14,12 @@ from app.infra.database.models import (
     Expenditure,
     FujiScope,
     Worker,
+    bid_states,
 )
 from app.schemas import (
     BidOutSchema,
     BidSchema,
+    CursorPageSchema,
     FilterSchema,
     QuerySchema,
     DocumentSchema,
@@ -36,17 +38,7 @@ from app.adapters.bot.handlers.bids.schemas import (
 )
 
 # In right order
-states = [
-    "fac_state",
-    "cc_state",
-    "paralegal_state",
-    "kru_state",
-    "owner_state",
-    "accountant_card_state",
-    "accountant_cash_state",
-    "teller_card_state",
-    "teller_cash_state",
-]
+states = bid_states
 
 
 def get_bid_count(
@@ -56,6 +48,18 @@ def get_bid_count(
     return orm.get_model_count(Bid, query_schema)
 
 
+async def get_bid_count_async(
+    query_schema: QuerySchema,
+) -> int:
+    """Async version of `get_bid_count`."""
+    return await async_orm.get_model_count(Bid, query_schema)
+
+
+async def get_approximate_bid_count_async() -> int:
+    """Returns estimated count of all bids in bd."""
+    return await async_orm.get_approximate_model_count(Bid)
+
+
 def get_bid_record_at_page(
     page: int,
     records_per_page: int,
@@ -71,6 +75,39 @@ def get_bid_record_at_page(
     ]
 
 
+async def get_bid_record_at_page_async(
+    page: int,
+    records_per_page: int,
+    query_schema: QuerySchema,
+) -> list[BidOutSchema]:
+    """Async version of `get_bid_record_at_page`."""
+    return [
+        bid_to_out_bid(bid)
+        for bid in await async_orm.get_models(
+            Bid, BidSchema, page, records_per_page, query_schema
+        )
+    ]
+
+
+async def get_bid_records_by_cursor_async(
+    cursor: str | None,
+    records_per_page: int,
+    query_schema: QuerySchema,
+) -> CursorPageSchema[BidOutSchema]:
+    """Return bid records page after `cursor`.
+
+    See `QueryBuilder.apply_cursor` for more info about cursor.
+    """
+    page = await async_orm.get_models_by_cursor(
+        Bid, BidSchema, cursor, records_per_page, query_schema
+    )
+    return CursorPageSchema[BidOutSchema](
+        items=[bid_to_out_bid(bid) for bid in page.items],
+        next_cursor=page.next_cursor,
+        prev_cursor=page.prev_cursor,
+    )
+
+
 async def create_bid_by_in_schema(bid_in: BidInSchema):
     """
     Creates an bid wrapped in `BidSchema` by `BidInSchema` and adds it to database.
@@ -249,6 +286,16 @@ def get_pending_bids_by_worker_telegram_id(id: str) -> list[BidSchema]:
     return orm.get_pending_bids_by_worker(worker)
 
 
+async def get_pending_bids_by_worker_telegram_id_async(id: str) -> list[BidSchema]:
+    """Async version of `get_pending_bids_by_worker_telegram_id`."""
+    worker = await async_orm.find_worker_by_column(Worker.telegram_id, id)
+
+    if not worker:
+        return []
+
+    return await async_orm.get_pending_bids_by_worker(worker)
+
+
 def get_bid_by_id(id: int) -> BidSchema:
     """
     Returns bid in database by it id.
@@ -256,6 +303,11 @@ def get_bid_by_id(id: int) -> BidSchema:
     return orm.find_bid_by_column(Bid.id, id)
 
 
+async def get_bid_by_id_async(id: int) -> BidSchema:
+    """Async version of `get_bid_by_id`."""
+    return await async_orm.find_bid_by_column(Bid.id, id)
+
+
 def get_pending_bids_by_column(column: Any) -> list[BidSchema]:
     """
     Returns all bids in database with pending approval state at column.
@@ -263,6 +315,11 @@ def get_pending_bids_by_column(column: Any) -> list[BidSchema]:
     return orm.get_specified_pending_bids(column)
 
 
+async def get_pending_bids_by_column_async(column: Any) -> list[BidSchema]:
+    """Async version of `get_pending_bids_by_column`."""
+    return await async_orm.get_specified_pending_bids(column)
+
+
 def get_pending_bids_for_teller_cash(tg_id: int) -> list[BidSchema]:
     """
     Returns all bids in database with pending approval state at column for teller cash.
@@ -271,10 +328,19 @@ def get_pending_bids_for_teller_cash(tg_id: int) -> list[BidSchema]:
     return orm.get_specified_pending_bids_for_teller_cash(tg_id)
 
 
+async def get_pending_bids_for_teller_cash_async(tg_id: int) -> list[BidSchema]:
+    """Async version of `get_pending_bids_for_teller_cash`."""
+    return await async_orm.get_specified_pending_bids_for_teller_cash(tg_id)
+
+
 def get_pending_bids_for_cc_fac(tg_id) -> list[BidSchema]:
     return orm.get_pending_bids_for_cc_fac(tg_id)
 
 
+async def get_pending_bids_for_cc_fac_async(tg_id) -> list[BidSchema]:
+    return await async_orm.get_pending_bids_for_cc_fac(tg_id)
+
+
 def get_history_bids_by_column(column: Any, limit: int) -> list[BidSchema]:
     """
     Returns all bids in database past through worker with `column`.
@@ -409,7 +475,7 @@ async def notify_next_coordinator(bid: BidSchema):
     from app.adapters.bot.handlers.utils import (
         notify_workers_by_scope,
         notify_workers_in_department_by_scope,
-        notify_worker_by_telegram_id,
+        notify_workers,
     )
 
     message = f"У вас новая заявка!\nНомер заявки: {bid.id}\nЗаявитель: {bid.worker.l_name} {bid.worker.f_name}"
@@ -417,9 +483,10 @@ async def notify_next_coordinator(bid: BidSchema):
         bid.fac_state == ApprovalStatus.pending_approval
         and bid.expenditure.fac.telegram_id is not None
     ):
-        await notify_worker_by_telegram_id(
-            bid.expenditure.fac.telegram_id,
+        notify_workers(
+            [bid.expenditure.fac],
             message=message,
+            with_menu=False,
             reply_markup=create_inline_keyboard(
                 InlineKeyboardButton(
                     text=view,
@@ -436,9 +503,10 @@ async def notify_next_coordinator(bid: BidSchema):
         bid.cc_state == ApprovalStatus.pending_approval
         and bid.expenditure.cc.telegram_id is not None
     ):
-        await notify_worker_by_telegram_id(
-            bid.expenditure.cc.telegram_id,
+        notify_workers(
+            [bid.expenditure.cc],
             message=message,
+            with_menu=False,
             reply_markup=create_inline_keyboard(
                 InlineKeyboardButton(
                     text=view,
@@ -455,9 +523,10 @@ async def notify_next_coordinator(bid: BidSchema):
         bid.paralegal_state == ApprovalStatus.pending_approval
         and bid.expenditure.paralegal.telegram_id is not None
     ):
-        await notify_worker_by_telegram_id(
-            bid.expenditure.paralegal.telegram_id,
+        notify_workers(
+            [bid.expenditure.paralegal],
             message=message,
+            with_menu=False,
         )
     elif bid.kru_state == ApprovalStatus.pending_approval:
         await notify_workers_by_scope(
@@ -744,7 +813,8 @@ def apply_bid_archive_filter(query_schema: QuerySchema) -> QuerySchema:
 
 def export_bid_records(
     query_schema: QuerySchema,
-) -> BytesIO:
+    progress: Callable[[int], None] | None = None,
+) -> BinaryIO:
     """Returns xlsx file with bids records filtered by `query_schema`."""
     # Formatters
     from app.adapters.bot.kb import payment_type_dict
@@ -769,6 +839,7 @@ def export_bid_records(
             "teller_cash_state",
         ],
         aliases[BidSchema],
+        progress=progress,
     )
 
 
@@ -777,12 +848,13 @@ def export_coordintator_bid_records(
     phone: int,
     coordinator: str | list[str],
     group: int = 0,
-) -> BytesIO:
+    progress: Callable[[int], None] | None = None,
+) -> BinaryIO:
     """Returns xlsx file with bids records filtered by `query_schema`
     for specified `coordinator`."""
     apply_coordinator_filter(query_schema, phone, coordinator, group)
 
-    return export_bid_records(query_schema)
+    return export_bid_records(query_schema, progress)
 
 
 def get_bid_coordinators(bid_id: int) -> list[WorkerSchema]:
@@ -813,8 +885,10 @@ def get_fac_or_cc_bid_records_at_page(
 
 
 def export_fac_or_cc_bid_records(
-    query_schema: QuerySchema, worker_phone: str
-) -> BytesIO:
+    query_schema: QuerySchema,
+    worker_phone: str,
+    progress: Callable[[int], None] | None = None,
+) -> BinaryIO:
     """Returns xlsx file with bids records filtered by `query_schema`."""
     # Formatters
     from app.adapters.bot.kb import payment_type_dict
@@ -842,6 +916,7 @@ def export_fac_or_cc_bid_records(
         ],
         aliases[BidSchema],
         select_query=bids_select,
+        progress=progress,
     )
 
 
@@ -0,0 +1,283 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from hashlib import sha256
+import json
+import os
+from pathlib import Path
+import re
+import shutil
+import threading
+import time
+from typing import BinaryIO, Callable
+from uuid import uuid4
+
+from app.infra.config import settings
+from app.infra.logging import logger
+from app.schemas import ExportJobSchema, ExportJobStatus
+
+
+ExportFunc = Callable[[Callable[[int], None]], BinaryIO]
+
+# Seconds between saves of job progress.
+_progress_interval = 1
+_id_pattern = re.compile(r"[0-9a-f]{32}")
+
+
+@dataclass
+class _ExportJob:
+    id: str
+    key: str
+    filename: str
+    status: ExportJobStatus = ExportJobStatus.pending
+    rows_written: int = 0
+    total: int | None = None
+    error: str | None = None
+    updated_at: float = field(default_factory=time.time)
+
+    def to_schema(self) -> ExportJobSchema:
+        return ExportJobSchema(
+            id=self.id,
+            status=self.status,
+            rows_written=self.rows_written,
+            total=self.total,
+            error=self.error,
+        )
+
+
+# Jobs are kept in `settings.storage_path` to be available in all processes:
+# - `exports/keys/<key hash>` contains id of job of exported data.
+# - `exports/<id>/job.json` is job state, it's written only by process
+# which runs job.
+# - `exports/<id>/owners/<owner hash>` exists for every owner of job.
+# - `exports/<id>/<id>.xlsx` is exported file.
+_executor: ThreadPoolExecutor | None = None
+_running_jobs: dict[str, _ExportJob] = {}
+_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.export_workers, thread_name_prefix="export"
+        )
+    return _executor
+
+
+def _hash(value: str) -> str:
+    return sha256(value.encode()).hexdigest()
+
+
+def _get_export_dir() -> Path:
+    return Path(settings.storage_path, "exports")
+
+
+def _get_job_dir(id: str) -> Path:
+    return _get_export_dir().joinpath(id)
+
+
+def _get_key_path(key: str) -> Path:
+    return _get_export_dir().joinpath("keys", _hash(key))
+
+
+def _get_file_path(job: _ExportJob) -> Path:
+    return _get_job_dir(job.id).joinpath(f"{job.id}.xlsx")
+
+
+def _save_job(job: _ExportJob):
+    """Atomically replaces saved state of `job`."""
+    job.updated_at = time.time()
+    data = asdict(job)
+    data["status"] = job.status.value
+    path = _get_job_dir(job.id).joinpath("job.json")
+    tmp_path = path.with_name(f".{uuid4().hex}.tmp")
+    tmp_path.write_text(json.dumps(data))
+    os.replace(tmp_path, path)
+
+
+def _load_job(id: str) -> _ExportJob | None:
+    if not _id_pattern.fullmatch(id):
+        return None
+    try:
+        data = json.loads(_get_job_dir(id).joinpath("job.json").read_text())
+    except (OSError, ValueError):
+        return None
+    data["status"] = ExportJobStatus(data["status"])
+    return _ExportJob(**data)
+
+
+def _is_expired(job: _ExportJob) -> bool:
+    """Finished jobs expire after `settings.export_job_ttl`,
+    unfinished jobs expire if they aren't updated during it,
+    it happens when process running job is stopped."""
+    return time.time() - job.updated_at > settings.export_job_ttl
+
+
+def _release_key(job: _ExportJob):
+    """Removes key of `job`, so new job is created for same key."""
+    key_path = _get_key_path(job.key)
+    try:
+        if key_path.read_text() == job.id:
+            key_path.unlink()
+    except OSError:
+        pass
+
+
+def _remove_job(job: _ExportJob):
+    _release_key(job)
+    shutil.rmtree(_get_job_dir(job.id), ignore_errors=True)
+
+
+def _remove_expired_jobs():
+    """Removes jobs expired in all processes."""
+    export_dir = _get_export_dir()
+    if not export_dir.exists():
+        return
+    for job_dir in export_dir.iterdir():
+        job = _load_job(job_dir.name)
+        if job is not None and _is_expired(job):
+            _remove_job(job)
+
+
+def _run_job(job: _ExportJob, export: ExportFunc, count: Callable[[], int] | None):
+    job.status = ExportJobStatus.running
+    try:
+        _save_job(job)
+        if count is not None:
+            job.total = count()
+            _save_job(job)
+
+        def progress(rows_written: int):
+            job.rows_written = rows_written
+            if time.time() - job.updated_at >= _progress_interval:
+                _save_job(job)
+
+        with export(progress) as file, open(_get_file_path(job), "wb") as out:
+            shutil.copyfileobj(file, out)
+
+        job.status = ExportJobStatus.done
+    except Exception as e:
+        logger.error(f"Export job {job.id} failed: {e}")
+        job.error = str(e)
+        job.status = ExportJobStatus.failed
+        _release_key(job)
+    finally:
+        with _lock:
+            _running_jobs.pop(job.id, None)
+        _save_job(job)
+
+
+def _add_owner(job: _ExportJob, owner: str):
+    _get_job_dir(job.id).joinpath("owners", _hash(owner)).touch()
+
+
+def _new_job(key: str, filename: str, owner: str) -> _ExportJob | None:
+    """Creates job for `key` or returns `None` if other job has taken `key`."""
+    job = _ExportJob(id=uuid4().hex, key=key, filename=filename)
+    _get_job_dir(job.id).joinpath("owners").mkdir(parents=True)
+    _add_owner(job, owner)
+    _save_job(job)
+
+    key_path = _get_key_path(key)
+    key_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = key_path.with_name(f".{job.id}.tmp")
+    tmp_path.write_text(job.id)
+    try:
+        # Link fails if key exists, so only one job is created in all processes.
+        os.link(tmp_path, key_path)
+    except FileExistsError:
+        shutil.rmtree(_get_job_dir(job.id), ignore_errors=True)
+        return None
+    finally:
+        tmp_path.unlink()
+    return job
+
+
+def _find_job_by_key(key: str) -> _ExportJob | None:
+    """Returns job which can be reused for `key`."""
+    key_path = _get_key_path(key)
+    try:
+        job = _load_job(key_path.read_text())
+    except OSError:
+        return None
+    if job is None or job.status == ExportJobStatus.failed or _is_expired(job):
+        key_path.unlink(missing_ok=True)
+        return None
+    return job
+
+
+def create_export_job(
+    owner: str,
+    key: str,
+    filename: str,
+    export: ExportFunc,
+    count: Callable[[], int] | None = None,
+) -> ExportJobSchema:
+    """Runs `export` in export worker pool.
+
+    If job with same `key` is in progress or finished and not expired
+    in any process, returns it instead of creating new one.
+
+    :param owner: User who can get job state and file.
+    :param key: Identifier of exported data (export type with query).
+    :param export: Function which creates xlsx file, accepts progress callback.
+    :param count: Function which returns estimated count of rows.
+    """
+    _remove_expired_jobs()
+    executor = _get_executor()
+
+    with _lock:
+        while True:
+            job = _find_job_by_key(key)
+            if job is not None:
+                _add_owner(job, owner)
+                return job.to_schema()
+
+            job = _new_job(key, filename, owner)
+            if job is not None:
+                _running_jobs[job.id] = job
+                break
+
+    executor.submit(_run_job, job, export, count)
+
+    return job.to_schema()
+
+
+def _find_job(id: str, owner: str) -> _ExportJob | None:
+    _remove_expired_jobs()
+    job = _load_job(id)
+    if job is None or not _get_job_dir(id).joinpath("owners", _hash(owner)).exists():
+        return None
+    return job
+
+
+def get_export_job(id: str, owner: str) -> ExportJobSchema | None:
+    """Returns export job state or `None` if job not exist for `owner`."""
+    job = _find_job(id, owner)
+    return job.to_schema() if job else None
+
+
+def get_export_job_file(id: str, owner: str) -> tuple[Path, str] | None:
+    """Returns path and filename of finished export job file
+    or `None` if file isn't ready."""
+    job = _find_job(id, owner)
+    if job is None or job.status != ExportJobStatus.done:
+        return None
+    return _get_file_path(job), job.filename
+
+
+def shutdown_export_jobs():
+    """Stops export worker pool, unfinished jobs of process are failed."""
+    global _executor
+    if _executor is None:
+        return
+    _executor.shutdown(wait=False, cancel_futures=True)
+    _executor = None
+    with _lock:
+        jobs = list(_running_jobs.values())
+        _running_jobs.clear()
+    for job in jobs:
+        job.status = ExportJobStatus.failed
+        job.error = "Export is interrupted"
+        _release_key(job)
+        _save_job(job)
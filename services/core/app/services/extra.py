@@ -1,9 +1,11 @@
 from typing import Optional
 
+from app.infra.cache import TTLCache
 from app.infra.logging import logger
 from app.infra.config import settings
 
 import app.infra.database.orm as orm
+import app.infra.database.async_orm as async_orm
 from app.infra.database.models import (
     Department,
     FujiScope,
@@ -26,7 +28,12 @@ def get_worker_by_telegram_id(id: str) -> Optional[WorkerSchema]:
     Returns worker by his telegram id.
     Return `None`, if worker doesn't exits.
     """
-    return orm.find_worker_by_column(Worker.telegram_id, id)
+    return orm.find_worker_by_telegram_id(id)
+
+
+async def get_worker_by_telegram_id_async(id: str) -> Optional[WorkerSchema]:
+    """Async version of `get_worker_by_telegram_id`."""
+    return await async_orm.find_worker_by_telegram_id(id)
 
 
 def get_workers_by_scope(scope: FujiScope) -> list[WorkerSchema]:
@@ -52,12 +59,12 @@ def get_worker_department_by_telegram_id(id: str) -> DepartmentSchema:
 
     If worker not exist return `None`.
     """
-    worker = orm.find_worker_by_column(Worker.telegram_id, id)
+    worker = orm.find_worker_by_telegram_id(id)
 
     if not worker:
         return None
 
-    return orm.find_department_by_column(Department.id, worker.department.id)
+    return worker.department
 
 
 def update_worker_tg_id_by_number(number: str, tg_id: int) -> bool:
@@ -106,6 +113,11 @@ def get_worker_by_phone_number(number: str) -> WorkerSchema | None:
     return orm.find_worker_by_column(Worker.phone_number, number)
 
 
+async def get_worker_by_phone_number_async(number: str) -> WorkerSchema | None:
+    """Async version of `get_worker_by_phone_number`."""
+    return await async_orm.find_worker_by_column(Worker.phone_number, number)
+
+
 def get_worker_by_id(id: int) -> WorkerSchema:
     """
     Returns worker in database with `id` at column.
@@ -264,3 +276,39 @@ def set_tellers_cash_department() -> list[WorkerSchema]:
 
 def get_last_worker_passport_id(worker_id: int) -> int:
     return orm.get_last_worker_passport_id(worker_id)
+
+
+# Telegram file ids by path of stored file, backed by `telegram_files` table.
+telegram_file_cache: TTLCache[str, str] = TTLCache(ttl=24 * 3600, maxsize=10000)
+
+
+async def get_telegram_file_ids(paths: list[str]) -> dict[str, str]:
+    """Returns telegram file ids of already uploaded files stored by `paths`."""
+    result: dict[str, str] = {}
+    missing: list[str] = []
+    for path in paths:
+        file_id = telegram_file_cache.get(path)
+        if file_id is None:
+            missing.append(path)
+        else:
+            result[path] = file_id
+
+    found = await async_orm.get_telegram_file_ids(missing)
+    for path, file_id in found.items():
+        telegram_file_cache.set(path, file_id)
+    result.update(found)
+    return result
+
+
+async def set_telegram_file_ids(file_ids: dict[str, str]):
+    """Saves telegram file ids of uploaded files by their storage paths."""
+    await async_orm.set_telegram_file_ids(file_ids)
+    for path, file_id in file_ids.items():
+        telegram_file_cache.set(path, file_id)
+
+
+async def delete_telegram_file_ids(paths: list[str]):
+    """Forgets telegram file ids of files stored by `paths`."""
+    await async_orm.delete_telegram_file_ids(paths)
+    for path in paths:
+        telegram_file_cache.pop(path)
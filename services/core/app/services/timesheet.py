@@ -1,5 +1,5 @@
 import calendar
-from io import BytesIO
+from typing import BinaryIO, Callable, Iterator
 from app.infra.database.models import Worker
 import app.infra.database.orm as orm
 from app.schemas import QuerySchema, TimeSheetSchema, aliases
@@ -39,12 +39,17 @@ def get_timesheets_at_page(
     return [timesheet.model_dump() for timesheet in timesheets]
 
 
-def export_timesheets(query_schema: QuerySchema) -> BytesIO:
+def export_timesheets(
+    query_schema: QuerySchema,
+    progress: Callable[[int], None] | None = None,
+) -> BinaryIO:
     start = query_schema.date_query.start
     _, last_day = calendar.monthrange(start.year, start.month)
-    timesheets = orm.get_timesheets(query_schema)
-    for timesheet in timesheets:
-        timesheet.last_day = last_day
+
+    def timesheets() -> Iterator[TimeSheetSchema]:
+        for timesheet in orm.iter_timesheets(query_schema):
+            timesheet.last_day = last_day
+            yield timesheet
 
     exporter = XlSXWriterExporter(
         exclude_columns=[],
@@ -52,4 +57,4 @@ def export_timesheets(query_schema: QuerySchema) -> BytesIO:
         aliases=aliases[TimeSheetSchema],
     )
 
-    return exporter.export(timesheets, with_dump=True)
+    return exporter.export(timesheets(), with_dump=True, progress=progress)
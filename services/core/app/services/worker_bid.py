@@ -527,7 +527,7 @@ def search_subordinate(tg_id: int, l_name: str) -> int | None:
     return None
 
 
-def update_worker_state(worker_id: int, state: WorkerStatus) -> bool:
+async def update_worker_state(worker_id: int, state: WorkerStatus) -> bool:
     from app.adapters.bot.handlers.utils import notify_workers_by_scope
     from app.adapters.bot.kb import create_inline_keyboard
     from app.adapters.bot.text import view
@@ -542,7 +542,7 @@ def update_worker_state(worker_id: int, state: WorkerStatus) -> bool:
     if worker.state == WorkerStatus.internship and (
         state == WorkerStatus.active or state == WorkerStatus.refusal_internship
     ):
-        notify_workers_by_scope(
+        await notify_workers_by_scope(
             scope=FujiScope.bot_worker_bid_accounting_coordinate,
             message=f"Сотрудник {worker.l_name} {worker.f_name} {worker.o_name}.\nid сотрудника {worker.id}\
                 \n{'Отказался от стажировки' if state == WorkerStatus.refusal_internship else 'Прошёл стажировку'}",
@@ -1,20 +1,26 @@
 from datetime import date, datetime, timedelta
 from io import BytesIO
 import base64
+from typing import BinaryIO, Callable
+
+from PIL import Image, ImageOps
 
-import aiohttp
 from app.infra.config import settings
+from app.infra.http import get_http_session
+from app.infra.logging import logger
 import app.infra.database.orm as orm
+import app.infra.database.async_orm as async_orm
 from app.infra.database.models import (
     WorkTime,
 )
 from app.schemas import (
+    CursorPageSchema,
     QuerySchema,
     WorkTimeSchema,
     WorkTimeSchemaFull,
     aliases,
 )
-from fastapi import HTTPException
+from fastapi import HTTPException, UploadFile
 
 
 def get_work_time_records_by_day_and_department(
@@ -57,6 +63,18 @@ def get_wortkime_count(
     return orm.get_model_count(WorkTime, query_schema)
 
 
+async def get_wortkime_count_async(
+    query_schema: QuerySchema,
+) -> int:
+    """Async version of `get_wortkime_count`."""
+    return await async_orm.get_model_count(WorkTime, query_schema)
+
+
+async def get_approximate_worktime_count_async() -> int:
+    """Returns estimated count of all work times in bd."""
+    return await async_orm.get_approximate_model_count(WorkTime)
+
+
 def get_worktimes_at_page(
     page: int,
     records_per_page: int,
@@ -75,6 +93,43 @@ def get_worktimes_at_page(
     return rows
 
 
+async def get_worktimes_at_page_async(
+    page: int,
+    records_per_page: int,
+    query_schema: QuerySchema,
+) -> list[WorkTimeSchemaFull]:
+    """Async version of `get_worktimes_at_page`."""
+    rows = await async_orm.get_worktimes_without_photo(
+        page, records_per_page, query_schema
+    )
+
+    for row in rows:
+        if len(row.photo_b64) > 0:
+            row.photo_b64 = f"{row.id}"
+
+    return rows
+
+
+async def get_worktimes_by_cursor_async(
+    cursor: str | None,
+    records_per_page: int,
+    query_schema: QuerySchema,
+) -> CursorPageSchema[WorkTimeSchemaFull]:
+    """Return work time records page after `cursor`.
+
+    See `QueryBuilder.apply_cursor` for more info about cursor.
+    """
+    page = await async_orm.get_worktimes_without_photo_by_cursor(
+        cursor, records_per_page, query_schema
+    )
+
+    for row in page.items:
+        if len(row.photo_b64) > 0:
+            row.photo_b64 = f"{row.id}"
+
+    return page
+
+
 def dump_worktime(record: WorkTimeSchema) -> dict:
     if (
         not hasattr(record, "worker")
@@ -114,12 +169,11 @@ def dump_worktime(record: WorkTimeSchema) -> dict:
 
 
 async def remove_worktime(id: int) -> None:
-    async with aiohttp.ClientSession() as session:
-        async with session.delete(
-            f"{settings.external_api}/connector/biosmart/work_times/{id}",
-        ) as resp:
-            if resp.status >= 400:
-                raise HTTPException(status_code=resp.status)
+    async with get_http_session().delete(
+        f"{settings.external_api}/connector/biosmart/work_times/{id}",
+    ) as resp:
+        if resp.status >= 400:
+            raise HTTPException(status_code=resp.status)
 
 
 async def update_worktime(record: WorkTimeSchema) -> None:
@@ -128,43 +182,120 @@ async def update_worktime(record: WorkTimeSchema) -> None:
     old = dump_worktime(get_work_time_record_by_id(record.id))
     dif = dict(new.items() - old.items())
 
-    async with aiohttp.ClientSession() as session:
-        async with session.put(
-            f"{settings.external_api}/connector/biosmart/work_times/{record.id}",
-            json=dif,
-        ) as resp:
-            if resp.status >= 400:
-                raise HTTPException(status_code=resp.status, detail=resp.reason)
+    async with get_http_session().put(
+        f"{settings.external_api}/connector/biosmart/work_times/{record.id}",
+        json=dif,
+    ) as resp:
+        if resp.status >= 400:
+            raise HTTPException(status_code=resp.status, detail=resp.reason)
 
 
 async def create_worktime(record: WorkTimeSchema) -> None:
     """Creates worktime"""
-    async with aiohttp.ClientSession() as session:
-        async with session.post(
-            f"{settings.external_api}/connector/biosmart/work_times",
-            json=dump_worktime(record),
-        ) as resp:
-            if resp.status >= 400:
-                raise HTTPException(status_code=resp.status)
+    async with get_http_session().post(
+        f"{settings.external_api}/connector/biosmart/work_times",
+        json=dump_worktime(record),
+    ) as resp:
+        if resp.status >= 400:
+            raise HTTPException(status_code=resp.status)
 
 
 def export_worktimes(
     query_schema: QuerySchema,
-) -> BytesIO:
+    progress: Callable[[int], None] | None = None,
+) -> BinaryIO:
     """Returns xlsx file with worktimes filtered by `query_schema`."""
     # Formatters
     return orm.export_models(
         WorkTime,
         query_schema,
         aliases=aliases[WorkTimeSchema],
-        exclude_columns=["photo_b64"],
+        exclude_columns=["photo_b64", "photo", "photo_thumbnail"],
+        progress=progress,
     )
 
 
-def get_worktime_photo_by_id(id: int) -> BytesIO:
-    photo_b64 = orm.get_worktime_photo(id)
-    decoded_photo = base64.b64decode(photo_b64)
-    return BytesIO(decoded_photo)
+def _create_thumbnail(photo: bytes) -> BytesIO | None:
+    """Returns jpeg thumbnail of `photo` or `None` if it isn't image."""
+    try:
+        with Image.open(BytesIO(photo)) as image:
+            image = ImageOps.exif_transpose(image)
+            image.thumbnail(
+                (settings.worktime_thumbnail_size, settings.worktime_thumbnail_size)
+            )
+            thumbnail = BytesIO()
+            image.convert("RGB").save(thumbnail, format="JPEG", quality=80)
+    except OSError as e:
+        logger.warning(f"Worktime photo thumbnail isn't created: {e}")
+        return None
+    thumbnail.seek(0)
+    return thumbnail
+
+
+def move_worktime_photo(id: int) -> bool:
+    """Moves worktime photo from `photo_b64` column to storage
+    and creates its thumbnail.
+
+    `photo_b64` is kept until column is dropped.
+    Returns `False` if photo is moved by other process.
+    """
+
+    def convert(photo_b64: str) -> tuple[UploadFile, UploadFile | None]:
+        photo = base64.b64decode(photo_b64)
+        thumbnail = _create_thumbnail(photo)
+        return (
+            UploadFile(file=BytesIO(photo), filename=f"worktime_{id}.jpg"),
+            (
+                UploadFile(file=thumbnail, filename=f"worktime_{id}_thumbnail.jpg")
+                if thumbnail is not None
+                else None
+            ),
+        )
+
+    return orm.move_worktime_photo(id, convert)
+
+
+def move_worktime_photos() -> int:
+    """Moves all worktime photos which aren't moved to storage yet.
+
+    Returns count of moved photos.
+    """
+    moved = 0
+    last_id = 0
+    while ids := orm.get_worktime_ids_with_inline_photo(
+        last_id, settings.worktime_photo_batch_size
+    ):
+        for id in ids:
+            try:
+                if move_worktime_photo(id):
+                    moved += 1
+            except Exception as e:
+                logger.error(f"Worktime {id} photo isn't moved: {e}")
+        last_id = ids[-1]
+    return moved
+
+
+async def get_worktime_photo_file(id: int, thumbnail: bool = False) -> str | BytesIO:
+    """Returns path to worktime photo or its thumbnail in storage.
+
+    Photo which isn't moved to storage by `move_worktime_photos` yet
+    is returned decoded from database.
+    If thumbnail isn't exist returns photo.
+    """
+    paths = await async_orm.get_worktime_photo_paths(id)
+    if paths is None:
+        raise HTTPException(status_code=404, detail="Photo not exist")
+
+    photo_path, thumbnail_path, inline = paths
+    if photo_path is None:
+        photo_b64 = await async_orm.get_worktime_inline_photo(id) if inline else None
+        if photo_b64 is None:
+            raise HTTPException(status_code=404, detail="Photo not exist")
+        return BytesIO(base64.b64decode(photo_b64))
+
+    if thumbnail and thumbnail_path is not None:
+        return thumbnail_path
+    return photo_path
 
 
 def get_opened_today_worktime(worker_id: int) -> WorkTimeSchema | None:
@@ -172,6 +303,11 @@ def get_opened_today_worktime(worker_id: int) -> WorkTimeSchema | None:
     return orm.get_openned_today_worktime(worker_id=worker_id)
 
 
+async def get_opened_today_worktime_async(worker_id: int) -> WorkTimeSchema | None:
+    """Async version of `get_opened_today_worktime`."""
+    return await async_orm.get_openned_today_worktime(worker_id=worker_id)
+
+
 def get_hours_sum_in_intervals(
     worker_id: int, begins: list[datetime], ends: list[datetime]
 ) -> float:
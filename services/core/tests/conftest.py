@@ -0,0 +1,39 @@
+import os
+import tempfile
+
+# Settings are read on import of app.
+os.environ.setdefault("POSTGRES_USER", "test")
+os.environ.setdefault("POSTGRES_PASSWORD", "test")
+os.environ.setdefault("BOT_TOKEN", "1:test")
+os.environ.setdefault("TELEGRAM_TOKEN", "test")
+os.environ.setdefault("BOT_WEBHOOK_URL", "test")
+os.environ.setdefault("PUBLIC_KEY_PATH", os.devnull)
+os.environ.setdefault("EXTERNAL_API", "test")
+os.environ.setdefault("CRM_ADDR", "test")
+os.environ.setdefault("STORAGE_PATH", tempfile.mkdtemp(prefix="storage_"))
+
+import app.app  # noqa: E402, F401
+
+import pytest  # noqa: E402
+from sqlalchemy import Engine, create_engine  # noqa: E402
+from sqlalchemy.dialects.postgresql import JSONB  # noqa: E402
+from sqlalchemy.ext.compiler import compiles  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+import app.infra.database.orm as orm  # noqa: E402
+from app.infra.database.database import Base, ScopedSessionMaker  # noqa: E402
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb(type_, compiler, **kw) -> str:
+    return "JSON"
+
+
+@pytest.fixture
+def engine(monkeypatch) -> Engine:
+    """In-memory database used by sync orm."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    monkeypatch.setattr(orm, "session", ScopedSessionMaker(sessionmaker(engine)))
+    yield engine
+    engine.dispose()
@@ -0,0 +1,101 @@
+import datetime
+
+import pytest
+from sqlalchemy import Engine, select
+from sqlalchemy.orm import Session
+
+from app.infra.database.models import (
+    ApprovalStatus,
+    Bid,
+    BidInbox,
+    Company,
+    Department,
+    Expenditure,
+    Post,
+    Worker,
+)
+
+
+def make_worker(name: str, department: Department) -> Worker:
+    return Worker(
+        f_name="f",
+        l_name=name,
+        o_name="o",
+        post=Post(name=f"post {name}", level=1),
+        department=department,
+    )
+
+
+@pytest.fixture
+def bid_id(engine: Engine) -> int:
+    now = datetime.datetime(2026, 10, 1, 9)
+    with Session(engine) as s, s.begin():
+        department = Department(name="department", company=Company(name="company"))
+        fac = make_worker("fac", department)
+        cc = make_worker("cc", department)
+        expenditure = Expenditure(
+            name="expenditure",
+            chapter="chapter",
+            create_date=now,
+            fac=fac,
+            cc=cc,
+            paralegal=cc,
+            creator=fac,
+        )
+        bid = Bid(
+            amount=1,
+            payment_type="cash",
+            purpose="purpose",
+            create_date=now,
+            activity_type="activity",
+            department=department,
+            paying_department=department,
+            worker=fac,
+            expenditure=expenditure,
+            fac_state=ApprovalStatus.pending_approval,
+            cc_state=ApprovalStatus.pending,
+        )
+        s.add(bid)
+        s.flush()
+        return bid.id
+
+
+def get_inbox(engine: Engine, bid_id: int) -> BidInbox | None:
+    with Session(engine) as s:
+        return s.scalars(select(BidInbox).filter(BidInbox.bid_id == bid_id)).first()
+
+
+def test_new_bid_gets_inbox(engine, bid_id):
+    inbox = get_inbox(engine, bid_id)
+
+    assert inbox.state_name == "fac_state"
+    with Session(engine) as s:
+        assert inbox.coordinator_id == s.get(Bid, bid_id).expenditure.fac_id
+
+
+def test_inbox_follows_bid_states(engine, bid_id):
+    with Session(engine) as s, s.begin():
+        bid = s.get(Bid, bid_id)
+        bid.fac_state = ApprovalStatus.approved
+        bid.cc_state = ApprovalStatus.pending_approval
+        cc_id = bid.expenditure.cc_id
+
+    inbox = get_inbox(engine, bid_id)
+    assert inbox.state_name == "cc_state"
+    assert inbox.coordinator_id == cc_id
+
+    with Session(engine) as s, s.begin():
+        s.get(Bid, bid_id).cc_state = ApprovalStatus.denied
+
+    assert get_inbox(engine, bid_id) is None
+
+
+def test_inbox_follows_expenditure_coordinator(engine, bid_id):
+    with Session(engine) as s, s.begin():
+        expenditure = s.get(Bid, bid_id).expenditure
+        fac = make_worker("new fac", expenditure.fac.department)
+        expenditure.fac = fac
+        s.flush()
+        fac_id = fac.id
+
+    assert get_inbox(engine, bid_id).coordinator_id == fac_id
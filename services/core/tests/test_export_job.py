@@ -0,0 +1,64 @@
+from io import BytesIO
+import time
+
+import pytest
+
+from app.infra.config import settings
+from app.schemas import ExportJobSchema, ExportJobStatus
+from app.services import export_job
+
+
+@pytest.fixture(autouse=True)
+def storage_path(monkeypatch, tmp_path):
+    monkeypatch.setattr(settings, "storage_path", str(tmp_path))
+    yield tmp_path
+    export_job.shutdown_export_jobs()
+
+
+def export(progress) -> BytesIO:
+    progress(1)
+    return BytesIO(b"xlsx")
+
+
+def wait_job(id: str, owner: str) -> ExportJobSchema:
+    for _ in range(100):
+        job = export_job.get_export_job(id, owner)
+        if job.status in (ExportJobStatus.done, ExportJobStatus.failed):
+            return job
+        time.sleep(0.01)
+    raise TimeoutError
+
+
+def test_export_job_is_shared_between_processes(monkeypatch):
+    job = export_job.create_export_job("owner", "key", "file.xlsx", export, lambda: 1)
+    job = wait_job(job.id, "owner")
+    # Other process has no state of job in memory.
+    monkeypatch.setattr(export_job, "_running_jobs", {})
+
+    assert job.status == ExportJobStatus.done
+    assert job.rows_written == job.total == 1
+    assert export_job.get_export_job(job.id, "other") is None
+
+    same_job = export_job.create_export_job(
+        "other", "key", "file.xlsx", export, lambda: 1
+    )
+    path, filename = export_job.get_export_job_file(job.id, "other")
+
+    assert same_job.id == job.id
+    assert filename == "file.xlsx"
+    assert path.read_bytes() == b"xlsx"
+
+
+def test_failed_export_job_isnt_reused():
+    def fail(_):
+        raise ValueError("error")
+
+    job = export_job.create_export_job("owner", "key", "file.xlsx", fail)
+    job = wait_job(job.id, "owner")
+
+    assert job.status == ExportJobStatus.failed
+    assert job.error == "error"
+    assert export_job.get_export_job_file(job.id, "owner") is None
+    assert export_job.create_export_job("owner", "key", "file.xlsx", export).id != (
+        job.id
+    )
@@ -0,0 +1,120 @@
+import datetime
+import json
+
+import pytest
+from aiogram import Router
+from aiogram.types import CallbackQuery, Chat, Document, Message, PhotoSize, User
+
+from app.adapters.bot.handlers.bids import coordinate_bid
+from app.adapters.bot.handlers.department_request import appraiser, executors
+from app.adapters.bot.handlers.department_request import kb as department_kb
+from app.adapters.bot.handlers.department_request.schemas import RequestType
+from app.adapters.bot.handlers.worker_bids import coordinate as worker_bid_coordinate
+from app.adapters.bot.kb import fac_cc_menu_button, get_coordinate_worker_bids_SS_btn
+from app.adapters.bot.storage import decode_fsm_value, encode_fsm_value
+from app.infra.database.models import Bid, WorkerBid
+
+user = User(id=1, is_bot=False, first_name="first")
+message = Message(
+    message_id=1,
+    date=datetime.datetime(2026, 10, 1, 9, tzinfo=datetime.timezone.utc),
+    chat=Chat(id=1, type="private"),
+    from_user=user,
+    text="text",
+)
+callback = CallbackQuery(
+    id="1", from_user=user, chat_instance="1", message=message, data="data"
+)
+
+bid_factory = coordinate_bid.CoordinationFactory(
+    router=Router(),
+    coordinator_menu_button=fac_cc_menu_button,
+    state_column=Bid.fac_state,
+    name="fac",
+)
+worker_bid_factory = worker_bid_coordinate.WorkerBidCoordinationFactory(
+    router=Router(),
+    coordinator_menu_button=get_coordinate_worker_bids_SS_btn,
+    state_column=WorkerBid.security_service_state,
+    name="security_service",
+)
+appraiser_factory = appraiser.CoordinationFactory(
+    router=Router(),
+    problem_type=RequestType.TR,
+    menu_button=department_kb.AR_TR_button,
+)
+executor_factory = executors.CoordinationFactory(
+    router=Router(),
+    problem_type=RequestType.TR,
+    executor_menu_button=department_kb.repairman_button,
+)
+
+# Payloads of `update_data` calls, which aren't plain strings or numbers.
+payloads = {
+    "bids.coordinate_bid.decline_bid": dict(
+        generator=bid_factory.get_pendings,
+        callback=callback,
+        bid_id=1,
+        column_name=Bid.fac_state.name,
+    ),
+    "bids.coordinate_bid.approve_bid_accountant_cash": dict(
+        generator=bid_factory.get_pendings,
+        get_bid=bid_factory.get_bid,
+        callback=callback,
+        bid_id=1,
+        column_name=Bid.fac_state.name,
+    ),
+    "bids.coordinate_bid.search_bid": dict(
+        get_bid=bid_factory.get_bid,
+        get_menu=bid_factory.get_menu,
+        search_bid=bid_factory.search_bid,
+        column_name=Bid.fac_state.name,
+        message=message,
+    ),
+    "bids.coordinate_bid.get_documents": dict(msgs_for_delete=[message]),
+    "worker_bids.coordinate.get_comment": dict(
+        id=1,
+        status=1,
+        msg=message,
+        get_menu=worker_bid_factory.get_menu,
+        state_column_name="security_service",
+    ),
+    "department_request.appraiser.change_department": dict(
+        generator=appraiser_factory.show_department_menu,
+        menu_markup=appraiser_factory.menu_markup,
+        problem_type=RequestType.TR,
+    ),
+    "department_request.appraiser.show_rate_form": dict(
+        request_id=1, generator=appraiser_factory.show_rate_form
+    ),
+    "department_request.executors.show_department_menu": dict(
+        generator=executor_factory.show_department_menu,
+        type=RequestType.TR,
+        menu_data=executor_factory.executor_menu_button.callback_data,
+    ),
+    "department_request.executors.show_waiting_work": dict(
+        request_id=1, generator=executor_factory.show_waiting_work
+    ),
+    "department_request.executors.show_repair_rework_form": dict(
+        request_id=1, generator=executor_factory.show_repair_rework_form
+    ),
+    "utils.handle_documents": dict(
+        msgs=[message],
+        documents=[
+            Document(file_id="1", file_unique_id="1", file_name="document.pdf"),
+            PhotoSize(file_id="2", file_unique_id="2", width=1, height=1),
+        ],
+    ),
+}
+
+
+@pytest.mark.parametrize("payload", payloads.values(), ids=payloads.keys())
+def test_fsm_data_round_trip(payload: dict):
+    encoded = encode_fsm_value(payload)
+    decoded = decode_fsm_value(json.loads(json.dumps(encoded)))
+
+    assert decoded.keys() == payload.keys()
+    for key, value in payload.items():
+        if callable(value):
+            assert decoded[key] == value
+    assert encode_fsm_value(decoded) == encoded
@@ -0,0 +1,136 @@
+import datetime
+from io import BytesIO
+
+import pytest
+from fastapi import UploadFile
+from sqlalchemy import Engine, event
+from sqlalchemy.orm import Session
+
+import app.infra.database.orm as orm
+from app.infra.database.models import (
+    ApprovalStatus,
+    Bid,
+    BidDocument,
+    Company,
+    Department,
+    Expenditure,
+    FujiScope,
+    Post,
+    PostScope,
+    Worker,
+    WorkTime,
+)
+from app.schemas import BidSchema, QuerySchema, WorkTimeSchema
+
+ROWS = 15
+
+
+class QueryCounter:
+    def __init__(self, engine: Engine):
+        self.engine = engine
+        self.count = 0
+
+    def _count(self, *args):
+        self.count += 1
+
+    def __enter__(self) -> "QueryCounter":
+        event.listen(self.engine, "before_cursor_execute", self._count)
+        return self
+
+    def __exit__(self, *args):
+        event.remove(self.engine, "before_cursor_execute", self._count)
+
+
+def count_queries(engine: Engine, func) -> int:
+    with QueryCounter(engine) as counter:
+        func()
+    return counter.count
+
+
+@pytest.fixture
+def data(engine: Engine):
+    now = datetime.datetime(2026, 10, 1, 9)
+    with Session(engine) as s, s.begin():
+        for i in range(ROWS):
+            company = Company(name=f"company {i}")
+            post = Post(name=f"post {i}", level=1)
+            post.scopes = [PostScope(scope=FujiScope.bot_bid_create)]
+            department = Department(name=f"department {i}", company=company)
+            worker = Worker(
+                f_name="f",
+                l_name=f"l {i}",
+                o_name="o",
+                post=post,
+                department=department,
+            )
+            expenditure = Expenditure(
+                name=f"expenditure {i}",
+                chapter="chapter",
+                create_date=now,
+                fac=worker,
+                cc=worker,
+                paralegal=worker,
+                creator=worker,
+            )
+            bid = Bid(
+                amount=i,
+                payment_type="card",
+                purpose="purpose",
+                create_date=now,
+                activity_type="activity",
+                department=department,
+                worker=worker,
+                expenditure=expenditure,
+                documents=[
+                    BidDocument(
+                        document=UploadFile(file=BytesIO(b"doc"), filename="doc.pdf")
+                    )
+                ],
+                **{
+                    state: ApprovalStatus.pending_approval
+                    for state in (
+                        "fac_state",
+                        "cc_state",
+                        "paralegal_state",
+                        "kru_state",
+                        "owner_state",
+                        "accountant_cash_state",
+                        "accountant_card_state",
+                        "teller_cash_state",
+                        "teller_card_state",
+                    )
+                },
+            )
+            worktime = WorkTime(
+                worker=worker,
+                post=post,
+                department=department,
+                company=company,
+                work_begin=now,
+                day=now.date(),
+            )
+            s.add_all([bid, worktime])
+
+
+@pytest.mark.usefixtures("data")
+@pytest.mark.parametrize(
+    ("model_type", "schema_type"),
+    [(Bid, BidSchema), (WorkTime, WorkTimeSchema)],
+)
+def test_models_page_query_count_is_constant(engine, model_type, schema_type):
+    def get_page(records_per_page: int):
+        return lambda: orm.get_models(
+            model_type, schema_type, 1, records_per_page, QuerySchema()
+        )
+
+    assert count_queries(engine, get_page(1)) == count_queries(engine, get_page(ROWS))
+
+
+@pytest.mark.usefixtures("data")
+def test_worktimes_page_query_count_is_constant(engine):
+    def get_page(records_per_page: int):
+        return lambda: orm.get_worktimes_without_photo(
+            1, records_per_page, QuerySchema()
+        )
+
+    assert count_queries(engine, get_page(1)) == count_queries(engine, get_page(ROWS))
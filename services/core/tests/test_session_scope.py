@@ -0,0 +1,26 @@
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from app.infra.database.database import ScopedSessionMaker
+
+
+def test_scope_returns_connection_after_transaction(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'db.sqlite'}", poolclass=QueuePool)
+    session = ScopedSessionMaker(sessionmaker(engine))
+
+    with session.scope():
+        with session.begin() as s:
+            s.execute(text("select 1"))
+            with session.begin() as nested:
+                assert nested is s
+            assert engine.pool.checkedout() == 1
+
+        assert engine.pool.checkedout() == 0
+
+        with session.begin() as other:
+            other.execute(text("select 1"))
+            assert other is s
+
+    assert engine.pool.checkedout() == 0
+    engine.dispose()
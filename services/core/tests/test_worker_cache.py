@@ -0,0 +1,46 @@
+import pytest
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session
+
+from app.infra.database import orm
+from app.infra.database.models import Company, Department, Post, Worker
+
+
+@pytest.fixture
+def worker_id(engine: Engine) -> int:
+    orm.worker_cache.clear()
+    with Session(engine) as s, s.begin():
+        worker = Worker(
+            f_name="f",
+            l_name="l",
+            o_name="o",
+            telegram_id=1,
+            post=Post(name="post", level=1),
+            department=Department(name="department", company=Company(name="company")),
+        )
+        s.add(worker)
+        s.flush()
+        return worker.id
+
+
+def test_cache_follows_worker_changes(engine, worker_id):
+    assert orm.find_worker_by_telegram_id(1).l_name == "l"
+    assert orm.find_worker_by_telegram_id(2) is None
+
+    with Session(engine) as s, s.begin():
+        worker = s.get(Worker, worker_id)
+        worker.l_name = "new"
+        worker.telegram_id = 2
+
+    assert orm.find_worker_by_telegram_id(1) is None
+    assert orm.find_worker_by_telegram_id(2).l_name == "new"
+
+    with Session(engine) as s, s.begin():
+        s.get(Worker, worker_id).post.name = "new post"
+
+    assert orm.find_worker_by_telegram_id(2).post.name == "new post"
+
+    with Session(engine) as s, s.begin():
+        s.delete(s.get(Worker, worker_id))
+
+    assert orm.find_worker_by_telegram_id(2) is None
@@ -0,0 +1,41 @@
+import base64
+import datetime
+from io import BytesIO
+
+from PIL import Image
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session
+
+from app.infra.database.models import Company, Department, Post, Worker, WorkTime
+from app.services import worktime
+
+
+def test_worktime_photo_is_moved_once(engine: Engine):
+    image = BytesIO()
+    Image.new("RGB", (512, 512)).save(image, format="PNG")
+    now = datetime.datetime(2026, 10, 1, 9)
+    with Session(engine) as s, s.begin():
+        company = Company(name="company")
+        department = Department(name="department", company=company)
+        post = Post(name="post", level=1)
+        record = WorkTime(
+            worker=Worker(
+                f_name="f", l_name="l", o_name="o", post=post, department=department
+            ),
+            post=post,
+            department=department,
+            company=company,
+            work_begin=now,
+            day=now.date(),
+            photo_b64=base64.b64encode(image.getvalue()).decode(),
+        )
+        s.add(record)
+        s.flush()
+        id = record.id
+
+    assert worktime.move_worktime_photo(id)
+    assert not worktime.move_worktime_photo(id)
+    with Session(engine) as s:
+        record = s.get(WorkTime, id)
+        assert record.photo is not None
+        assert record.photo_thumbnail is not None
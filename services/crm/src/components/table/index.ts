@@ -53,6 +53,8 @@ export class CellLine {
 		public href: string = "",
 		public color: string = "",
 		public forceHref: boolean = false,
+		/** Href of image opened from table, **href** is used if empty. */
+		public previewHref: string = "",
 	) {
 		if (
 			href.length !== 0 &&
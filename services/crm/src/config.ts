@@ -12,6 +12,9 @@ export const FullKnowledgeEndpoint = `${knowledgeURL}/${knowledgeEndpoint}`;
 
 export const cookiesExpires = "7d";
 
+/** Milliseconds between export job state requests. */
+export const exportPollInterval = 1000;
+
 export const accessesDict: any = {
 	admin: Access.Admin,
 	crm_bid: Access.Bid,
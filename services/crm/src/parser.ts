@@ -186,7 +186,15 @@ export function formatWorkTimePhoto(photoID: string): Cell {
 	}
 	const href = `${config.coreURL}/${config.crmEndpoint}/worktime/download_photo/${photoID}`;
 
-	return new Cell(new CellLine(`photo_${photoID}.jpg`, href, undefined, true));
+	return new Cell(
+		new CellLine(
+			`photo_${photoID}.jpg`,
+			href,
+			undefined,
+			true,
+			`${href}?thumbnail=true`,
+		),
+	);
 }
 
 export function formatMultilineString(multilineString: string): Cell {
@@ -2,7 +2,13 @@ import axios from "axios";
 
 import * as config from "@/config";
 import { useNetworkStore } from "@/store/network";
-import { BaseSchema, QuerySchema, InfoSchema, BidSchema } from "@/types";
+import {
+	BaseSchema,
+	QuerySchema,
+	InfoSchema,
+	BidSchema,
+	ExportJobSchema,
+} from "@/types";
 
 export class PathOptions {
 	getExtraPath: string = "";
@@ -87,19 +93,35 @@ export default class EntityService<T extends BaseSchema> {
 	) {
 		const resp = await this._networkStore.withAuthChecking(
 			axios.post(
-				`${this._endpoint}/${name}${this.options.exportExtraPath}/export`,
+				`${this._endpoint}/${name}${this.options.exportExtraPath}/export/job`,
 				query,
-				{
-					responseType: "blob",
-					withCredentials: true,
-				},
 			),
 		);
-		const filename = (resp.headers["content-disposition"] as string).split(
-			"=",
-		)[1];
+		let job: ExportJobSchema = resp.data;
+		const jobURL = `${this._endpoint}/export/${job.id}`;
+
+		while (job.status === "pending" || job.status === "running") {
+			await new Promise((resolve) =>
+				setTimeout(resolve, config.exportPollInterval),
+			);
+			job = (await this._networkStore.withAuthChecking(axios.get(jobURL)))
+				.data;
+		}
+		if (job.status === "failed") {
+			throw new Error(job.error);
+		}
+
+		const fileResp = await this._networkStore.withAuthChecking(
+			axios.get(`${jobURL}/download`, {
+				responseType: "blob",
+				withCredentials: true,
+			}),
+		);
+		const filename = (fileResp.headers["content-disposition"] as string)
+			.split("filename=")[1]
+			.replace(/"/g, "");
 
-		this._networkStore.saveFile(filename, resp.data);
+		this._networkStore.saveFile(filename, fileResp.data);
 	}
 
 	public async searchEntities(
@@ -41,6 +41,14 @@ export interface InfoSchema {
 	page_count: number;
 }
 
+export interface ExportJobSchema {
+	id: string;
+	status: "pending" | "running" | "done" | "failed";
+	rows_written: number;
+	total?: number;
+	error?: string;
+}
+
 export enum Access {
 	Bid,
 	BidReadOnly,
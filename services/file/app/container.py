@@ -1,5 +1,4 @@
 from logging import Logger
-from contextlib import asynccontextmanager
 from typing import AsyncIterator
 import aioboto3
 from mypy_boto3_s3 import ServiceResource
@@ -10,29 +9,28 @@ from common.containers.postgres import PostgresContainer
 from common.auth import LocalAuthService
 
 from app.infra.database.uow import SQLFileUnitOfWork
+from app.infra.s3.cache import PresignedURLCache
 from app.infra.s3.file import S3FileClient
 from app.services.file import FileServiceImpl
+from app.services.reaper import init_reaper
 
 
-def create_resource_factory(
+async def init_s3_resource(
     session: aioboto3.Session,
     aws_access_key_id: str,
     aws_secret_access_key: str,
     endpoint_url: str,
     region: str,
-):
-    @asynccontextmanager
-    async def create_resource() -> AsyncIterator[ServiceResource]:
-        async with session.resource(
-            service_name="s3",
-            region_name=region,
-            endpoint_url=endpoint_url,
-            aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key,
-        ) as r:
-            yield r
-
-    return create_resource
+) -> AsyncIterator[ServiceResource]:
+    """Creates s3 resource shared by all requests."""
+    async with session.resource(
+        service_name="s3",
+        region_name=region,
+        endpoint_url=endpoint_url,
+        aws_access_key_id=aws_access_key_id,
+        aws_secret_access_key=aws_secret_access_key,
+    ) as r:
+        yield r
 
 
 class Container(containers.DeclarativeContainer):
@@ -47,15 +45,20 @@ class Container(containers.DeclarativeContainer):
     )
 
     s3_session = providers.Factory(aioboto3.Session)
-    s3_resource_factory = providers.Factory(
-        create_resource_factory,
+    s3_resource = providers.Resource(
+        init_s3_resource,
         session=s3_session,
         aws_access_key_id=config.access_key,
         aws_secret_access_key=config.secret_access_key,
         region=config.region,
         endpoint_url=config.endpoint_url,
     )
-    s3_client = providers.Factory(S3FileClient, s3_resource_factory)
+    link_cache = providers.Singleton(
+        PresignedURLCache,
+        maxsize=config.link_cache_size,
+        reuse=config.link_cache_reuse,
+    )
+    s3_client = providers.Singleton(S3FileClient, s3_resource, link_cache)
 
     file_uow = providers.Factory(
         SQLFileUnitOfWork, postgres_container.container.async_sessionmaker
@@ -64,3 +67,11 @@ class Container(containers.DeclarativeContainer):
     file_service = providers.Factory(
         FileServiceImpl, file_uow, s3_client, config.buckets
     )
+    reaper = providers.Resource(
+        init_reaper,
+        file_service.provider,
+        logger,
+        interval=config.reaper_interval,
+        stale_after=config.reaper_stale_after,
+        batch_size=config.reaper_batch_size,
+    )
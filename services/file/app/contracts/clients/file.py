@@ -24,3 +24,13 @@ class FileClient(BaseClient):
         Returns:
             A list of `KeyErrorSchema` objects describing the files that failed to be deleted.
         """
+
+    @abstractmethod
+    async def get_sizes(
+        self, keys_buckets: list[tuple[str, str]]
+    ) -> dict[tuple[str, str], int]:
+        """Checks files existence in storage.
+
+        Returns:
+            Sizes of existing files by `(key, bucket)`.
+        """
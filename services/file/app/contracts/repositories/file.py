@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from datetime import datetime
 
 from common.contracts.repository import BaseRepository
 from app.schemas.file import FileCreateSchema, FileSchema, FileUpdateSchema
@@ -14,13 +15,28 @@ class FileRepository(BaseRepository):
         pass
 
     @abstractmethod
-    async def delete(self, ids: list[int]):
+    async def delete(self, ids: list[int], *, unconfirmed_only: bool = False):
         pass
 
+    @abstractmethod
+    async def confirm(self, ids: list[int]):
+        pass
+
+    @abstractmethod
+    async def get_unconfirmed(
+        self, created_before: datetime, after_id: int, limit: int
+    ) -> list[FileSchema]:
+        """Returns up to `limit` unconfirmed files created before `created_before`
+        with id greater than `after_id` ordered by id."""
+
     @abstractmethod
     async def get_by_key(self, key: str) -> list[FileSchema]:
         pass
 
+    @abstractmethod
+    async def get_by_keys(self, keys: list[str]) -> list[FileSchema]:
+        pass
+
     @abstractmethod
     async def get_by_id(self, id: int) -> FileSchema | None:
         pass
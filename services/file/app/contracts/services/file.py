@@ -1,8 +1,9 @@
 from abc import abstractmethod
+from datetime import datetime
 
 from common.contracts.services import BaseService
 from common.schemas.file import FileInSchema, FileDeleteResultSchema, FileLinkSchema
-from app.schemas.file import FileConfirmSchema
+from app.schemas.file import FileConfirmSchema, ReapResultSchema
 
 
 class FileService(BaseService):
@@ -43,3 +44,14 @@ class FileService(BaseService):
         Returns:
             A list of `FileDeleteResultSchema` objects describing the files that failed to be deleted.
         """
+
+    @abstractmethod
+    async def reap_unconfirmed(
+        self, created_before: datetime, batch_size: int = 500
+    ) -> ReapResultSchema:
+        """Reconciles unconfirmed files created before `created_before` with storage.
+
+        Files existing in storage with expected size are confirmed,
+        other files are deleted from storage and db.
+        Files are processed by batches of `batch_size`.
+        """
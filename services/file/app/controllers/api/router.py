@@ -2,6 +2,7 @@ from logging import Logger
 from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, Request, Security, status, Query
 from dependency_injector.wiring import Provide, inject
+from datetime import datetime, timedelta
 import json
 import hmac
 import hashlib
@@ -10,7 +11,12 @@ from common.schemas.client_credential import ClientCredentials
 from common.schemas.file import FileInSchema, FileDeleteResultSchema
 from app.container import Container
 from app.contracts.services import FileService
-from app.schemas.file import FileConfirmSchema
+from app.infra.s3.cache import PresignedURLCache
+from app.schemas.file import (
+    FileConfirmSchema,
+    LinkCacheMetricsSchema,
+    ReapResultSchema,
+)
 from common.schemas.file import FileLinkSchema
 
 from app.controllers.api.dependencies import Authorization
@@ -87,6 +93,49 @@ async def delete_files(
     return results
 
 
+@router.post("/reap")
+@inject
+async def reap_unconfirmed(
+    stale_after: int | None = None,
+    file_service: FileService = Depends(Provide[Container.file_service]),
+    config=Depends(Provide[Container.config]),
+    _: ClientCredentials = Security(
+        Authorization,
+        scopes=[Scopes.FileWrite.value],
+    ),
+) -> ReapResultSchema:
+    """Reaps unconfirmed files older than `stale_after` seconds.
+
+    Uses `FILE_REAPER_STALE_AFTER` if `stale_after` isn't specified.
+    """
+    if stale_after is None:
+        stale_after = config["reaper_stale_after"]
+    return await file_service.reap_unconfirmed(
+        datetime.now() - timedelta(seconds=stale_after),
+        config["reaper_batch_size"],
+    )
+
+
+@router.get("/metrics/links")
+@inject
+async def get_link_cache_metrics(
+    link_cache: PresignedURLCache = Depends(Provide[Container.link_cache]),
+    _: ClientCredentials = Security(
+        Authorization,
+        scopes=[Scopes.FileRead.value],
+    ),
+) -> LinkCacheMetricsSchema:
+    """Returns presigned get urls cache statistic."""
+    requests = link_cache.hits + link_cache.misses
+    return LinkCacheMetricsSchema(
+        size=len(link_cache),
+        hits=link_cache.hits,
+        misses=link_cache.misses,
+        hit_rate=link_cache.hits / requests if requests else 0,
+        invalidations=link_cache.invalidations,
+    )
+
+
 @router.post("/s3_webhook")
 async def s3_webhook(
     request: Request,
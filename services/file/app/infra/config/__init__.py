@@ -5,9 +5,15 @@ from common.config import (
     AdminSettings,
 )
 from app.infra.config.s3 import S3Settings
+from app.infra.config.reaper import ReaperSettings
 
 
 class Settings(
-    PostgreSQLSettings, NetworkSettings, LocalAuthSettings, AdminSettings, S3Settings
+    PostgreSQLSettings,
+    NetworkSettings,
+    LocalAuthSettings,
+    AdminSettings,
+    S3Settings,
+    ReaperSettings,
 ):
     pass
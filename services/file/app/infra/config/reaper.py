@@ -0,0 +1,13 @@
+from pydantic_settings import BaseSettings
+from pydantic import Field
+
+
+class ReaperSettings(BaseSettings):
+    reaper_interval: int = Field(validation_alias="FILE_REAPER_INTERVAL", default=3600)
+    # Must be greater than put links expiration.
+    reaper_stale_after: int = Field(
+        validation_alias="FILE_REAPER_STALE_AFTER", default=86400
+    )
+    reaper_batch_size: int = Field(
+        validation_alias="FILE_REAPER_BATCH_SIZE", default=500
+    )
@@ -8,6 +8,8 @@ class S3Settings(BaseSettings):
     buckets_str: str = Field(validation_alias="BUCKETS")
     access_key: str = Field(validation_alias="S3_ACCESS_KEY")
     secret_access_key: str = Field(validation_alias="S3_SECRET_ACCESS_KEY")
+    link_cache_size: int = Field(validation_alias="S3_LINK_CACHE_SIZE", default=10000)
+    link_cache_reuse: int = Field(validation_alias="S3_LINK_CACHE_REUSE", default=900)
 
     @computed_field
     @property
@@ -1,9 +1,11 @@
+from typing import Any
+
 from app.schemas.file import FileCreateSchema, FileSchema
 from app.infra.database.models import File
 
 
-def file_create_schema_to_file(file_create: FileCreateSchema) -> File:
-    return File(
+def file_create_schema_to_values(file_create: FileCreateSchema) -> dict[str, Any]:
+    return dict(
         bucket=file_create.bucket,
         ext=file_create.ext,
         name=file_create.name,
@@ -1,4 +1,4 @@
-from sqlalchemy import select, ColumnElement, and_
+from sqlalchemy import delete, insert, select, update, ColumnElement, and_
 
 from common.sql.repository import SQLBaseRepository
 from app.contracts.repositories import FileRepository
@@ -14,16 +14,15 @@ class SQLFileRepository(FileRepository, SQLBaseRepository):
         return (await self._session.execute(s)).scalars().all()
 
     async def create(self, file_creates):
-        files = [
-            converters.file_create_schema_to_file(file_create)
-            for file_create in file_creates
-        ]
-        for file in files:
-            self._session.add(file)
-
-        await self._session.flush()
-        for file in files:
-            await self._session.refresh(file)
+        if len(file_creates) == 0:
+            return []
+        files = await self._session.scalars(
+            insert(File).returning(File, sort_by_parameter_order=True),
+            [
+                converters.file_create_schema_to_values(file_create)
+                for file_create in file_creates
+            ],
+        )
 
         return [converters.file_to_file_schema(file) for file in files]
 
@@ -41,19 +40,46 @@ class SQLFileRepository(FileRepository, SQLBaseRepository):
 
         return converters.file_to_file_schema(file)
 
-    async def delete(self, ids):
-        files = await self._get_by_criteria(File.id.in_(ids))
+    async def delete(self, ids, *, unconfirmed_only=False):
+        if len(ids) == 0:
+            return
+        s = delete(File).where(File.id.in_(ids))
+        if unconfirmed_only:
+            s = s.where(File.confirmed.is_(False))
+        await self._session.execute(s)
+
+    async def confirm(self, ids):
+        if len(ids) == 0:
+            return
+        await self._session.execute(
+            update(File).where(File.id.in_(ids)).values(confirmed=True)
+        )
 
-        for file in files:
-            await self._session.delete(file)
+    async def get_unconfirmed(self, created_before, after_id, limit):
+        s = (
+            select(File)
+            .filter(
+                File.confirmed.is_(False),
+                File.created < created_before,
+                File.id > after_id,
+            )
+            .order_by(File.id)
+            .limit(limit)
+        )
+        files = (await self._session.execute(s)).scalars().all()
 
-        await self._session.flush()
+        return [converters.file_to_file_schema(file) for file in files]
 
     async def get_by_key(self, key):
         files = await self._get_by_criteria(File.key == key)
 
         return [converters.file_to_file_schema(file) for file in files]
 
+    async def get_by_keys(self, keys):
+        files = await self._get_by_criteria(File.key.in_(keys))
+
+        return [converters.file_to_file_schema(file) for file in files]
+
     async def get_by_id(self, id):
         files = await self._get_by_criteria(File.id == id)
         if len(files) == 0:
@@ -0,0 +1,80 @@
+from collections import OrderedDict
+from dataclasses import dataclass
+from math import ceil
+from time import monotonic
+
+
+# Max lifetime of presigned url in S3.
+MAX_EXPIRATION = 7 * 24 * 3600
+
+
+@dataclass
+class _CachedLink:
+    url: str
+    expires_at: float
+
+
+class PresignedURLCache:
+    """In-memory LRU cache of presigned get urls.
+
+    Requested expiration is rounded up to `step` and url is signed
+    `reuse` seconds longer, so it is returned for the same file
+    while it stays valid at least for requested expiration.
+    """
+
+    def __init__(self, maxsize: int = 10000, reuse: int = 900, step: int = 300):
+        """
+        Args:
+            maxsize: max count of cached files.
+            reuse: seconds while signed url can be reused.
+            step: seconds to round requested expiration.
+        """
+        self.maxsize = maxsize
+        self.reuse = reuse
+        self.step = step
+        self._links: OrderedDict[tuple[str, str], dict[int, _CachedLink]] = (
+            OrderedDict()
+        )
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get_expiration_bucket(self, expiration: int) -> int:
+        return ceil(expiration / self.step) * self.step
+
+    def get_signing_expiration(self, expiration: int) -> int:
+        """Returns expiration to sign url for requested `expiration`."""
+        return min(self.get_expiration_bucket(expiration) + self.reuse, MAX_EXPIRATION)
+
+    def get(self, bucket: str, key: str, expiration: int) -> str | None:
+        """Returns cached url valid at least `expiration` seconds,
+        `None` otherwise."""
+        links = self._links.get((bucket, key))
+        link = None
+        if links is not None:
+            link = links.get(self.get_expiration_bucket(expiration))
+        if link is None or link.expires_at - monotonic() < expiration:
+            self.misses += 1
+            return None
+        self._links.move_to_end((bucket, key))
+        self.hits += 1
+        return link.url
+
+    def set(self, bucket: str, key: str, expiration: int, url: str):
+        """Caches `url` signed by `get_signing_expiration(expiration)`."""
+        links = self._links.setdefault((bucket, key), {})
+        links[self.get_expiration_bucket(expiration)] = _CachedLink(
+            url=url,
+            expires_at=monotonic() + self.get_signing_expiration(expiration),
+        )
+        self._links.move_to_end((bucket, key))
+        while len(self._links) > self.maxsize:
+            self._links.popitem(last=False)
+
+    def invalidate(self, bucket: str, key: str):
+        """Removes all cached urls of file."""
+        if self._links.pop((bucket, key), None) is not None:
+            self.invalidations += 1
+
+    def __len__(self) -> int:
+        return len(self._links)
@@ -1,45 +1,53 @@
-from typing import AsyncContextManager, Callable, Iterator
+import asyncio
+from typing import Iterator
 from itertools import islice
 
+from botocore.exceptions import ClientError
 from mypy_boto3_s3 import ServiceResource
 from mypy_boto3_s3.type_defs import DeleteObjectsOutputTypeDef, ErrorTypeDef
 
 
 from app.contracts.clients import FileClient, KeyErrorSchema
+from app.infra.s3.cache import PresignedURLCache
 
 
 class S3FileClient(FileClient):
     def __init__(
-        self, resource_factory: Callable[[], AsyncContextManager[ServiceResource]]
+        self,
+        resource: ServiceResource,
+        link_cache: PresignedURLCache,
+        head_concurrency: int = 32,
     ):
-        self._resource_factory = resource_factory
+        self._client = resource.meta.client
+        self._link_cache = link_cache
+        self._head_semaphore = asyncio.Semaphore(head_concurrency)
 
     async def create_put_link(self, bucket: str, key: str, expiration=3600):
-        async with self._resource_factory() as resource:
-            client = resource.meta.client
-            return await client.generate_presigned_url(
-                "put_object",
-                Params={"Bucket": bucket, "Key": key},
-                ExpiresIn=expiration,
-            )
+        return await self._client.generate_presigned_url(
+            "put_object",
+            Params={"Bucket": bucket, "Key": key},
+            ExpiresIn=expiration,
+        )
 
     async def create_get_link(self, bucket, key, expiration=3600):
-        async with self._resource_factory() as resource:
-            client = resource.meta.client
-            return await client.generate_presigned_url(
-                "get_object",
-                Params={"Bucket": bucket, "Key": key},
-                ExpiresIn=expiration,
-            )
+        url = self._link_cache.get(bucket, key, expiration)
+        if url is not None:
+            return url
+
+        url = await self._client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": bucket, "Key": key},
+            ExpiresIn=self._link_cache.get_signing_expiration(expiration),
+        )
+        self._link_cache.set(bucket, key, expiration, url)
+        return url
 
     async def _delete_chunk(
         self, bucket: str, keys: list[str]
     ) -> DeleteObjectsOutputTypeDef:
-        async with self._resource_factory() as resource:
-            client = resource.meta.client
-            delete_body = {"Objects": [{"Key": key} for key in keys], "Quiet": False}
+        delete_body = {"Objects": [{"Key": key} for key in keys], "Quiet": False}
 
-            return await client.delete_objects(Bucket=bucket, Delete=delete_body)
+        return await self._client.delete_objects(Bucket=bucket, Delete=delete_body)
 
     async def _delete_keys(
         self, bucket: str, keys: list[str], *, chunk_size: int
@@ -63,6 +71,7 @@ class S3FileClient(FileClient):
 
         for key, bucket in keys_buckets:
             bucket_keys_dict.setdefault(bucket, []).append(key)
+            self._link_cache.invalidate(bucket, key)
 
         errors: list[KeyErrorSchema] = []
 
@@ -76,3 +85,24 @@ class S3FileClient(FileClient):
             )
 
         return errors
+
+    async def _get_size(self, key: str, bucket: str) -> int | None:
+        async with self._head_semaphore:
+            try:
+                resp = await self._client.head_object(Bucket=bucket, Key=key)
+            except ClientError as e:
+                if e.response["Error"]["Code"] in ("404", "NoSuchKey", "NotFound"):
+                    return None
+                raise
+        return resp["ContentLength"]
+
+    async def get_sizes(self, keys_buckets):
+        sizes = await asyncio.gather(
+            *(self._get_size(key, bucket) for key, bucket in keys_buckets)
+        )
+
+        return {
+            key_bucket: size
+            for key_bucket, size in zip(keys_buckets, sizes)
+            if size is not None
+        }
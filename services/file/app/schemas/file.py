@@ -27,3 +27,18 @@ class FileUpdateSchema(BaseSchema):
     name: str | None = None
     ext: str | None = None
     confirmed: bool | None = None
+
+
+class LinkCacheMetricsSchema(BaseSchema):
+    size: int
+    hits: int
+    misses: int
+    hit_rate: float
+    invalidations: int
+
+
+class ReapResultSchema(BaseSchema):
+    checked: int = 0
+    confirmed: int = 0
+    deleted: int = 0
+    deleted_bytes: int = 0
@@ -1,8 +1,14 @@
+import asyncio
 from datetime import datetime
 from app.contracts.services import FileService
 from app.contracts.clients import FileClient
 from app.contracts.uow import FileUnitOfWork
-from app.schemas.file import FileCreateSchema, FileSchema, FileUpdateSchema
+from app.schemas.file import (
+    FileCreateSchema,
+    FileSchema,
+    FileUpdateSchema,
+    ReapResultSchema,
+)
 from common.schemas import ErrorSchema
 from common.schemas.file import FileLinkSchema, FileDeleteResultSchema
 
@@ -15,60 +21,71 @@ class FileServiceImpl(FileService):
         self._file_client = file_client
         self._buckets = buckets
 
-    async def _remove_unconfirmed(self, files: list[FileSchema]) -> list[FileSchema]:
-        """Remove unconfirmed files in specidied `files`."""
-        unconfirmed_files = [file for file in files if not file.confirmed]
-        async with self._file_uow as uow:
-            await uow.file.delete(unconfirmed_files)
-        return [file for file in files if file.confirmed]
+    def _find_free_buckets(
+        self, keys: list[str], files: list[FileSchema]
+    ) -> list[str | None]:
+        """Finds for every key first bucket not consists the file with it.
 
-    async def _find_free_bucket(self, key: str) -> str | None:
-        """Finds first bucket not consists the file with `key`.
+        Keys repeated in `keys` get different buckets.
         Returns:
-            Bucket name if it found, `None` otherwise.
+            Bucket names in order of `keys`, `None` for keys without free bucket.
         """
-        async with self._file_uow as uow:
-            files = await uow.file.get_by_key(key)
-        files = await self._remove_unconfirmed(files)
+        taken = set((file.key, file.bucket) for file in files)
+        result = []
 
-        for bucket in self._buckets:
-            if not any([file.bucket == bucket for file in files]):
-                return bucket
+        for key in keys:
+            bucket = next(
+                (bucket for bucket in self._buckets if (key, bucket) not in taken),
+                None,
+            )
+            if bucket is not None:
+                taken.add((key, bucket))
+            result.append(bucket)
 
-        return None
+        return result
 
     async def create_put_links(self, files, expiration=3600):
-        file_create_list = []
-        urls: list[str] = []
+        file_create_list: list[FileCreateSchema] = []
         result = []
 
-        for file in files:
-            bucket = await self._find_free_bucket(file.key)
-            if bucket is None:
-                continue
-
-            raw = file.filename.split(".")
-            name = raw[0]
-            ext = None
-            if len(raw) > 1:
-                name = ".".join(raw[:-1])
-                ext = raw[-1]
-
-            file_create = FileCreateSchema(
-                name=name,
-                ext=ext,
-                key=file.key,
-                bucket=bucket,
-                size=file.size,
-                created=datetime.now(),
-                confirmed=False,
+        async with self._file_uow as uow:
+            # Unconfirmed files may be uploading yet, so their buckets
+            # are taken until they are confirmed or reaped.
+            exist_files = await uow.file.get_by_keys(
+                list(set(file.key for file in files))
             )
-            file_create_list.append(file_create)
+            buckets = self._find_free_buckets([file.key for file in files], exist_files)
 
-            url = await self._file_client.create_put_link(bucket, file.key, expiration)
-            urls.append(url)
+            for file, bucket in zip(files, buckets):
+                if bucket is None:
+                    continue
 
-        async with self._file_uow as uow:
+                raw = file.filename.split(".")
+                name = raw[0]
+                ext = None
+                if len(raw) > 1:
+                    name = ".".join(raw[:-1])
+                    ext = raw[-1]
+
+                file_create = FileCreateSchema(
+                    name=name,
+                    ext=ext,
+                    key=file.key,
+                    bucket=bucket,
+                    size=file.size,
+                    created=datetime.now(),
+                    confirmed=False,
+                )
+                file_create_list.append(file_create)
+
+            urls = await asyncio.gather(
+                *(
+                    self._file_client.create_put_link(
+                        file_create.bucket, file_create.key, expiration
+                    )
+                    for file_create in file_create_list
+                )
+            )
             schemas = await uow.file.create(file_create_list)
 
             for schema, url in zip(schemas, urls):
@@ -89,7 +106,8 @@ class FileServiceImpl(FileService):
     async def create_get_links(self, ids, expiration=3600):
         async with self._file_uow as uow:
             files = await uow.file.get_by_ids(ids)
-        files = await self._remove_unconfirmed(files)
+        # Unconfirmed files are removed by reaper.
+        files = [file for file in files if file.confirmed]
 
         result = []
 
@@ -167,3 +185,52 @@ class FileServiceImpl(FileService):
                 results.append(FileDeleteResultSchema(file_id=id, error=None))
 
         return results
+
+    async def reap_unconfirmed(self, created_before, batch_size=500):
+        result = ReapResultSchema()
+        after_id = 0
+
+        while True:
+            async with self._file_uow as uow:
+                files = await uow.file.get_unconfirmed(
+                    created_before, after_id, batch_size
+                )
+            if len(files) == 0:
+                break
+            after_id = files[-1].id
+            result.checked += len(files)
+
+            sizes = await self._file_client.get_sizes(
+                [(file.key, file.bucket) for file in files]
+            )
+            confirmed_ids = set(
+                file.id
+                for file in files
+                if sizes.get((file.key, file.bucket)) == file.size
+            )
+            to_delete = [file for file in files if file.id not in confirmed_ids]
+
+            # Objects of unexpected size are removed with their rows.
+            errors = await self._file_client.delete(
+                [
+                    (file.key, file.bucket)
+                    for file in to_delete
+                    if (file.key, file.bucket) in sizes
+                ]
+            )
+            not_deleted_keys = set(error.key for error in errors)
+            deleted = [file for file in to_delete if file.key not in not_deleted_keys]
+
+            async with self._file_uow as uow:
+                await uow.file.confirm(list(confirmed_ids))
+                await uow.file.delete(
+                    [file.id for file in deleted], unconfirmed_only=True
+                )
+
+            result.confirmed += len(confirmed_ids)
+            result.deleted += len(deleted)
+            result.deleted_bytes += sum(
+                sizes.get((file.key, file.bucket), 0) for file in deleted
+            )
+
+        return result
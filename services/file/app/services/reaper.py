@@ -0,0 +1,69 @@
+import asyncio
+from datetime import datetime, timedelta
+from inspect import isawaitable
+from logging import Logger
+from typing import AsyncIterator, Callable
+
+from app.contracts.services import FileService
+
+
+async def _reap_periodically(
+    file_service_factory: Callable[[], FileService],
+    logger: Logger,
+    *,
+    interval: int,
+    stale_after: int,
+    batch_size: int,
+):
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            file_service = file_service_factory()
+            if isawaitable(file_service):
+                file_service = await file_service
+            result = await file_service.reap_unconfirmed(
+                datetime.now() - timedelta(seconds=stale_after), batch_size
+            )
+            logger.info(
+                f"Unconfirmed files reaped: checked {result.checked}, "
+                f"confirmed {result.confirmed}, deleted {result.deleted} "
+                f"({result.deleted_bytes} bytes)"
+            )
+        except Exception as e:
+            logger.error(f"Unconfirmed files reaping failed: {e}")
+
+
+async def init_reaper(
+    file_service_factory: Callable[[], FileService],
+    logger: Logger,
+    *,
+    interval: int,
+    stale_after: int,
+    batch_size: int,
+) -> AsyncIterator[asyncio.Task | None]:
+    """Runs reaping of unconfirmed files every `interval` seconds.
+
+    Used as `providers.Resource`, reaping is stopped on resources shutdown.
+    Args:
+        interval: seconds between reapings, `0` disables reaper.
+        stale_after: seconds after which unconfirmed file is reaped.
+        batch_size: count of files processed at once.
+    """
+    if interval <= 0:
+        yield None
+        return
+
+    task = asyncio.create_task(
+        _reap_periodically(
+            file_service_factory,
+            logger,
+            interval=interval,
+            stale_after=stale_after,
+            batch_size=batch_size,
+        )
+    )
+    try:
+        yield task
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
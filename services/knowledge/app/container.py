@@ -4,6 +4,7 @@ from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, AsyncSession
 
 from common.containers.auth import LocalAuthContainer
 from common.containers.postgres import PostgresContainer
+from common.containers.http import HTTPClientContainer
 from common.auth import LocalAuthService
 from common.http.auth import AuthHTTPClient
 from common.http.file import HTTPFileClient
@@ -30,6 +31,7 @@ class Container(containers.DeclarativeContainer):
     postgres_knowledge_container = providers.Container(PostgresContainer, config=config)
     postgres_dish_container = providers.Container(PostgresContainer, config=config)
     auth_container = providers.Container(LocalAuthContainer, config=config)
+    http_container = providers.Container(HTTPClientContainer, config=config)
 
     sessionmaker = providers.Singleton(
         init_sessionmaker,
@@ -43,17 +45,20 @@ class Container(containers.DeclarativeContainer):
         LocalAuthService, auth_container.container.security_client
     )
 
-    auth_client = providers.Factory(
+    # Clients are shared to reuse pooled connections and access token.
+    auth_client = providers.Singleton(
         AuthHTTPClient,
         auth_service,
+        http_container.container.client_session,
         auth_url=config.auth_url,
         client_id=config.client_id,
         client_secret=config.client_secret,
         with_ssl=config.with_auth_ssl,
     )
-    file_client = providers.Factory(
+    file_client = providers.Singleton(
         HTTPFileClient,
         auth_client,
+        http_container.container.client_session,
         file_service_url=config.file_url,
         with_ssl=config.with_file_ssl,
     )
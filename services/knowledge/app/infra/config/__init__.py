@@ -3,6 +3,7 @@ from common.config import (
     LocalAuthSettings,
     RemoteAuthSettings,
     FileSettings,
+    HTTPClientSettings,
     AdminSettings,
     CORSSettings,
 )
@@ -14,6 +15,7 @@ class Settings(
     LocalAuthSettings,
     RemoteAuthSettings,
     FileSettings,
+    HTTPClientSettings,
     DBSettings,
     AdminSettings,
     CORSSettings,
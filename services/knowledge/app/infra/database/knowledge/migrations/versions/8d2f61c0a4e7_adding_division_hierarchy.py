@@ -0,0 +1,61 @@
+"""Adding division hierarchy
+
+Revision ID: 8d2f61c0a4e7
+Revises: f43fc7e19381
+Create Date: 2026-10-18 20:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8d2f61c0a4e7"
+down_revision: Union[str, None] = "f43fc7e19381"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "divisions",
+        sa.Column("depth", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column("divisions", sa.Column("parent_path", sa.String(), nullable=True))
+    op.execute(
+        """
+        UPDATE divisions SET
+            depth = length(path) - length(replace(path, '/', '')),
+            parent_path = CASE
+                WHEN position('/' in path) > 0
+                THEN regexp_replace(path, '/[^/]*$', '')
+            END
+        """
+    )
+    op.alter_column("divisions", "depth", server_default=None)
+    op.create_index(
+        op.f("ix_divisions_parent_path"), "divisions", ["parent_path"], unique=False
+    )
+    op.create_index(
+        op.f("ix_dish_divisions_division_id"),
+        "dish_divisions",
+        ["division_id"],
+        unique=False,
+    )
+    op.create_index(
+        op.f("ix_business_cards_division_id"),
+        "business_cards",
+        ["division_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_business_cards_division_id"), table_name="business_cards")
+    op.drop_index(op.f("ix_dish_divisions_division_id"), table_name="dish_divisions")
+    op.drop_index(op.f("ix_divisions_parent_path"), table_name="divisions")
+    op.drop_column("divisions", "parent_path")
+    op.drop_column("divisions", "depth")
@@ -1,5 +1,5 @@
 from sqlalchemy.orm import mapped_column, Mapped, relationship
-from sqlalchemy import ForeignKey, UniqueConstraint
+from sqlalchemy import ForeignKey, UniqueConstraint, event
 
 from common.sql.orm import Base
 
@@ -9,16 +9,30 @@ class Division(Base):
 
     name: Mapped[str] = mapped_column(nullable=False)
     path: Mapped[str] = mapped_column(nullable=False, unique=True)
+    # Materialized from `path` to find children by index.
+    depth: Mapped[int] = mapped_column(nullable=False, default=0)
+    parent_path: Mapped[str] = mapped_column(nullable=True, index=True)
 
     def __str__(self):
         return self.name
 
 
+@event.listens_for(Division, "before_insert")
+@event.listens_for(Division, "before_update")
+def _set_division_hierarchy(mapper, connection, target: Division):
+    target.depth = target.path.count("/")
+    target.parent_path = (
+        target.path[: target.path.rindex("/")] if "/" in target.path else None
+    )
+
+
 class DishDivision(Base):
     __tablename__ = "dish_divisions"
 
     dish_id: Mapped[int] = mapped_column(nullable=False)
-    division_id: Mapped[int] = mapped_column(ForeignKey("divisions.id"), nullable=False)
+    division_id: Mapped[int] = mapped_column(
+        ForeignKey("divisions.id"), nullable=False, index=True
+    )
     division: Mapped[Division] = relationship(Division, foreign_keys=[division_id])
 
 
@@ -35,7 +49,9 @@ class BusinessCard(Base):
     name: Mapped[str] = mapped_column(nullable=False)
     description: Mapped[str] = mapped_column(nullable=True)
 
-    division_id: Mapped[int] = mapped_column(ForeignKey("divisions.id"), nullable=False)
+    division_id: Mapped[int] = mapped_column(
+        ForeignKey("divisions.id"), nullable=False, index=True
+    )
 
     division: Mapped[Division] = relationship(Division, foreign_keys=[division_id])
 
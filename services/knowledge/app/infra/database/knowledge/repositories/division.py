@@ -1,4 +1,5 @@
-from sqlalchemy import select, ColumnElement, and_, func
+from sqlalchemy import select, ColumnElement, func
+from sqlalchemy.orm import aliased
 
 from common.sql.repository import SQLBaseRepository
 
@@ -27,111 +28,51 @@ class SQLDivisionRepository(DivisionRepository, SQLBaseRepository):
 
         return converters.division_to_division_schema(division)
 
-    async def _get_dish_card_count_by_ids(self, division_ids: list[int]) -> list[int]:
-        """Count dishes and cards count from first level of division for each id."""
-        # Dishes count for every division
-        dishes_count_s = (
-            select(DishDivision.division_id, func.count(DishDivision.dish_id))
-            .where(DishDivision.division_id.in_(division_ids))
-            .group_by(DishDivision.division_id)
+    def _select_with_count(self, element: ColumnElement):
+        """Selects divisions with count of their children, dishes and cards."""
+        child = aliased(Division)
+        childs_count = (
+            select(func.count(child.id))
+            .where(child.parent_path == Division.path)
+            .scalar_subquery()
         )
-        rows = (await self._session.execute(dishes_count_s)).all()
-        dishes_count_dict = {row[0]: row[1] for row in rows}
-
-        # Cards count for every division
-        cards_count_s = (
-            select(BusinessCard.division_id, func.count(BusinessCard.id))
-            .where(BusinessCard.division_id.in_(division_ids))
-            .group_by(BusinessCard.division_id)
+        dishes_count = (
+            select(func.count(DishDivision.id))
+            .where(DishDivision.division_id == Division.id)
+            .scalar_subquery()
         )
-        rows = (await self._session.execute(cards_count_s)).all()
-        cards_count_dict = {row[0]: row[1] for row in rows}
-
-        return [
-            dishes_count_dict.get(id, 0) + cards_count_dict.get(id, 0)
-            for id in division_ids
-        ]
-
-    async def get_subdivisions_by_path(self, path):
-        count = path.count("/")
-
-        (level_filter,) = (
-            func.length(Division.path)
-            - func.length(func.replace(Division.path, "/", ""))
-            == count + 1,
+        cards_count = (
+            select(func.count(BusinessCard.id))
+            .where(BusinessCard.division_id == Division.id)
+            .scalar_subquery()
         )
-        (sub_level_filter,) = (
-            func.length(Division.path)
-            - func.length(func.replace(Division.path, "/", ""))
-            == count + 2,
-        )
-
-        replace_func = func.regexp_replace(Division.path, "/[^/]+$", "")
-        sub_s = (
-            select(
-                replace_func.label("path"),
-                func.count(replace_func).label("childs_count"),
-            )
-            .where(
-                and_(
-                    Division.path.startswith(path + "/"),
-                    sub_level_filter,
-                )
-            )
-            .group_by(replace_func)
-        ).subquery()
 
-        s = (
-            select(Division, func.coalesce(sub_s.c.childs_count, 0))
-            .where(
-                and_(
-                    Division.path.startswith(path + "/"),
-                    level_filter,
-                )
-            )
-            .outerjoin(sub_s, sub_s.c.path == Division.path)
+        return (
+            select(Division, childs_count + dishes_count + cards_count)
+            .where(element)
+            .order_by(Division.id)
         )
 
+    async def get_subdivisions_by_path(self, path):
+        s = self._select_with_count(Division.parent_path == path)
         rows = (await self._session.execute(s)).all()
-        ids = [row[0].id for row in rows]
-        counts = await self._get_dish_card_count_by_ids(ids)
 
         return [
             converters.division_to_subdivision_schema(
-                row[0], subdivisions_count=row[1] + counts[i], files_count=0
+                division, subdivisions_count=count, files_count=0
             )
-            for i, row in enumerate(rows)
+            for division, count in rows
         ]
 
     async def find_by_name(self, term):
-        s = select(Division).where(Division.name.ilike(f"%{term}%"))
-        divisions = (await self._session.execute(s)).scalars().all()
-        d_ids = [d.id for d in divisions]
-
-        # Dishes count for every division
-        counts = await self._get_dish_card_count_by_ids(d_ids)
-
-        for i, division in enumerate(divisions):
-            count = division.path.count("/")
-            (level_filter,) = (
-                func.length(Division.path)
-                - func.length(func.replace(Division.path, "/", ""))
-                == count + 1,
-            )
-            childs_count_s = select(func.count(Division.id)).where(
-                and_(
-                    Division.path.startswith(division.path + "/"),
-                    level_filter,
-                )
-            )
-            subdivisions_count = (await self._session.execute(childs_count_s)).scalar()
-            division.count = subdivisions_count + counts[i]
+        s = self._select_with_count(Division.name.ilike(f"%{term}%"))
+        rows = (await self._session.execute(s)).all()
 
         return [
             converters.division_to_subdivision_schema(
-                d, subdivisions_count=d.count, files_count=0
+                division, subdivisions_count=count, files_count=0
             )
-            for d in divisions
+            for division, count in rows
         ]
 
     async def get_division_paths_by_card(self, card_ids):